@@ -0,0 +1,490 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+
+#   http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""Parser benchmarks over a corpus of XML reports
+
+Every benchmark runs one XMLParser function, or XML parsing itself, against
+every corpus entry and reports throughput (reports/s, MB/s of the source
+report) and tracemalloc peak memory. XML is parsed once per entry, parser
+functions run on a fresh XMLParser and XMLReport every call so nothing is
+memoized between calls.
+
+The default corpus is synthetic, a small and a very large filer, see
+ib_fundamental.xml_factory. Recorded reports can be used instead, a directory of
+<symbol>/<report type>.xml[.gz] files, see ib_fundamental.sources.record.
+
+    python -m benchmarks.parser_bench
+    python -m benchmarks.parser_bench --corpus reports/ --filter fin_statement
+    # regression gate, exit status 1 when slower or bigger than the baseline
+    python -m benchmarks.parser_bench --baseline benchmarks/baseline.json
+    # new baseline
+    python -m benchmarks.parser_bench --save benchmarks/baseline.json
+
+Baseline timings are scaled by the median speed ratio of the run, so the gate
+flags benchmarks that slow down relative to the others on any machine. Use
+--absolute on the baseline machine to catch across the board slowdowns too.
+Slowdowns under --min-delta seconds are timer noise on sub 0.1 ms benchmarks
+and are not regressions.
+Flagged benchmarks are measured again and only regress if they are still
+slow.
+"""
+
+__all__ = [
+    "Benchmark",
+    "Case",
+    "Result",
+    "benchmarks",
+    "compare",
+    "load_corpus",
+    "measure",
+    "run_suite",
+    "speed_ratio",
+    "synthetic_corpus",
+]
+
+import argparse
+import json
+import statistics
+import sys
+import timeit
+import tracemalloc
+from dataclasses import asdict, dataclass, field
+from functools import partial
+from pathlib import Path
+from typing import Any, Callable, Iterable, Optional
+from xml.etree.ElementTree import Element
+
+from defusedxml.ElementTree import fromstring
+
+from ib_fundamental import xml_factory
+from ib_fundamental.fundamental import statement_frame
+from ib_fundamental.objects import ReportType
+from ib_fundamental.sources import DirectorySource
+from ib_fundamental.universe import default_reports
+from ib_fundamental.utils import build_statement
+from ib_fundamental.xml_parser import XMLParser
+from ib_fundamental.xml_report import XMLReport
+
+report_types = default_reports
+statement_codes = ("INC", "BAL", "CAS")
+period_types = ("annual", "quarter")
+
+# synthetic filer sizes, xml_factory arguments
+corpus_sizes: dict[str, dict[str, int]] = {
+    "small": {"n_annual": 4, "n_interim": 4, "n_summary": 8, "n_fy": 2, "n_own": 10},
+    "large": {
+        "n_annual": 20,
+        "n_interim": 80,
+        "n_summary": 80,
+        "n_fy": 8,
+        "n_own": 2000,
+    },
+}
+
+
+@dataclass(slots=True)
+class Case:
+    """Corpus entry, raw and parsed reports of one filer"""
+
+    label: str
+    xml: dict[ReportType, str]
+    trees: dict[ReportType, Element] = field(default_factory=dict, repr=False)
+
+    def __post_init__(self):
+        self.trees = {_type: fromstring(_xml) for _type, _xml in self.xml.items()}
+
+    def parser(self) -> XMLParser:
+        """new parser on already parsed reports"""
+        return XMLParser(xml_report=XMLReport.from_xml(self.trees))
+
+    def size(self, report_type: ReportType) -> int:
+        """raw report size in bytes"""
+        return len(self.xml[report_type].encode())
+
+
+@dataclass(slots=True, frozen=True)
+class Benchmark:
+    """Benchmarked function, run(setup(case)) is timed"""
+
+    name: str
+    report_type: ReportType
+    run: Callable[[Any], Any]
+    setup: Callable[[Case], Any] = lambda case: case
+
+
+@dataclass(slots=True)
+class Result:
+    """Benchmark result for one corpus entry"""
+
+    name: str
+    case: str
+    seconds: float
+    reports_per_s: float
+    mb_per_s: float
+    peak_kib: float
+
+    @property
+    def key(self) -> str:
+        """baseline key"""
+        return f"{self.name}[{self.case}]"
+
+
+def _fin_statements(case: Case) -> list:
+    _parser = case.parser()
+    return [
+        _parser.get_fin_statement(_s, _p)
+        for _s in statement_codes
+        for _p in period_types
+    ]
+
+
+def _statement_frames(case: Case) -> list:
+    _parser = case.parser()
+    return [
+        statement_frame(_parser, _s, _p)
+        for _s in statement_codes
+        for _p in period_types
+    ]
+
+
+def _items(case: Case) -> list:
+    _parser = case.parser()
+    return [_parser.get_items(("RTLR", "NINC", "ATOT"), _p) for _p in period_types]
+
+
+def _build_statement_setup(case: Case) -> list:
+    _parser = case.parser()
+    return [
+        (_parser.get_fin_statement(_s, _p), _s, _parser.get_map_items(_s))
+        for _s in statement_codes
+        for _p in period_types
+    ]
+
+
+def _fin_summary(method: str) -> Callable[[Case], list]:
+    def _run(case: Case) -> list:
+        _parser = case.parser()
+        return getattr(_parser, method)("TTM", "12M") + getattr(_parser, method)(
+            "R", "3M"
+        )
+
+    return _run
+
+
+def _summary_frames(case: Case) -> list:
+    _parser = case.parser()
+    return [
+        _parser.get_summary_frame(_section, *_args)
+        for _section in ("TotalRevenues", "DividendPerShares", "EPSs")
+        for _args in (("TTM",), ("R", "3M"))
+    ]
+
+
+def _fromstring(report_type: ReportType) -> Callable[[Case], Element]:
+    def _run(case: Case) -> Element:
+        return fromstring(case.xml[report_type])
+
+    return _run
+
+
+benchmarks: list[Benchmark] = [
+    *(Benchmark(f"fromstring[{_t}]", _t, _fromstring(_t)) for _t in report_types),
+    Benchmark("get_fin_statement", "ReportsFinStatements", _fin_statements),
+    Benchmark(
+        "get_map_items",
+        "ReportsFinStatements",
+        lambda case: case.parser().get_map_items(),
+    ),
+    Benchmark(
+        "build_statement",
+        "ReportsFinStatements",
+        lambda data: [build_statement(*_args) for _args in data],
+        _build_statement_setup,
+    ),
+    Benchmark("statement_frame", "ReportsFinStatements", _statement_frames),
+    Benchmark("get_items", "ReportsFinStatements", _items),
+    Benchmark(
+        "get_company_info",
+        "ReportsFinStatements",
+        lambda case: case.parser().get_company_info(),
+    ),
+    Benchmark(
+        "get_dividend", "ReportsFinSummary", lambda case: case.parser().get_dividend()
+    ),
+    Benchmark(
+        "get_div_per_share", "ReportsFinSummary", _fin_summary("get_div_per_share")
+    ),
+    Benchmark("get_revenue", "ReportsFinSummary", _fin_summary("get_revenue")),
+    Benchmark("get_eps", "ReportsFinSummary", _fin_summary("get_eps")),
+    Benchmark("summary_frame", "ReportsFinSummary", _summary_frames),
+    Benchmark("get_ratios", "ReportSnapshot", lambda case: case.parser().get_ratios()),
+    Benchmark(
+        "get_analyst_forecast",
+        "ReportSnapshot",
+        lambda case: case.parser().get_analyst_forecast(),
+    ),
+    Benchmark(
+        "get_fy_estimates", "RESC", lambda case: case.parser().get_fy_estimates()
+    ),
+    Benchmark("get_fy_actuals", "RESC", lambda case: case.parser().get_fy_actuals()),
+    Benchmark(
+        "get_ownership_report",
+        "ReportsOwnership",
+        lambda case: case.parser().get_ownership_report(),
+    ),
+]
+
+
+def synthetic_corpus(sizes: Iterable[str] = tuple(corpus_sizes)) -> list[Case]:
+    """synthetic filers, see corpus_sizes"""
+    return [
+        Case(_size, xml_factory.reports(_size.upper(), **corpus_sizes[_size]))
+        for _size in sizes
+    ]
+
+
+def load_corpus(path: str | Path) -> list[Case]:
+    """recorded reports, one case per symbol, missing reports are skipped"""
+    source = DirectorySource(path)
+    cases = []
+    for _symbol in source.symbols():
+        _xml = {_t: _x for _t in report_types if (_x := source.get(_symbol, _t))}
+        if _xml:
+            cases.append(Case(_symbol, _xml))
+    return cases
+
+
+def _peak_kib(benchmark: Benchmark, arg: Any) -> float:
+    """tracemalloc peak of one call"""
+    tracemalloc.start()
+    try:
+        benchmark.run(arg)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak / 1024
+
+
+def measure(
+    jobs: Iterable[tuple[Benchmark, Case]], repeat: int = 9, min_time: float = 0.05
+) -> list[Result]:
+    """time and trace benchmarks on corpus entries
+
+    Timing rounds are interleaved, every round runs all jobs, so a slow phase
+    of the machine doesn't hit all rounds of one job. The best round is kept.
+
+    Args:
+        jobs (Iterable[tuple[Benchmark, Case]]): benchmark and corpus entry
+        repeat (int, optional): timing rounds. Defaults to 9.
+        min_time (float, optional): minimum seconds per round. Defaults to 0.05.
+
+    Returns:
+        list[Result]: seconds per call, throughput and peak memory, by job
+    """
+    _jobs = list(jobs)
+    _args = [_bench.setup(_case) for _bench, _case in _jobs]
+    _timers = [
+        timeit.Timer(partial(_bench.run, _arg))
+        for (_bench, _), _arg in zip(_jobs, _args)
+    ]
+    _loops = [max(1, int(min_time / max(_t.timeit(1), 1e-9))) for _t in _timers]
+    _best = [float("inf")] * len(_jobs)
+    for _ in range(repeat):
+        for i, (_timer, _n) in enumerate(zip(_timers, _loops)):
+            _best[i] = min(_best[i], _timer.timeit(_n) / _n)
+    return [
+        Result(
+            name=_bench.name,
+            case=_case.label,
+            seconds=_seconds,
+            reports_per_s=1 / _seconds,
+            mb_per_s=_case.size(_bench.report_type) / _seconds / 1e6,
+            peak_kib=_peak_kib(_bench, _arg),
+        )
+        for (_bench, _case), _arg, _seconds in zip(_jobs, _args, _best)
+    ]
+
+
+def run_suite(
+    cases: Iterable[Case],
+    pattern: Optional[str] = None,
+    repeat: int = 9,
+    min_time: float = 0.05,
+) -> list[Result]:
+    """run benchmarks on all corpus entries with their report type
+
+    Args:
+        cases (Iterable[Case]): corpus
+        pattern (str, optional): run benchmarks with pattern in their name.
+            Defaults to all.
+        repeat (int, optional): timing rounds. Defaults to 9.
+        min_time (float, optional): minimum seconds per round. Defaults to 0.05.
+
+    Returns:
+        list[Result]: results
+    """
+    return measure(_suite_jobs(cases, pattern), repeat, min_time)
+
+
+def _suite_jobs(
+    cases: Iterable[Case], pattern: Optional[str] = None
+) -> list[tuple[Benchmark, Case]]:
+    _cases = list(cases)
+    return [
+        (_bench, _case)
+        for _bench in benchmarks
+        if pattern is None or pattern in _bench.name
+        for _case in _cases
+        if _bench.report_type in _case.xml
+    ]
+
+
+def speed_ratio(
+    results: Iterable[Result], baseline: dict[str, dict[str, float]]
+) -> float:
+    """median of seconds over baseline seconds
+
+    Scaling the baseline by it makes the gate independent of machine speed,
+    a benchmark regresses when it slows down relative to the others.
+    """
+    _ratios = [
+        _r.seconds / baseline[_r.key]["seconds"] for _r in results if _r.key in baseline
+    ]
+    return statistics.median(_ratios) if _ratios else 1.0
+
+
+def compare(
+    results: Iterable[Result],
+    baseline: dict[str, dict[str, float]],
+    tolerance: float = 0.5,
+    memory_tolerance: float = 0.25,
+    scale: float = 1.0,
+    min_delta: float = 2e-5,
+) -> list[str]:
+    """regressions against a baseline, results missing from it are ignored
+
+    Args:
+        results (Iterable[Result]): results
+        baseline (dict[str, dict[str, float]]): seconds and peak_kib by
+            result key
+        tolerance (float, optional): allowed slowdown. Defaults to 0.5.
+        memory_tolerance (float, optional): allowed peak memory growth, plus
+            64 KiB. Defaults to 0.25.
+        scale (float, optional): baseline seconds multiplier, the speed ratio
+            of this machine to the baseline machine, see speed_ratio.
+            Defaults to 1.
+        min_delta (float, optional): smallest slowdown in seconds that is
+            a regression, whatever the tolerance. Defaults to 2e-5.
+
+    Returns:
+        list[str]: regressions, empty if none
+    """
+    # pylint: disable=too-many-arguments
+    regressions = []
+    for _result in results:
+        if (_base := baseline.get(_result.key)) is None:
+            continue
+        _seconds = _base["seconds"] * scale
+        if _result.seconds > max(_seconds * (1 + tolerance), _seconds + min_delta):
+            regressions.append(
+                f"{_result.key}: {_result.seconds * 1e3:.3f} ms, "
+                f"baseline {_seconds * 1e3:.3f} ms"
+            )
+        if _result.peak_kib > _base["peak_kib"] * (1 + memory_tolerance) + 64:
+            regressions.append(
+                f"{_result.key}: peak {_result.peak_kib:.0f} KiB, "
+                f"baseline {_base['peak_kib']:.0f} KiB"
+            )
+    return regressions
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """command line entry point, exit status 1 on regression"""
+    _parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    _parser.add_argument("--corpus", help="recorded reports directory")
+    _parser.add_argument(
+        "--sizes", nargs="+", default=list(corpus_sizes), choices=list(corpus_sizes)
+    )
+    _parser.add_argument("--filter", dest="pattern", help="benchmark name pattern")
+    _parser.add_argument("--repeat", type=int, default=9)
+    _parser.add_argument("--min-time", type=float, default=0.05)
+    _parser.add_argument("--baseline", type=Path, help="baseline to compare to")
+    _parser.add_argument("--tolerance", type=float, default=0.5)
+    _parser.add_argument(
+        "--min-delta",
+        type=float,
+        default=2e-5,
+        help="smallest slowdown in seconds that is a regression",
+    )
+    _parser.add_argument(
+        "--absolute",
+        action="store_true",
+        help="compare seconds as is, only on the baseline machine",
+    )
+    _parser.add_argument("--memory-tolerance", type=float, default=0.25)
+    _parser.add_argument("--save", type=Path, help="save results as baseline")
+    args = _parser.parse_args(argv)
+
+    cases = load_corpus(args.corpus) if args.corpus else synthetic_corpus(args.sizes)
+    results = run_suite(cases, args.pattern, args.repeat, args.min_time)
+    print(f"{'benchmark':<48}{'ms':>10}{'reports/s':>12}{'MB/s':>9}{'peak KiB':>10}")
+    for _r in results:
+        print(
+            f"{_r.key:<48}{_r.seconds * 1e3:>10.3f}{_r.reports_per_s:>12.1f}"
+            f"{_r.mb_per_s:>9.2f}{_r.peak_kib:>10.0f}"
+        )
+    if args.save:
+        _results = {_r.key: asdict(_r) for _r in results}
+        _baseline = {
+            "python": sys.version,
+            "results": _results,
+        }
+        args.save.write_text(json.dumps(_baseline, indent=1) + "\n", encoding="utf-8")
+    if args.baseline:
+        _baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+        _scale = 1.0 if args.absolute else speed_ratio(results, _baseline["results"])
+        print(f"Speed ratio to baseline {_scale:.2f}")
+        _compare = partial(
+            compare,
+            baseline=_baseline["results"],
+            tolerance=args.tolerance,
+            memory_tolerance=args.memory_tolerance,
+            scale=_scale,
+            min_delta=args.min_delta,
+        )
+        if _flagged := {_r.key for _r in results if _compare([_r])}:
+            # a regression has to show up again, one slow phase of a shared
+            # machine can outlast all rounds of a benchmark
+            print("Measuring again:", *sorted(_flagged), sep="\n  ")
+            results = measure(
+                (
+                    _job
+                    for _job in _suite_jobs(cases, args.pattern)
+                    if f"{_job[0].name}[{_job[1].label}]" in _flagged
+                ),
+                args.repeat,
+                args.min_time,
+            )
+        if regressions := _compare(results):
+            print("Regressions:", *regressions, sep="\n  ")
+            return 1
+        print("No regressions.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -17,7 +17,15 @@
 # under the License.
 
 """IB Fundamental data"""
-__all__ = ["CompanyFinancials", "FundamentalData", "objects", "utils"]
+__all__ = [
+    "AsyncCompanyFinancials",
+    "AsyncFundamentalData",
+    "CompanyFinancials",
+    "FundamentalData",
+    "Universe",
+    "objects",
+    "utils",
+]
 __author__ = "Gonzalo Sáenz"
 __copyright__ = "Copyright 2024 Gonzalo Sáenz"
 __credits__ = ["Gonzalo Sáenz"]
@@ -27,4 +35,10 @@ __maintainer__ = "Gonzalo Sáenz"
 
 
 from . import objects, utils
-from .fundamental import CompanyFinancials, FundamentalData
+from .fundamental import (
+    AsyncCompanyFinancials,
+    AsyncFundamentalData,
+    CompanyFinancials,
+    FundamentalData,
+)
+from .universe import Universe
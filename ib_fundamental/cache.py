@@ -0,0 +1,438 @@
+#!/usr/bin/env python3
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+
+#   http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""Persistent cache for raw XML reports and qualified contracts"""
+
+__all__ = [
+    "ContractCache",
+    "ContractKey",
+    "DirectoryReportCache",
+    "ReportCache",
+    "ReportKey",
+    "SQLiteReportCache",
+    "default_ttl",
+]
+
+import abc
+import gzip
+import hashlib
+import os
+import sqlite3
+import tempfile
+import time
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+from ib_async import Contract, Stock
+
+from .objects import ReportType
+
+DAY: float = 24 * 60 * 60
+
+# time to live in seconds by report type
+default_ttl: dict[ReportType, float] = {
+    "ReportsFinStatements": 7 * DAY,
+    "ReportsFinSummary": DAY,
+    "ReportSnapshot": DAY,
+    "RESC": DAY,
+    "ReportsOwnership": 30 * DAY,
+    "CalendarReport": DAY,
+}
+
+
+@dataclass(slots=True, frozen=True)
+class ReportKey:
+    """Report cache key"""
+
+    contract_id: str  # conId or symbol
+    exchange: str
+    currency: str
+    report_type: ReportType
+
+    def __str__(self) -> str:
+        return f"{self.contract_id}:{self.exchange}:{self.currency}:{self.report_type}"
+
+    @classmethod
+    def from_contract(cls, contract: Contract, report_type: ReportType) -> "ReportKey":
+        """cache key for contract, conId is used if contract is qualified"""
+        return cls(
+            contract_id=str(contract.conId or contract.symbol),
+            exchange=contract.exchange,
+            currency=contract.currency,
+            report_type=report_type,
+        )
+
+
+class ReportCache(abc.ABC):
+    """Raw XML report cache base class
+
+    Subclasses implement get, set, delete and clear. Entries expire after
+    the report type time to live and least recently used entries are evicted
+    once the stored size is over max_bytes. The stored size is a running
+    total, the cache is only scanned on eviction.
+    """
+
+    def __init__(
+        self,
+        ttl: Optional[dict[ReportType, float]] = None,
+        max_bytes: int = 512 * 2**20,
+    ):
+        """
+        Args:
+            ttl (dict[ReportType, float], optional): time to live in seconds
+                by report type, updates default_ttl.
+            max_bytes (int, optional): maximum size of compressed reports.
+                Defaults to 512MB.
+        """
+        self.ttl: dict[ReportType, float] = {**default_ttl, **(ttl or {})}
+        self.max_bytes = max_bytes
+        self.size = 0
+
+    def __repr__(self):
+        cls_name = self.__class__.__qualname__
+        return f"{cls_name}(max_bytes={self.max_bytes!r})"
+
+    def is_expired(self, key: ReportKey, created: float) -> bool:
+        """entry created at created timestamp is expired"""
+        return time.time() - created > self.ttl.get(key.report_type, DAY)
+
+    @abc.abstractmethod
+    def get(self, key: ReportKey) -> Optional[str]:
+        """get report, None if missing or expired"""
+
+    @abc.abstractmethod
+    def set(self, key: ReportKey, xml: str) -> None:
+        """store report"""
+
+    @abc.abstractmethod
+    def delete(self, key: ReportKey) -> None:
+        """delete report"""
+
+    @abc.abstractmethod
+    def clear(self) -> None:
+        """delete all reports"""
+
+
+class SQLiteReportCache(ReportCache):
+    """Report cache in a SQLite database, reports are zlib compressed"""
+
+    def __init__(
+        self,
+        path: str | os.PathLike,
+        ttl: Optional[dict[ReportType, float]] = None,
+        max_bytes: int = 512 * 2**20,
+    ):
+        """
+        Args:
+            path (str | os.PathLike): database file
+            ttl (dict[ReportType, float], optional): time to live in seconds
+                by report type, updates default_ttl.
+            max_bytes (int, optional): maximum size of compressed reports.
+                Defaults to 512MB.
+        """
+        super().__init__(ttl=ttl, max_bytes=max_bytes)
+        self.path = Path(path)
+        self._conn = sqlite3.connect(self.path)
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS reports ("
+                "key TEXT PRIMARY KEY, report_type TEXT, created REAL, "
+                "accessed REAL, size INTEGER, data BLOB)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS reports_accessed ON reports(accessed)"
+            )
+        (self.size,) = self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM reports"
+        ).fetchone()
+
+    def __repr__(self):
+        cls_name = self.__class__.__qualname__
+        return f"{cls_name}(path={str(self.path)!r},max_bytes={self.max_bytes!r})"
+
+    def get(self, key: ReportKey) -> Optional[str]:
+        row = self._conn.execute(
+            "SELECT created, data FROM reports WHERE key = ?", (str(key),)
+        ).fetchone()
+        if row is None:
+            return None
+        created, data = row
+        if self.is_expired(key, created):
+            self.delete(key)
+            return None
+        with self._conn:
+            self._conn.execute(
+                "UPDATE reports SET accessed = ? WHERE key = ?",
+                (time.time(), str(key)),
+            )
+        return zlib.decompress(data).decode()
+
+    def set(self, key: ReportKey, xml: str) -> None:
+        data = zlib.compress(xml.encode())
+        now = time.time()
+        with self._conn:
+            _old = self._stored_size(key)
+            self._conn.execute(
+                "INSERT OR REPLACE INTO reports VALUES (?, ?, ?, ?, ?, ?)",
+                (str(key), key.report_type, now, now, len(data), data),
+            )
+        self.size += len(data) - _old
+        if self.size > self.max_bytes:
+            self._evict()
+
+    def delete(self, key: ReportKey) -> None:
+        with self._conn:
+            _old = self._stored_size(key)
+            self._conn.execute("DELETE FROM reports WHERE key = ?", (str(key),))
+        self.size -= _old
+
+    def clear(self) -> None:
+        with self._conn:
+            self._conn.execute("DELETE FROM reports")
+        self.size = 0
+
+    def close(self) -> None:
+        """close database connection"""
+        self._conn.close()
+
+    def _stored_size(self, key: ReportKey) -> int:
+        """stored size of a report, 0 if missing"""
+        row = self._conn.execute(
+            "SELECT size FROM reports WHERE key = ?", (str(key),)
+        ).fetchone()
+        return row[0] if row is not None else 0
+
+    def _evict(self) -> None:
+        """delete least recently used reports until under max_bytes"""
+        (self.size,) = self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM reports"
+        ).fetchone()
+        if self.size <= self.max_bytes:
+            return
+        _evicted = []
+        for _key, _size in self._conn.execute(
+            "SELECT key, size FROM reports ORDER BY accessed"
+        ):
+            _evicted.append((_key,))
+            self.size -= _size
+            if self.size <= self.max_bytes:
+                break
+        with self._conn:
+            self._conn.executemany("DELETE FROM reports WHERE key = ?", _evicted)
+
+
+class DirectoryReportCache(ReportCache):
+    """Report cache in a directory, one gzip file per report
+
+    File modification time is the creation time and access time is updated
+    on every hit, it's used for LRU eviction. The directory is scanned on
+    init and when the running total is over max_bytes, so files written by
+    other processes are counted on the next eviction.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike,
+        ttl: Optional[dict[ReportType, float]] = None,
+        max_bytes: int = 512 * 2**20,
+    ):
+        """
+        Args:
+            path (str | os.PathLike): cache directory, created if missing
+            ttl (dict[ReportType, float], optional): time to live in seconds
+                by report type, updates default_ttl.
+            max_bytes (int, optional): maximum size of compressed reports.
+                Defaults to 512MB.
+        """
+        super().__init__(ttl=ttl, max_bytes=max_bytes)
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.size = sum(_stat.st_size for _stat, _ in self._scan())
+
+    def __repr__(self):
+        cls_name = self.__class__.__qualname__
+        return f"{cls_name}(path={str(self.path)!r},max_bytes={self.max_bytes!r})"
+
+    def file(self, key: ReportKey) -> Path:
+        """report file path"""
+        _name = hashlib.sha1(str(key).encode(), usedforsecurity=False).hexdigest()
+        return self.path / f"{_name}.xml.gz"
+
+    def get(self, key: ReportKey) -> Optional[str]:
+        _file = self.file(key)
+        try:
+            created = _file.stat().st_mtime
+            if self.is_expired(key, created):
+                self.delete(key)
+                return None
+            xml = gzip.decompress(_file.read_bytes()).decode()
+            os.utime(_file, (time.time(), created))
+        except FileNotFoundError:
+            return None
+        return xml
+
+    def set(self, key: ReportKey, xml: str) -> None:
+        data = gzip.compress(xml.encode())
+        _file = self.file(key)
+        _old = self._file_size(_file)
+        with tempfile.NamedTemporaryFile(dir=self.path, delete=False) as _tmp:
+            _tmp.write(data)
+        os.replace(_tmp.name, _file)
+        self.size += len(data) - _old
+        if self.size > self.max_bytes:
+            self._evict()
+
+    def delete(self, key: ReportKey) -> None:
+        _file = self.file(key)
+        _old = self._file_size(_file)
+        _file.unlink(missing_ok=True)
+        self.size -= _old
+
+    def clear(self) -> None:
+        for _file in self.path.glob("*.xml.gz"):
+            _file.unlink(missing_ok=True)
+        self.size = 0
+
+    @staticmethod
+    def _file_size(file: Path) -> int:
+        """report file size, 0 if missing"""
+        try:
+            return file.stat().st_size
+        except FileNotFoundError:
+            return 0
+
+    def _scan(self) -> list[tuple[os.stat_result, Path]]:
+        """stat of every report file"""
+        _stats = []
+        for _file in self.path.glob("*.xml.gz"):
+            try:
+                _stats.append((_file.stat(), _file))
+            except FileNotFoundError:
+                continue
+        return _stats
+
+    def _evict(self) -> None:
+        """delete least recently used reports until under max_bytes"""
+        _stats = self._scan()
+        self.size = sum(_s.st_size for _s, _ in _stats)
+        if self.size <= self.max_bytes:
+            return
+        for _stat, _file in sorted(_stats, key=lambda _x: _x[0].st_atime):
+            _file.unlink(missing_ok=True)
+            self.size -= _stat.st_size
+            if self.size <= self.max_bytes:
+                break
+
+
+@dataclass(slots=True, frozen=True)
+class ContractKey:
+    """Contract cache key"""
+
+    symbol: str
+    exchange: str
+    currency: str
+
+    def __str__(self) -> str:
+        return f"{self.symbol}:{self.exchange}:{self.currency}"
+
+
+class ContractCache:
+    """Qualified stock contracts in a SQLite database
+
+    Only conId and primaryExchange are stored, a cache hit saves the
+    qualifyContracts round trip.
+    """
+
+    def __init__(self, path: str | os.PathLike = ":memory:", ttl: float = 30 * DAY):
+        """
+        Args:
+            path (str | os.PathLike, optional): database file.
+                Defaults to ":memory:", not persistent.
+            ttl (float, optional): time to live in seconds. Defaults to 30 days.
+        """
+        self.path = str(path)
+        self.ttl = ttl
+        self._conn = sqlite3.connect(self.path)
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS contracts ("
+                "key TEXT PRIMARY KEY, created REAL, con_id INTEGER, "
+                "primary_exchange TEXT)"
+            )
+
+    def __repr__(self):
+        cls_name = self.__class__.__qualname__
+        return f"{cls_name}(path={self.path!r},ttl={self.ttl!r})"
+
+    def get(self, key: ContractKey) -> Optional[Stock]:
+        """qualified contract, None if missing or expired"""
+        row = self._conn.execute(
+            "SELECT created, con_id, primary_exchange FROM contracts WHERE key = ?",
+            (str(key),),
+        ).fetchone()
+        if row is None:
+            return None
+        created, con_id, primary_exchange = row
+        if time.time() - created > self.ttl:
+            self.delete(key)
+            return None
+        return Stock(
+            conId=con_id,
+            symbol=key.symbol,
+            exchange=key.exchange,
+            currency=key.currency,
+            primaryExchange=primary_exchange,
+        )
+
+    def set(self, contract: Contract) -> None:
+        """store qualified contract"""
+        self.set_many([contract])
+
+    def set_many(self, contracts: list[Contract]) -> None:
+        """store qualified contracts in one transaction"""
+        now = time.time()
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO contracts VALUES (?, ?, ?, ?)",
+                [
+                    (
+                        str(ContractKey(_c.symbol, _c.exchange, _c.currency)),
+                        now,
+                        _c.conId,
+                        _c.primaryExchange,
+                    )
+                    for _c in contracts
+                    if _c.conId
+                ],
+            )
+
+    def delete(self, key: ContractKey) -> None:
+        """delete contract"""
+        with self._conn:
+            self._conn.execute("DELETE FROM contracts WHERE key = ?", (str(key),))
+
+    def clear(self) -> None:
+        """delete all contracts"""
+        with self._conn:
+            self._conn.execute("DELETE FROM contracts")
+
+    def close(self) -> None:
+        """close database connection"""
+        self._conn.close()
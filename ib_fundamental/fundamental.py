@@ -22,15 +22,21 @@
 # pylint: disable=missing-function-docstring
 
 __all__ = [
+    "AsyncCompanyFinancials",
+    "AsyncFundamentalData",
     "FundamentalData",
+    "field_reports",
+    "resolve_reports",
 ]
 
 from datetime import datetime
-from typing import Optional
+from functools import partial
+from typing import Any, Callable, Iterable, Optional
 
 from ib_async import IB, Dividends, FundamentalRatios, Stock, Ticker
 from pandas import DataFrame
 
+from ib_fundamental.cache import ContractCache, ReportCache
 from ib_fundamental.objects import (
     AnalystForecast,
     BalanceSheetSet,
@@ -42,16 +48,83 @@ from ib_fundamental.objects import (
     ForwardYear,
     IncomeSet,
     OwnershipReport,
+    PeriodType,
     RatioSnapshot,
+    ReportType,
     Revenue,
+    StatementCode,
 )
-from ib_fundamental.utils import build_statement, to_dataframe
+from ib_fundamental.utils import build_statement_frame, detach, to_dataframe
 
-from .ib_client import IBClient
+from .ib_client import AsyncIBClient, IBClient
+from .scheduler import RequestScheduler
 from .xml_parser import XMLParser
+from .xml_report import AsyncXMLReport, ReportHistory, XMLReport
 
 fromisoformat = datetime.fromisoformat
 
+_statements: tuple[ReportType, ...] = ("ReportsFinStatements",)
+_summary: tuple[ReportType, ...] = ("ReportsFinSummary",)
+
+# FundamentalData field: reports it's parsed from, ticker fields need none
+field_reports: dict[str, tuple[ReportType, ...]] = {
+    "income_annual": _statements,
+    "income_quarter": _statements,
+    "balance_annual": _statements,
+    "balance_quarter": _statements,
+    "cashflow_annual": _statements,
+    "cashflow_quarter": _statements,
+    "company_info": _statements,
+    "ownership_report": ("ReportsOwnership",),
+    "dividend": _summary,
+    "div_ps_q": _summary,
+    "div_ps_ttm": _summary,
+    "revenue_ttm": _summary,
+    "revenue_q": _summary,
+    "eps_ttm": _summary,
+    "eps_q": _summary,
+    "analyst_forecast": ("ReportSnapshot",),
+    "ratios": ("ReportSnapshot",),
+    "fy_estimates": ("RESC",),
+    "fy_actuals": ("RESC",),
+    "fundamental_ratios": (),
+    "dividend_summary": (),
+}
+
+
+def resolve_reports(fields: Iterable[str]) -> tuple[ReportType, ...]:
+    """minimal report types for FundamentalData fields
+
+    Raises:
+        ValueError: on unknown field
+    """
+    fields = tuple(fields)
+    if _unknown := set(fields) - set(field_reports):
+        raise ValueError(f"Unknown fields {sorted(_unknown)}")
+    return tuple(dict.fromkeys(_r for _f in fields for _r in field_reports[_f]))
+
+
+def statement_frame(
+    parser: XMLParser, statement: StatementCode, period: PeriodType
+) -> DataFrame | None:
+    """statement data frame from the parser statements, None if empty
+
+    Frames are built once while ReportsFinStatements is unchanged, callers
+    get a copy.
+    """
+    memo = parser.xml_report.memo("ReportsFinStatements")
+    key = ("statement_frame", statement, period)
+    if key not in memo:
+        statements = parser.get_fin_statement(statement, period)
+        memo[key] = (
+            build_statement_frame(
+                statements, statement, period, parser.get_map_items(statement)
+            )
+            if len(statements)
+            else None
+        )
+    return detach(memo[key])
+
 
 class FundamentalData:
     """Company fundamental data"""
@@ -59,21 +132,48 @@ class FundamentalData:
     # pylint: disable=too-many-arguments,too-many-public-methods
     # pylint: disable=too-many-instance-attributes
     def __init__(
-        self, ib: IB, symbol: str, exchange: str = "SMART", currency: str = "USD"
+        self,
+        ib: IB,
+        symbol: str,
+        exchange: str = "SMART",
+        currency: str = "USD",
+        cache: Optional[ReportCache] = None,
+        contract_cache: Optional[ContractCache] = None,
+        scheduler: Optional[RequestScheduler] = None,
+        history: Optional[ReportHistory] = None,
+        prefetch: Optional[Iterable[str]] = None,
     ) -> None:
         """Args:
         ib (ib_async.IB): ib_async.IB instance
         symbol (str): company symbol/ticker
         exchange (str, optional): exchange. Defaults to "SMART".
         currency (str, optional): currency. Defaults to "USD".
+        cache (ReportCache, optional): persistent raw XML report cache.
+        contract_cache (ContractCache, optional): qualified contracts cache.
+        scheduler (RequestScheduler, optional): report requests scheduler.
+        history (ReportHistory, optional): last parsed reports, unchanged
+            reports are not parsed again.
+        prefetch (Iterable[str], optional): fields to be used, ex.
+            {"income_annual", "eps_ttm"}, their reports are requested
+            concurrently on init. Defaults to None, reports are requested
+            on first access.
         """
         self.client = IBClient(
-            symbol=symbol, ib=ib, exchange=exchange, currency=currency
+            symbol=symbol,
+            ib=ib,
+            exchange=exchange,
+            currency=currency,
+            cache=cache,
+            contract_cache=contract_cache,
+            scheduler=scheduler,
         )
         self.symbol = symbol
         self.contract: Stock = self.client.contract
         self.ticker: Optional[Ticker] = None
-        self.parser = XMLParser(ib_client=self.client)
+        self.xml_report = XMLReport(ib_client=self.client, history=history)
+        self.parser = XMLParser(xml_report=self.xml_report)
+        if prefetch:
+            self.prefetch(prefetch)
 
     def __repr__(self):
         cls_name = self.__class__.__qualname__
@@ -82,166 +182,83 @@ class FundamentalData:
     def __enter__(self):
         return self
 
+    def prefetch(self, fields: Iterable[str]) -> dict[ReportType, Exception]:
+        """request the reports of fields concurrently, see field_reports
+
+        Returns:
+            dict[ReportType, Exception]: request errors by report type, failed
+                reports are requested again on field access
+        """
+        return self.xml_report.prefetch(*resolve_reports(fields))
+
     @property
     def income_annual(self) -> IncomeSet:
         """
         income_annual
         """
-        try:
-            return self.__income_annual
-        except AttributeError:
-            self.__income_annual: IncomeSet = self.parser.get_fin_statement(
-                statement="INC", period="annual"
-            )
-            return self.__income_annual
+        return self.parser.get_fin_statement(statement="INC", period="annual")
 
     @property
     def income_quarter(self) -> IncomeSet:
         """income_quarter"""
-        try:
-            return self.__income_quarter
-        except AttributeError:
-            self.__income_quarter: IncomeSet = self.parser.get_fin_statement(
-                statement="INC", period="quarter"
-            )
-            return self.__income_quarter
+        return self.parser.get_fin_statement(statement="INC", period="quarter")
 
     @property
     def balance_annual(self) -> BalanceSheetSet:
-        try:
-            return self.__balance_annual
-        except AttributeError:
-            self.__balance_annual: BalanceSheetSet = self.parser.get_fin_statement(
-                statement="BAL", period="annual"
-            )
-            return self.__balance_annual
+        return self.parser.get_fin_statement(statement="BAL", period="annual")
 
     @property
     def balance_quarter(self) -> BalanceSheetSet:
-        try:
-            return self.__balance_quarter
-        except AttributeError:
-            self.__balance_quarter: BalanceSheetSet = self.parser.get_fin_statement(
-                statement="BAL", period="quarter"
-            )
-            return self.__balance_quarter
+        return self.parser.get_fin_statement(statement="BAL", period="quarter")
 
     @property
     def cashflow_annual(self) -> CashFlowSet:
-        try:
-            return self.__cashflow_annual
-        except AttributeError:
-            self.__cashflow_annual: CashFlowSet = self.parser.get_fin_statement(
-                statement="CAS", period="annual"
-            )
-            return self.__cashflow_annual
+        return self.parser.get_fin_statement(statement="CAS", period="annual")
 
     @property
     def cashflow_quarter(self) -> CashFlowSet:
-        try:
-            return self.__cashflow_quarter
-        except AttributeError:
-            self.__cashflow_quarter: CashFlowSet = self.parser.get_fin_statement(
-                statement="CAS", period="quarter"
-            )
-            return self.__cashflow_quarter
+        return self.parser.get_fin_statement(statement="CAS", period="quarter")
 
     @property
     def ownership_report(self) -> OwnershipReport:
         """Ownership Report"""
-        try:
-            return self.__ownership_report
-        except AttributeError:
-            self.__ownership_report: OwnershipReport = (
-                self.parser.get_ownership_report()
-            )
-            return self.__ownership_report
+        return self.parser.get_ownership_report()
 
     @property
     def dividend(self) -> list[Dividend] | None:
-        try:
-            return self.__dividend
-        except AttributeError:
-            self.__dividend: list[Dividend] | None = self.parser.get_dividend()
-            return self.__dividend
+        return self.parser.get_dividend()
 
     @property
     def div_ps_q(self) -> list[DividendPerShare] | None:
-        try:
-            return self.__div_ps_q
-        except AttributeError:
-            self.__div_ps_q: list[DividendPerShare] | None = (
-                self.parser.get_div_per_share(report_type="R", period="3M")
-            )
-            return self.__div_ps_q
+        return self.parser.get_div_per_share(report_type="R", period="3M")
 
     @property
     def div_ps_ttm(self) -> list[DividendPerShare] | None:
-        try:
-            return self.__div_ps_ttm
-        except AttributeError:
-            self.__div_ps_ttm: list[DividendPerShare] | None = (
-                self.parser.get_div_per_share(report_type="TTM")
-            )
-            return self.__div_ps_ttm
+        return self.parser.get_div_per_share(report_type="TTM")
 
     @property
     def revenue_ttm(self) -> list[Revenue]:
-        try:
-            return self.__revenue_ttm
-        except AttributeError:
-            self.__revenue_ttm: list[Revenue] = self.parser.get_revenue(
-                report_type="TTM"
-            )
-            return self.__revenue_ttm
+        return self.parser.get_revenue(report_type="TTM")
 
     @property
     def revenue_q(self) -> list[Revenue]:
-        try:
-            return self.__revenue_q
-        except AttributeError:
-            self.__revenue_q: list[Revenue] = self.parser.get_revenue(
-                report_type="R", period="3M"
-            )
-            return self.__revenue_q
+        return self.parser.get_revenue(report_type="R", period="3M")
 
     @property
     def eps_ttm(self) -> list[EarningsPerShare]:
-        try:
-            return self.__eps_ttm
-        except AttributeError:
-            self.__eps_ttm: list[EarningsPerShare] = self.parser.get_eps(
-                report_type="TTM"
-            )
-            return self.__eps_ttm
+        return self.parser.get_eps(report_type="TTM")
 
     @property
     def eps_q(self) -> list[EarningsPerShare]:
-        try:
-            return self.__eps_q
-        except AttributeError:
-            self.__eps_q: list[EarningsPerShare] = self.parser.get_eps(
-                report_type="R", period="3M"
-            )
-            return self.__eps_q
+        return self.parser.get_eps(report_type="R", period="3M")
 
     @property
     def analyst_forecast(self) -> AnalystForecast:
-        try:
-            return self.__analyst_forecast
-        except AttributeError:
-            self.__analyst_forecast: AnalystForecast = (
-                self.parser.get_analyst_forecast()
-            )
-            return self.__analyst_forecast
+        return self.parser.get_analyst_forecast()
 
     @property
     def ratios(self) -> RatioSnapshot:
-        try:
-            return self.__ratios
-        except AttributeError:
-            self.__ratios: RatioSnapshot = self.parser.get_ratios()
-            return self.__ratios
+        return self.parser.get_ratios()
 
     @property
     def fundamental_ratios(self) -> FundamentalRatios | None:
@@ -265,34 +282,31 @@ class FundamentalData:
 
     @property
     def fy_estimates(self) -> list[ForwardYear]:
-        try:
-            return self.__fy_estimates
-        except AttributeError:
-            self.__fy_estimates: list[ForwardYear] = self.parser.get_fy_estimates()
-            return self.__fy_estimates
+        return self.parser.get_fy_estimates()
 
     @property
     def fy_actuals(self) -> list[ForwardYear]:
-        try:
-            return self.__fy_actuals
-        except AttributeError:
-            self.__fy_actuals: list[ForwardYear] = self.parser.get_fy_actuals()
-            return self.__fy_actuals
+        return self.parser.get_fy_actuals()
 
     @property
     def company_info(self) -> CompanyInfo:
-        try:
-            return self.__company_info
-        except AttributeError:
-            self.__company_info: CompanyInfo = self.parser.get_company_info()
-            return self.__company_info
+        return self.parser.get_company_info()
 
 
 class CompanyFinancials:
     """Company Financials"""
 
+    # pylint: disable=too-many-arguments
     def __init__(
-        self, ib: IB, symbol: str, exchange: str = "SMART", currency: str = "USD"
+        self,
+        ib: IB,
+        symbol: str,
+        exchange: str = "SMART",
+        currency: str = "USD",
+        cache: Optional[ReportCache] = None,
+        contract_cache: Optional[ContractCache] = None,
+        scheduler: Optional[RequestScheduler] = None,
+        history: Optional[ReportHistory] = None,
     ) -> None:
         """
         Args:
@@ -300,9 +314,21 @@ class CompanyFinancials:
             symbol (str): company symbol/ticker
             exchange (str, optional): exchange. Defaults to "SMART".
             currency (str, optional): currency. Defaults to "USD".
+            cache (ReportCache, optional): persistent raw XML report cache.
+            contract_cache (ContractCache, optional): qualified contracts cache.
+            scheduler (RequestScheduler, optional): report requests scheduler.
+            history (ReportHistory, optional): last parsed reports, unchanged
+                reports are not parsed again.
         """
         self.data = FundamentalData(
-            symbol=symbol, ib=ib, exchange=exchange, currency=currency
+            symbol=symbol,
+            ib=ib,
+            exchange=exchange,
+            currency=currency,
+            cache=cache,
+            contract_cache=contract_cache,
+            scheduler=scheduler,
+            history=history,
         )
 
     def __repr__(self):
@@ -312,126 +338,400 @@ class CompanyFinancials:
     @property
     def balance_quarter(self) -> DataFrame | None:
         """Quarterly balance statement"""
-        if self.data.balance_quarter:
-            mapping = self.data.parser.get_map_items("BAL")
-            return build_statement(self.data.balance_quarter, "BAL", mapping)
-        return None
+        return statement_frame(self.data.parser, "BAL", "quarter")
 
     @property
     def balance_annual(self) -> DataFrame | None:
-        if self.data.balance_annual:
-            mapping = self.data.parser.get_map_items("BAL")
-            return build_statement(self.data.balance_annual, "BAL", mapping)
-        return None
+        return statement_frame(self.data.parser, "BAL", "annual")
 
     @property
     def income_quarter(self) -> DataFrame | None:
-        if self.data.income_quarter:
-            mapping = self.data.parser.get_map_items("INC")
-            return build_statement(self.data.income_quarter, "INC", mapping)
-        return None
+        return statement_frame(self.data.parser, "INC", "quarter")
 
     @property
     def income_annual(self) -> DataFrame | None:
-        if self.data.income_annual:
-            mapping = self.data.parser.get_map_items("INC")
-            return build_statement(self.data.income_annual, "INC", mapping)
-        return None
+        return statement_frame(self.data.parser, "INC", "annual")
 
     @property
     def cashflow_quarter(self) -> DataFrame | None:
-        if self.data.cashflow_annual:
-            mapping = self.data.parser.get_map_items("CAS")
-            return build_statement(self.data.cashflow_quarter, "CAS", mapping)
-        return None
+        return statement_frame(self.data.parser, "CAS", "quarter")
 
     @property
     def cashflow_annual(self) -> DataFrame | None:
-        if self.data.cashflow_annual:
-            mapping = self.data.parser.get_map_items("CAS")
-            return build_statement(self.data.cashflow_annual, "CAS", mapping)
-        return None
+        return statement_frame(self.data.parser, "CAS", "annual")
 
     @property
     def dividends(self) -> DataFrame | None:
-        if self.data.dividend:
-            return to_dataframe(self.data.dividend, key="ex_date")
+        if _data := self.data.dividend:
+            return to_dataframe(_data, key="ex_date")
         return None
 
     @property
     def dividends_ps_q(self) -> DataFrame | None:
-        if self.data.div_ps_q:
-            return to_dataframe(self.data.div_ps_q, key="as_of_date")
-        return None
+        return self.data.parser.get_summary_frame("DividendPerShares", "R", "3M")
 
     @property
     def dividends_ps_ttm(self) -> DataFrame | None:
-        if self.data.div_ps_ttm:
-            return to_dataframe(self.data.div_ps_ttm, key="as_of_date")
-        return None
+        return self.data.parser.get_summary_frame("DividendPerShares", "TTM")
 
     @property
     def revenue_q(self) -> DataFrame | None:
-        if self.data.revenue_q:
-            return to_dataframe(self.data.revenue_q, key="as_of_date")
-        return None
+        return self.data.parser.get_summary_frame("TotalRevenues", "R", "3M")
 
     @property
     def revenue_ttm(self) -> DataFrame | None:
-        if self.data.revenue_ttm:
-            return to_dataframe(self.data.revenue_ttm, key="as_of_date")
-        return None
+        return self.data.parser.get_summary_frame("TotalRevenues", "TTM")
 
     @property
     def eps_q(self) -> DataFrame | None:
-        if self.data.eps_q:
-            return to_dataframe(self.data.eps_q, key="as_of_date")
-        return None
+        return self.data.parser.get_summary_frame("EPSs", "R", "3M")
 
     @property
     def eps_ttm(self) -> DataFrame | None:
-        if self.data.eps_ttm:
-            return to_dataframe(self.data.eps_ttm, key="as_of_date")
-        return None
+        return self.data.parser.get_summary_frame("EPSs", "TTM")
 
     @property
     def ownership(self) -> DataFrame | None:
-        if self.data.ownership_report:
-            return to_dataframe(self.data.ownership_report.ownership_details)
+        if _data := self.data.ownership_report:
+            return to_dataframe(_data.ownership_details)
         return None
 
     @property
     def fy_actuals(self) -> DataFrame | None:
-        if self.data.fy_actuals:
-            return to_dataframe(self.data.fy_actuals, key="updated")
+        if _data := self.data.fy_actuals:
+            return to_dataframe(_data, key="updated")
         return None
 
     @property
     def fy_estimates(self) -> DataFrame | None:
-        if self.data.fy_estimates:
-            return to_dataframe(self.data.fy_estimates)
+        if _data := self.data.fy_estimates:
+            return to_dataframe(_data)
         return None
 
     @property
     def analyst_forecast(self) -> DataFrame | None:
-        if self.data.analyst_forecast:
-            return to_dataframe([self.data.analyst_forecast]).T
+        if _data := self.data.analyst_forecast:
+            return to_dataframe([_data]).T
         return None
 
     @property
     def company_information(self) -> DataFrame | None:
-        if self.data.company_info:
-            return to_dataframe([self.data.company_info]).T
+        if _data := self.data.company_info:
+            return to_dataframe([_data]).T
         return None
 
     @property
     def ratios(self) -> DataFrame | None:
-        if self.data.ratios:
-            return to_dataframe([self.data.ratios]).T.dropna()
+        if _data := self.data.ratios:
+            return to_dataframe([_data]).T.dropna()
         return None
 
     @property
     def fundamental_ratios(self) -> DataFrame | None:
-        if self.data.fundamental_ratios:
-            return to_dataframe([vars(self.data.fundamental_ratios)]).T
+        if _data := self.data.fundamental_ratios:
+            return to_dataframe([vars(_data)]).T
+        return None
+
+
+class AsyncFundamentalData:
+    """Company fundamental data, asyncio version
+
+    Mirrors FundamentalData, properties are awaitable methods, ex.
+    `await fd.income_annual()`. Parsing is shared with FundamentalData
+    through XMLParser.
+    """
+
+    # pylint: disable=too-many-arguments,too-many-public-methods
+    def __init__(
+        self,
+        ib: IB,
+        symbol: str,
+        exchange: str = "SMART",
+        currency: str = "USD",
+        cache: Optional[ReportCache] = None,
+        contract_cache: Optional[ContractCache] = None,
+        scheduler: Optional[RequestScheduler] = None,
+        history: Optional[ReportHistory] = None,
+    ) -> None:
+        """Args:
+        ib (ib_async.IB): ib_async.IB instance
+        symbol (str): company symbol/ticker
+        exchange (str, optional): exchange. Defaults to "SMART".
+        currency (str, optional): currency. Defaults to "USD".
+        cache (ReportCache, optional): persistent raw XML report cache.
+        contract_cache (ContractCache, optional): qualified contracts cache.
+        scheduler (RequestScheduler, optional): report requests scheduler.
+        history (ReportHistory, optional): last parsed reports, unchanged
+            reports are not parsed again.
+        """
+        self.client = AsyncIBClient(
+            symbol=symbol,
+            ib=ib,
+            exchange=exchange,
+            currency=currency,
+            cache=cache,
+            contract_cache=contract_cache,
+            scheduler=scheduler,
+        )
+        self.symbol = symbol
+        self.contract: Stock = self.client.contract
+        self.ticker: Optional[Ticker] = None
+        self.xml_report = AsyncXMLReport(ib_client=self.client, history=history)
+        self.parser = XMLParser(xml_report=self.xml_report)
+        self._data: dict[str, Any] = {}
+
+    def __repr__(self):
+        cls_name = self.__class__.__qualname__
+        return f"{cls_name}(symbol={self.symbol!r},IB={self.client.ib!r})"
+
+    async def prefetch(self, fields: Iterable[str]) -> None:
+        """request the reports of fields concurrently, see field_reports"""
+        await self.xml_report.load(*resolve_reports(fields))
+
+    async def _parse(self, report_type: ReportType, parse: Callable[[], Any]) -> Any:
+        """load report and parse it, parser results are memoized per report"""
+        await self.xml_report.load(report_type)
+        return parse()
+
+    async def income_annual(self) -> IncomeSet:
+        return await self._parse(
+            "ReportsFinStatements",
+            partial(self.parser.get_fin_statement, statement="INC", period="annual"),
+        )
+
+    async def income_quarter(self) -> IncomeSet:
+        return await self._parse(
+            "ReportsFinStatements",
+            partial(self.parser.get_fin_statement, statement="INC", period="quarter"),
+        )
+
+    async def balance_annual(self) -> BalanceSheetSet:
+        return await self._parse(
+            "ReportsFinStatements",
+            partial(self.parser.get_fin_statement, statement="BAL", period="annual"),
+        )
+
+    async def balance_quarter(self) -> BalanceSheetSet:
+        return await self._parse(
+            "ReportsFinStatements",
+            partial(self.parser.get_fin_statement, statement="BAL", period="quarter"),
+        )
+
+    async def cashflow_annual(self) -> CashFlowSet:
+        return await self._parse(
+            "ReportsFinStatements",
+            partial(self.parser.get_fin_statement, statement="CAS", period="annual"),
+        )
+
+    async def cashflow_quarter(self) -> CashFlowSet:
+        return await self._parse(
+            "ReportsFinStatements",
+            partial(self.parser.get_fin_statement, statement="CAS", period="quarter"),
+        )
+
+    async def ownership_report(self) -> OwnershipReport:
+        return await self._parse("ReportsOwnership", self.parser.get_ownership_report)
+
+    async def dividend(self) -> list[Dividend] | None:
+        return await self._parse("ReportsFinSummary", self.parser.get_dividend)
+
+    async def div_ps_q(self) -> list[DividendPerShare] | None:
+        return await self._parse(
+            "ReportsFinSummary",
+            partial(self.parser.get_div_per_share, report_type="R", period="3M"),
+        )
+
+    async def div_ps_ttm(self) -> list[DividendPerShare] | None:
+        return await self._parse(
+            "ReportsFinSummary",
+            partial(self.parser.get_div_per_share, report_type="TTM"),
+        )
+
+    async def revenue_ttm(self) -> list[Revenue]:
+        return await self._parse(
+            "ReportsFinSummary",
+            partial(self.parser.get_revenue, report_type="TTM"),
+        )
+
+    async def revenue_q(self) -> list[Revenue]:
+        return await self._parse(
+            "ReportsFinSummary",
+            partial(self.parser.get_revenue, report_type="R", period="3M"),
+        )
+
+    async def eps_ttm(self) -> list[EarningsPerShare]:
+        return await self._parse(
+            "ReportsFinSummary",
+            partial(self.parser.get_eps, report_type="TTM"),
+        )
+
+    async def eps_q(self) -> list[EarningsPerShare]:
+        return await self._parse(
+            "ReportsFinSummary",
+            partial(self.parser.get_eps, report_type="R", period="3M"),
+        )
+
+    async def analyst_forecast(self) -> AnalystForecast:
+        return await self._parse("ReportSnapshot", self.parser.get_analyst_forecast)
+
+    async def ratios(self) -> RatioSnapshot:
+        return await self._parse("ReportSnapshot", self.parser.get_ratios)
+
+    async def fundamental_ratios(self) -> FundamentalRatios | None:
+        try:
+            return self._data["fundamental_ratios"]
+        except KeyError:
+            _ratios: FundamentalRatios | None = await self.client.get_ratios()
+            self.ticker = self.client.ib.ticker(self.contract)
+            self._data["fundamental_ratios"] = _ratios
+            return _ratios
+
+    async def dividend_summary(self) -> Dividends | None:
+        try:
+            return self._data["dividend_summary"]
+        except KeyError:
+            _dividends: Dividends | None = await self.client.get_dividends()
+            self.ticker = self.client.ib.ticker(self.contract)
+            self._data["dividend_summary"] = _dividends
+            return _dividends
+
+    async def fy_estimates(self) -> list[ForwardYear]:
+        return await self._parse("RESC", self.parser.get_fy_estimates)
+
+    async def fy_actuals(self) -> list[ForwardYear]:
+        return await self._parse("RESC", self.parser.get_fy_actuals)
+
+    async def company_info(self) -> CompanyInfo:
+        return await self._parse("ReportsFinStatements", self.parser.get_company_info)
+
+
+class AsyncCompanyFinancials:
+    """Company Financials, asyncio version"""
+
+    # pylint: disable=too-many-arguments,too-many-public-methods
+    def __init__(
+        self,
+        ib: IB,
+        symbol: str,
+        exchange: str = "SMART",
+        currency: str = "USD",
+        cache: Optional[ReportCache] = None,
+        contract_cache: Optional[ContractCache] = None,
+        scheduler: Optional[RequestScheduler] = None,
+        history: Optional[ReportHistory] = None,
+    ) -> None:
+        """
+        Args:
+            ib (ib_async.IB): ib_async.IB instance
+            symbol (str): company symbol/ticker
+            exchange (str, optional): exchange. Defaults to "SMART".
+            currency (str, optional): currency. Defaults to "USD".
+            cache (ReportCache, optional): persistent raw XML report cache.
+            contract_cache (ContractCache, optional): qualified contracts cache.
+            scheduler (RequestScheduler, optional): report requests scheduler.
+            history (ReportHistory, optional): last parsed reports, unchanged
+                reports are not parsed again.
+        """
+        self.data = AsyncFundamentalData(
+            symbol=symbol,
+            ib=ib,
+            exchange=exchange,
+            currency=currency,
+            cache=cache,
+            contract_cache=contract_cache,
+            scheduler=scheduler,
+            history=history,
+        )
+
+    def __repr__(self):
+        cls_name = self.__class__.__qualname__
+        return f"{cls_name}(symbol={self.data.symbol!r},IB={self.data.client.ib!r})"
+
+    async def balance_quarter(self) -> DataFrame | None:
+        """Quarterly balance statement"""
+        await self.data.xml_report.load("ReportsFinStatements")
+        return statement_frame(self.data.parser, "BAL", "quarter")
+
+    async def balance_annual(self) -> DataFrame | None:
+        await self.data.xml_report.load("ReportsFinStatements")
+        return statement_frame(self.data.parser, "BAL", "annual")
+
+    async def income_quarter(self) -> DataFrame | None:
+        await self.data.xml_report.load("ReportsFinStatements")
+        return statement_frame(self.data.parser, "INC", "quarter")
+
+    async def income_annual(self) -> DataFrame | None:
+        await self.data.xml_report.load("ReportsFinStatements")
+        return statement_frame(self.data.parser, "INC", "annual")
+
+    async def cashflow_quarter(self) -> DataFrame | None:
+        await self.data.xml_report.load("ReportsFinStatements")
+        return statement_frame(self.data.parser, "CAS", "quarter")
+
+    async def cashflow_annual(self) -> DataFrame | None:
+        await self.data.xml_report.load("ReportsFinStatements")
+        return statement_frame(self.data.parser, "CAS", "annual")
+
+    async def dividends(self) -> DataFrame | None:
+        if _data := await self.data.dividend():
+            return to_dataframe(_data, key="ex_date")
+        return None
+
+    async def dividends_ps_q(self) -> DataFrame | None:
+        await self.data.xml_report.load("ReportsFinSummary")
+        return self.data.parser.get_summary_frame("DividendPerShares", "R", "3M")
+
+    async def dividends_ps_ttm(self) -> DataFrame | None:
+        await self.data.xml_report.load("ReportsFinSummary")
+        return self.data.parser.get_summary_frame("DividendPerShares", "TTM")
+
+    async def revenue_q(self) -> DataFrame | None:
+        await self.data.xml_report.load("ReportsFinSummary")
+        return self.data.parser.get_summary_frame("TotalRevenues", "R", "3M")
+
+    async def revenue_ttm(self) -> DataFrame | None:
+        await self.data.xml_report.load("ReportsFinSummary")
+        return self.data.parser.get_summary_frame("TotalRevenues", "TTM")
+
+    async def eps_q(self) -> DataFrame | None:
+        await self.data.xml_report.load("ReportsFinSummary")
+        return self.data.parser.get_summary_frame("EPSs", "R", "3M")
+
+    async def eps_ttm(self) -> DataFrame | None:
+        await self.data.xml_report.load("ReportsFinSummary")
+        return self.data.parser.get_summary_frame("EPSs", "TTM")
+
+    async def ownership(self) -> DataFrame | None:
+        if _data := await self.data.ownership_report():
+            return to_dataframe(_data.ownership_details)
+        return None
+
+    async def fy_actuals(self) -> DataFrame | None:
+        if _data := await self.data.fy_actuals():
+            return to_dataframe(_data, key="updated")
+        return None
+
+    async def fy_estimates(self) -> DataFrame | None:
+        if _data := await self.data.fy_estimates():
+            return to_dataframe(_data)
+        return None
+
+    async def analyst_forecast(self) -> DataFrame | None:
+        if _data := await self.data.analyst_forecast():
+            return to_dataframe([_data]).T
+        return None
+
+    async def company_information(self) -> DataFrame | None:
+        if _data := await self.data.company_info():
+            return to_dataframe([_data]).T
+        return None
+
+    async def ratios(self) -> DataFrame | None:
+        if _data := await self.data.ratios():
+            return to_dataframe([_data]).T.dropna()
+        return None
+
+    async def fundamental_ratios(self) -> DataFrame | None:
+        if _data := await self.data.fundamental_ratios():
+            return to_dataframe([vars(_data)]).T
         return None
@@ -23,23 +23,164 @@ Created on Fri Apr 30 16:21:58 2021
 """
 
 __all__ = [
+    "AsyncIBClient",
     "IBClient",
+    "qualify_contracts",
+    "qualify_contracts_async",
+    "req_ticks_async",
+    "wait_for_tick",
 ]
 
-from ib_async import IB, Dividends, FundamentalRatios, Stock, Ticker
+import asyncio
+from typing import Any, Iterable, Optional, Sequence
 
+from ib_async import IB, Contract, Dividends, FundamentalRatios, Stock, Ticker
+
+from .cache import ContractCache, ContractKey, ReportCache, ReportKey
+from .metrics import count, timer
 from .objects import ReportType
+from .scheduler import RequestScheduler
 
 
-class IBClient:
-    """IB client"""
+async def qualify_contracts_async(
+    ib: IB,
+    symbols: Iterable[str],
+    exchange: str = "SMART",
+    currency: str = "USD",
+    cache: Optional[ContractCache] = None,
+) -> list[Optional[Stock]]:
+    """qualify stock contracts, cache misses in one request batch
+
+    Args:
+        ib (IB): ib async connection
+        symbols (Iterable[str]): stock symbols
+        exchange (str, optional): exchange. Defaults to "SMART".
+        currency (str, optional): currency. Defaults to "USD".
+        cache (ContractCache, optional): qualified contracts cache, updated
+            with the new contracts. Defaults to None.
+
+    Returns:
+        list[Optional[Stock]]: contracts in symbols order, None on unknown
+            or ambiguous symbol
+    """
+    _contracts: list[Optional[Stock]] = []
+    _missing: list[tuple[int, Stock]] = []
+    for _i, _symbol in enumerate(symbols):
+        _key = ContractKey(_symbol, exchange, currency)
+        _contract = cache.get(_key) if cache is not None else None
+        if _contract is None:
+            _missing.append(
+                (_i, Stock(symbol=_symbol, exchange=exchange, currency=currency))
+            )
+        _contracts.append(_contract)
+    if cache is not None:
+        count("contract_cache.hit", len(_contracts) - len(_missing))
+        count("contract_cache.miss", len(_missing))
+    if _missing:
+        _qualified = await ib.qualifyContractsAsync(*(_c for _, _c in _missing))
+        for (_i, _), _contract in zip(_missing, _qualified):
+            if isinstance(_contract, Stock):
+                _contracts[_i] = _contract
+        if cache is not None:
+            cache.set_many([_contracts[_i] for _i, _ in _missing if _contracts[_i]])
+    return _contracts
+
+
+def qualify_contracts(
+    ib: IB,
+    symbols: Iterable[str],
+    exchange: str = "SMART",
+    currency: str = "USD",
+    cache: Optional[ContractCache] = None,
+) -> list[Optional[Stock]]:
+    """qualify stock contracts, blocking, see qualify_contracts_async"""
+    return ib.run(qualify_contracts_async(ib, symbols, exchange, currency, cache))
+
+
+async def wait_for_tick(ticker: Ticker, name: str, timeout: float = 2.0) -> Any:
+    """wait on ticker updates until ticker attribute is set
+
+    Args:
+        ticker (Ticker): market data ticker
+        name (str): ticker attribute, ex. fundamentalRatios
+        timeout (float, optional): timeout in seconds, 0 means no timeout.
+            Defaults to 2.
+
+    Returns:
+        Any: ticker attribute value, None on timeout
+    """
+
+    async def _wait():
+        while getattr(ticker, name) is None:
+            await ticker.updateEvent
+
+    try:
+        await asyncio.wait_for(_wait(), timeout or None)
+    except asyncio.TimeoutError:
+        pass
+    return getattr(ticker, name)
+
+
+async def req_ticks_async(
+    ib: IB,
+    contracts: Sequence[Contract],
+    name: str = "fundamentalRatios",
+    timeout: float = 2.0,
+    max_lines: int = 50,
+) -> list[Any]:
+    """subscribe fundamental ticks 258/456 for many contracts at once
 
+    Every subscription is cancelled as soon as its tick arrives, so no more
+    than max_lines market data lines are used at any time.
+
+    Args:
+        ib (IB): ib async connection
+        contracts (Sequence[Contract]): qualified contracts
+        name (str, optional): ticker attribute, fundamentalRatios or dividends.
+            Defaults to "fundamentalRatios".
+        timeout (float, optional): timeout in seconds for each contract.
+            Defaults to 2.
+        max_lines (int, optional): maximum concurrent subscriptions.
+            Defaults to 50.
+
+    Returns:
+        list[Any]: ticker attribute values in contracts order, None on timeout
+    """
+    semaphore = asyncio.Semaphore(max_lines)
+
+    async def _req(contract: Contract) -> Any:
+        async with semaphore:
+            ticker = ib.reqMktData(
+                contract=contract,
+                genericTickList=BaseIBClient.tick_list,
+                snapshot=False,
+            )
+            try:
+                return await wait_for_tick(ticker, name, timeout)
+            finally:
+                ib.cancelMktData(contract)
+
+    return await asyncio.gather(*(_req(_c) for _c in contracts))
+
+
+class BaseIBClient:
+    """IB client base class"""
+
+    # pylint: disable=too-many-instance-attributes
     ticker: Ticker
     tick_list: str = "258,456"
+    tick_timeout: float = 2.0
 
     # pylint: disable=too-many-arguments
     def __init__(
-        self, ib: IB, symbol: str, exchange: str = "SMART", currency: str = "USD"
+        self,
+        ib: IB,
+        symbol: str,
+        exchange: str = "SMART",
+        currency: str = "USD",
+        cache: Optional[ReportCache] = None,
+        contract_cache: Optional[ContractCache] = None,
+        scheduler: Optional[RequestScheduler] = None,
     ):
         """_summary_
 
@@ -48,11 +189,20 @@ class IBClient:
             symbol (str): symbol
             exchange (str, optional): exchange. Defaults to "SMART".
             currency (str, optional): currency. Defaults to "USD".
+            cache (ReportCache, optional): persistent raw XML report cache.
+                Defaults to None.
+            contract_cache (ContractCache, optional): qualified contracts
+                cache. Defaults to None.
+            scheduler (RequestScheduler, optional): report requests pacing
+                and retries. Defaults to None, requests are sent right away.
 
         Raises:
             ValueError: on invalid symbol, IB not connected
         """
         self.ib = ib
+        self.cache = cache
+        self.contract_cache = contract_cache
+        self.scheduler = scheduler
         if symbol:
             self.contract: Stock = self.make_contract(symbol, exchange, currency)
             self.symbol: str = symbol
@@ -86,7 +236,7 @@ class IBClient:
     def make_contract(
         self, symbol: str, exchange: str = "SMART", currency: str = "USD"
     ) -> Stock:
-        """Stock contract factory method
+        """Stock contract factory method, qualified if it's in contract_cache
 
         Args:
             symbol (str): stock symbol
@@ -96,23 +246,46 @@ class IBClient:
         Returns:
             Contract: Stock contract
         """
-        _stock = Stock(symbol=symbol, exchange=exchange, currency=currency)
-        self.ib.qualifyContracts(_stock)
-        return _stock
+        if self.contract_cache is not None:
+            if _stock := self.contract_cache.get(
+                ContractKey(symbol, exchange, currency)
+            ):
+                count("contract_cache.hit")
+                return _stock
+            count("contract_cache.miss")
+        return Stock(symbol=symbol, exchange=exchange, currency=currency)
 
-    def ib_req_fund(self, report_type: ReportType) -> str:
-        """
-        reportType:
-            - 'ReportsFinSummary': Financial summary
-            - 'ReportsOwnership': Company's ownership
-            - 'ReportSnapshot': Company's financial overview
-            - 'ReportsFinStatements': Financial Statements
-            - 'RESC': Analyst Estimates
-            - 'CalendarReport': Company's calendar
-        """
-        xml = self.ib.reqFundamentalData(self.contract, report_type)
+    def _timeout(self, timeout: Optional[float]) -> float:
+        """tick timeout, tick_timeout by default"""
+        return self.tick_timeout if timeout is None else timeout
+
+    def cached_report(self, report_type: ReportType) -> Optional[str]:
+        """get report from cache, None on cache miss or no cache"""
+        if self.cache is None:
+            return None
+        xml = self.cache.get(ReportKey.from_contract(self.contract, report_type))
+        count("report_cache.miss" if xml is None else "report_cache.hit")
+        return xml
+
+    def cache_report(self, report_type: ReportType, xml: str) -> None:
+        """store report in cache"""
+        if self.cache is not None:
+            self.cache.set(ReportKey.from_contract(self.contract, report_type), xml)
+
+    async def _req_fund(self, report_type: ReportType) -> str:
+        """request fundamental data report, contract is qualified"""
+        if (xml := self.cached_report(report_type)) is not None:
+            return xml
+        with timer("request"):
+            if self.scheduler is not None:
+                xml = await self.scheduler.request(self.ib, self.contract, report_type)
+            else:
+                xml = await self.ib.reqFundamentalDataAsync(self.contract, report_type)
         if xml:
+            count("request.bytes", len(xml))
+            self.cache_report(report_type, xml)
             return xml
+        count("request.empty")
         raise ValueError(
             f"No response for report {report_type}, contract: {self.contract}"
         )
@@ -126,24 +299,6 @@ class IBClient:
         )
         return self.ticker
 
-    def get_ratios(self) -> FundamentalRatios | None:
-        """request market data ticker with fundamental ratios"""
-        self.get_ticker()
-        if self.ticker.fundamentalRatios is None:
-            for _ in self.ib.loopUntil(
-                self.ticker.fundamentalRatios is not None, timeout=2
-            ):
-                self.ib.sleep(0.0)
-        return self.ticker.fundamentalRatios
-
-    def get_dividends(self) -> Dividends | None:
-        """get dividend information from ticker"""
-        self.get_ticker()
-        if self.ticker.dividends is None:
-            for _ in self.ib.loopUntil(self.ticker.dividends is not None, timeout=2):
-                self.ib.sleep(0.0)
-        return self.ticker.dividends
-
     def cancel_ticket(self) -> None:
         """cancel ticket market data"""
         if not hasattr(self, "ticker"):
@@ -159,3 +314,137 @@ class IBClient:
     def disconnect(self) -> None:
         """Disconnect from TWS API"""
         self.ib.disconnect()
+
+
+class IBClient(BaseIBClient):
+    """IB client"""
+
+    def make_contract(
+        self, symbol: str, exchange: str = "SMART", currency: str = "USD"
+    ) -> Stock:
+        """Qualified stock contract factory method
+
+        Args:
+            symbol (str): stock symbol
+            exchange (str, optional): exchange. Defaults to "SMART".
+            currency (str, optional): currency. Defaults to "USD".
+
+        Returns:
+            Contract: Stock contract
+        """
+        _stock = super().make_contract(symbol, exchange, currency)
+        if not _stock.conId:
+            self.ib.qualifyContracts(_stock)
+            if self.contract_cache is not None and _stock.conId:
+                self.contract_cache.set(_stock)
+        return _stock
+
+    def ib_req_fund(self, report_type: ReportType) -> str:
+        """
+        reportType:
+            - 'ReportsFinSummary': Financial summary
+            - 'ReportsOwnership': Company's ownership
+            - 'ReportSnapshot': Company's financial overview
+            - 'ReportsFinStatements': Financial Statements
+            - 'RESC': Analyst Estimates
+            - 'CalendarReport': Company's calendar
+        """
+        if (xml := self.cached_report(report_type)) is not None:
+            return xml
+        with timer("request"):
+            if self.scheduler is not None:
+                xml = self.ib.run(
+                    self.scheduler.request(self.ib, self.contract, report_type)
+                )
+            else:
+                xml = self.ib.reqFundamentalData(self.contract, report_type)
+        if xml:
+            count("request.bytes", len(xml))
+            self.cache_report(report_type, xml)
+            return xml
+        count("request.empty")
+        raise ValueError(
+            f"No response for report {report_type}, contract: {self.contract}"
+        )
+
+    def ib_req_fund_many(
+        self, report_types: Iterable[ReportType]
+    ) -> dict[ReportType, str | Exception]:
+        """request fundamental data reports concurrently
+
+        Returns:
+            dict[ReportType, str | Exception]: raw XML or request error by
+                report type
+        """
+        report_types = tuple(dict.fromkeys(report_types))
+        _results = self.ib.run(self._req_fund_many(report_types))
+        return dict(zip(report_types, _results))
+
+    async def _req_fund_many(
+        self, report_types: tuple[ReportType, ...]
+    ) -> list[str | BaseException]:
+        """gather report requests, created in the running event loop"""
+        return await asyncio.gather(
+            *(self._req_fund(_r) for _r in report_types), return_exceptions=True
+        )
+
+    def get_ratios(self, timeout: Optional[float] = None) -> FundamentalRatios | None:
+        """request market data ticker with fundamental ratios
+
+        Args:
+            timeout (float, optional): seconds to wait for the ratios tick.
+                Defaults to tick_timeout.
+        """
+        self.get_ticker()
+        return self.ib.run(
+            wait_for_tick(self.ticker, "fundamentalRatios", self._timeout(timeout))
+        )
+
+    def get_dividends(self, timeout: Optional[float] = None) -> Dividends | None:
+        """get dividend information from ticker
+
+        Args:
+            timeout (float, optional): seconds to wait for the dividends tick.
+                Defaults to tick_timeout.
+        """
+        self.get_ticker()
+        return self.ib.run(
+            wait_for_tick(self.ticker, "dividends", self._timeout(timeout))
+        )
+
+
+class AsyncIBClient(BaseIBClient):
+    """IB client, asyncio version
+
+    The contract is qualified on first request, so the instance can be
+    created outside of a running event loop.
+    """
+
+    async def qualify_contract(self) -> Stock:
+        """qualify stock contract, only once"""
+        if not self.contract.conId:
+            await self.ib.qualifyContractsAsync(self.contract)
+            if self.contract_cache is not None and self.contract.conId:
+                self.contract_cache.set(self.contract)
+        return self.contract
+
+    async def ib_req_fund(self, report_type: ReportType) -> str:
+        """request fundamental data report, see IBClient.ib_req_fund"""
+        await self.qualify_contract()
+        return await self._req_fund(report_type)
+
+    async def get_ratios(
+        self, timeout: Optional[float] = None
+    ) -> FundamentalRatios | None:
+        """request market data ticker with fundamental ratios"""
+        await self.qualify_contract()
+        self.get_ticker()
+        return await wait_for_tick(
+            self.ticker, "fundamentalRatios", self._timeout(timeout)
+        )
+
+    async def get_dividends(self, timeout: Optional[float] = None) -> Dividends | None:
+        """get dividend information from ticker"""
+        await self.qualify_contract()
+        self.get_ticker()
+        return await wait_for_tick(self.ticker, "dividends", self._timeout(timeout))
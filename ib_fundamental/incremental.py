@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+
+#   http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""Incremental ReportsFinStatements refresh
+
+Every FiscalPeriod of a report is fingerprinted by period type, EndDate and
+a hash of its raw XML, which covers Source Date, UpdateType and every line
+item. A refreshed report is compared with the previous version and only new
+or restated periods are parsed, unchanged periods are never parsed at all.
+
+    >>> previous = cache.get(key)
+    >>> delta = diff_fin_statements(new_xml, previous)
+    >>> delta.added, delta.restated
+    >>> upserts = statement_panel({"AAPL": delta.index})
+"""
+
+__all__ = [
+    "PeriodKey",
+    "StatementDelta",
+    "diff_fin_statements",
+    "period_digests",
+]
+
+import re
+from dataclasses import dataclass, field
+from typing import Iterator, Mapping, Optional, Union
+
+from defusedxml.ElementTree import fromstring
+
+from .objects import PeriodType, StatementIndex
+from .utils import content_hash
+from .xml_parser import index_fiscal_period
+
+# (period type, end date)
+PeriodKey = tuple[PeriodType, str]
+
+_fiscal_period = re.compile(rb"<FiscalPeriod\b([^>]*)>.*?</FiscalPeriod>", re.DOTALL)
+_end_date = re.compile(rb"\bEndDate=[\"']([^\"']+)[\"']")
+_interim = re.compile(rb"<InterimPeriods\b")
+
+
+@dataclass(slots=True)
+class StatementDelta:
+    """ReportsFinStatements changes, period keys in document order
+
+    index holds only added and restated periods, digests the fingerprints
+    of every period of the new report for the next refresh.
+    """
+
+    added: list[PeriodKey] = field(default_factory=list)
+    restated: list[PeriodKey] = field(default_factory=list)
+    unchanged: list[PeriodKey] = field(default_factory=list)
+    removed: list[PeriodKey] = field(default_factory=list)
+    index: StatementIndex = field(
+        default_factory=lambda: StatementIndex(
+            periods={"annual": [], "quarter": []}, items={}
+        )
+    )
+    digests: dict[PeriodKey, str] = field(default_factory=dict)
+
+    @property
+    def changed(self) -> bool:
+        """any period added, restated or removed"""
+        return bool(self.added or self.restated or self.removed)
+
+
+def _iter_periods(xml: bytes) -> Iterator[tuple[PeriodKey, bytes]]:
+    """(period key, raw FiscalPeriod) without parsing the report"""
+    _match = _interim.search(xml)
+    interim_start = _match.start() if _match else len(xml)
+    for _match in _fiscal_period.finditer(xml):
+        _end = _end_date.search(_match.group(1))
+        if _end is None:
+            raise ValueError(f"FiscalPeriod without EndDate at {_match.start()}")
+        period: PeriodType = "quarter" if _match.start() > interim_start else "annual"
+        yield (period, _end.group(1).decode()), _match.group(0)
+
+
+def _encode(xml: Union[str, bytes]) -> bytes:
+    return xml.encode() if isinstance(xml, str) else xml
+
+
+def period_digests(xml: Union[str, bytes]) -> dict[PeriodKey, str]:
+    """FiscalPeriod fingerprints of a ReportsFinStatements report
+
+    Args:
+        xml (str | bytes): raw ReportsFinStatements XML
+
+    Returns:
+        dict[PeriodKey, str]: content hash by (period type, end date)
+    """
+    return {_key: content_hash(_raw) for _key, _raw in _iter_periods(_encode(xml))}
+
+
+def diff_fin_statements(
+    xml: Union[str, bytes],
+    previous: Optional[Union[str, bytes, Mapping[PeriodKey, str]]] = None,
+) -> StatementDelta:
+    """compare a ReportsFinStatements report with its previous version
+
+    Args:
+        xml (str | bytes): new raw ReportsFinStatements XML
+        previous (str | bytes | Mapping[PeriodKey, str], optional): previous
+            raw XML, e.g. from a ReportCache before it is overwritten, or
+            the digests of the previous delta. Defaults to None, every
+            period is added.
+
+    Returns:
+        StatementDelta: added, restated, unchanged and removed periods,
+            with only added and restated periods parsed
+    """
+    if previous is None:
+        previous = {}
+    elif isinstance(previous, (str, bytes)):
+        previous = period_digests(previous) if previous else {}
+    delta = StatementDelta()
+    for _key, _raw in _iter_periods(_encode(xml)):
+        delta.digests[_key] = _hash = content_hash(_raw)
+        _old = previous.get(_key)
+        if _old == _hash:
+            delta.unchanged.append(_key)
+            continue
+        (delta.added if _old is None else delta.restated).append(_key)
+        index_fiscal_period(delta.index, fromstring(_raw), _key[0])
+    delta.removed = [_k for _k in previous if _k not in delta.digests]
+    return delta
@@ -0,0 +1,298 @@
+#!/usr/bin/env python3
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+
+#   http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""Hot path timers and counters
+
+Instrumentation is off until a hook is added, then every timer and counter
+is sent to all hooks. Metrics keeps a summary in memory, PrometheusHook and
+OpenTelemetryHook export to prometheus_client and OpenTelemetry metrics.
+
+Timers: request, xml_parse, extract.<XMLParser method>, build_statement,
+build_statement_frame, to_dataframe. Counters: request.bytes, request.empty,
+request.retries, request.timeouts, xml_parse.bytes, xml_parse.unchanged,
+report_cache.hit, report_cache.miss, contract_cache.hit, contract_cache.miss.
+
+    >>> metrics = add_hook(Metrics())
+    >>> CompanyFinancials(ib=ib, symbol="AAPL").income_annual
+    >>> metrics.summary()
+"""
+
+__all__ = [
+    "Hook",
+    "Metrics",
+    "OpenTelemetryHook",
+    "PrometheusHook",
+    "TimerStats",
+    "add_hook",
+    "count",
+    "hooks",
+    "remove_hook",
+    "timed",
+    "timer",
+]
+
+import contextlib
+import functools
+import re
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Optional, TypeVar
+
+from pandas import DataFrame
+
+try:
+    import prometheus_client
+except ImportError:  # pragma: no cover
+    prometheus_client = None  # pylint: disable=invalid-name
+
+try:
+    from opentelemetry import metrics as otel_metrics
+except ImportError:  # pragma: no cover
+    otel_metrics = None  # pylint: disable=invalid-name
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+class Hook:
+    """Instrumentation hook base class, methods do nothing"""
+
+    def on_timer(self, name: str, seconds: float) -> None:
+        """stage timing"""
+
+    def on_counter(self, name: str, value: float) -> None:
+        """counter increment"""
+
+
+# active hooks, instrumentation is off while empty
+hooks: list[Hook] = []
+
+
+def add_hook(hook: Hook) -> Hook:
+    """add instrumentation hook, returns the hook"""
+    hooks.append(hook)
+    return hook
+
+
+def remove_hook(hook: Hook) -> None:
+    """remove instrumentation hook"""
+    hooks.remove(hook)
+
+
+def count(name: str, value: float = 1) -> None:
+    """increment counter"""
+    if hooks:
+        for _hook in hooks:
+            _hook.on_counter(name, value)
+
+
+class _Timer:
+    """stage timer context manager"""
+
+    __slots__ = ("name", "start")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *_exc):
+        _seconds = time.perf_counter() - self.start
+        for _hook in hooks:
+            _hook.on_timer(self.name, _seconds)
+
+
+_null_timer = contextlib.nullcontext()
+
+
+def timer(name: str) -> contextlib.AbstractContextManager:
+    """time a stage, with timer("xml_parse"): ..."""
+    return _Timer(name) if hooks else _null_timer
+
+
+def timed(name: str) -> Callable[[F], F]:
+    """time every call of a function, blocking functions only"""
+
+    def _decorator(func: F) -> F:
+        @functools.wraps(func)
+        def _wrapper(*args, **kwargs):
+            if not hooks:
+                return func(*args, **kwargs)
+            with _Timer(name):
+                return func(*args, **kwargs)
+
+        return _wrapper  # type: ignore[return-value]
+
+    return _decorator
+
+
+@dataclass(slots=True)
+class TimerStats:
+    """Timer calls and seconds"""
+
+    count: int = 0
+    total: float = 0.0
+    max: float = 0.0
+
+    @property
+    def mean(self) -> float:
+        """mean seconds per call"""
+        return self.total / self.count if self.count else 0.0
+
+
+class Metrics(Hook):
+    """In memory timers and counters"""
+
+    def __init__(self):
+        self.timers: dict[str, TimerStats] = {}
+        self.counters: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        cls_name = self.__class__.__qualname__
+        return (
+            f"{cls_name}(timers={len(self.timers)!r},counters={len(self.counters)!r})"
+        )
+
+    def on_timer(self, name: str, seconds: float) -> None:
+        with self._lock:
+            _stats = self.timers.get(name)
+            if _stats is None:
+                _stats = self.timers[name] = TimerStats()
+            _stats.count += 1
+            _stats.total += seconds
+            _stats.max = max(_stats.max, seconds)
+
+    def on_counter(self, name: str, value: float) -> None:
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def reset(self) -> None:
+        """clear timers and counters"""
+        with self._lock:
+            self.timers.clear()
+            self.counters.clear()
+
+    def summary(self) -> DataFrame:
+        """timers and counters
+
+        Returns:
+            DataFrame: one row per timer or counter, columns kind, count,
+                total, mean and max. Counters only have total.
+        """
+        with self._lock:
+            _rows = [
+                {
+                    "name": _name,
+                    "kind": "timer",
+                    "count": _s.count,
+                    "total": _s.total,
+                    "mean": _s.mean,
+                    "max": _s.max,
+                }
+                for _name, _s in sorted(self.timers.items())
+            ] + [
+                {"name": _name, "kind": "counter", "total": _value}
+                for _name, _value in sorted(self.counters.items())
+            ]
+        return DataFrame(
+            _rows, columns=["name", "kind", "count", "total", "mean", "max"]
+        ).set_index("name")
+
+
+def _metric_name(*parts: str) -> str:
+    """prometheus compatible metric name"""
+    return re.sub(r"[^a-zA-Z0-9_]", "_", "_".join(_p for _p in parts if _p))
+
+
+class PrometheusHook(Hook):
+    """Export to prometheus_client, timers as histograms in seconds
+
+    Requires prometheus_client.
+    """
+
+    def __init__(self, registry: Optional[Any] = None, prefix: str = "ib_fundamental"):
+        """
+        Args:
+            registry (CollectorRegistry, optional): prometheus registry.
+                Defaults to the global registry.
+            prefix (str, optional): metric name prefix.
+                Defaults to "ib_fundamental".
+        """
+        if prometheus_client is None:
+            raise ImportError("PrometheusHook requires prometheus_client")
+        self.registry = registry or prometheus_client.REGISTRY
+        self.prefix = prefix
+        self._metrics: dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    def _metric(self, name: str, factory: Callable, suffix: str) -> Any:
+        try:
+            return self._metrics[name]
+        except KeyError:
+            with self._lock:
+                if name not in self._metrics:
+                    self._metrics[name] = factory(
+                        _metric_name(self.prefix, name, suffix),
+                        f"ib_fundamental {name}",
+                        registry=self.registry,
+                    )
+            return self._metrics[name]
+
+    def on_timer(self, name: str, seconds: float) -> None:
+        self._metric(name, prometheus_client.Histogram, "seconds").observe(seconds)
+
+    def on_counter(self, name: str, value: float) -> None:
+        # prometheus_client adds the _total suffix
+        self._metric(name, prometheus_client.Counter, "").inc(value)
+
+
+class OpenTelemetryHook(Hook):
+    """Export to OpenTelemetry metrics, timers as histograms in seconds
+
+    Requires opentelemetry-api.
+    """
+
+    def __init__(self, meter: Optional[Any] = None):
+        """
+        Args:
+            meter (Meter, optional): OpenTelemetry meter.
+                Defaults to the global meter provider ib_fundamental meter.
+        """
+        if otel_metrics is None:
+            raise ImportError("OpenTelemetryHook requires opentelemetry-api")
+        self.meter = meter or otel_metrics.get_meter("ib_fundamental")
+        self._histograms: dict[str, Any] = {}
+        self._counters: dict[str, Any] = {}
+
+    def on_timer(self, name: str, seconds: float) -> None:
+        if (_histogram := self._histograms.get(name)) is None:
+            _histogram = self._histograms[name] = self.meter.create_histogram(
+                f"ib_fundamental.{name}", unit="s"
+            )
+        _histogram.record(seconds)
+
+    def on_counter(self, name: str, value: float) -> None:
+        if (_counter := self._counters.get(name)) is None:
+            _counter = self._counters[name] = self.meter.create_counter(
+                f"ib_fundamental.{name}"
+            )
+        _counter.add(value)
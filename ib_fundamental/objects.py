@@ -22,9 +22,12 @@ Created on Thu May 9 16:21:58 2021
 @author: gonzo
 """
 # pylint: disable=too-many-instance-attributes
-from dataclasses import dataclass
+from collections.abc import Sequence
+from dataclasses import dataclass, fields
 from datetime import date, datetime
-from typing import Literal, Optional, Union
+from typing import Any, Literal, Optional, TypeVar, Union, overload
+
+import numpy as np
 
 StatementCode = Literal["INC", "BAL", "CAS"]
 PeriodType = Literal["annual", "quarter"]
@@ -201,9 +204,136 @@ class CashFlowStatement(FinancialStatement):
     sctp: Optional[float] = None
 
 
-BalanceSheetSet = list[BalanceSheetStatement]
-IncomeSet = list[IncomeStatement]
-CashFlowSet = list[CashFlowStatement]
+statement_map = {
+    "INC": IncomeStatement,
+    "BAL": BalanceSheetStatement,
+    "CAS": CashFlowStatement,
+}
+
+# header rows, FinancialStatement fields
+header_fields: tuple[str, ...] = tuple(_f.name for _f in fields(FinancialStatement))
+
+# line item coaCodes by statement, in field order
+coa_codes: dict[StatementCode, tuple[str, ...]] = {
+    _code: tuple(_f.name for _f in fields(_cls) if _f.name not in header_fields)
+    for _code, _cls in statement_map.items()
+}
+
+S = TypeVar("S", bound=FinancialStatement)
+
+
+def _read_only(*arrays: np.ndarray) -> None:
+    """mark arrays read only, they are shared by memoized results"""
+    for _array in arrays:
+        _array.flags.writeable = False
+
+
+@dataclass(slots=True, eq=False)
+class StatementSet(Sequence[S]):
+    """Financial statements of one statement and period type, array backed
+
+    values is a float64 periods x codes matrix with NaN for missing line
+    items, codes starts with coa_codes[statement]. header holds period
+    metadata arrays by FinancialStatement field, fields not reported use the
+    dataclass default. Arrays are read only. Items are
+    statement_map[statement] instances, built on access.
+    """
+
+    statement: StatementCode
+    codes: tuple[str, ...]
+    values: np.ndarray
+    header: dict[str, np.ndarray]
+
+    def __post_init__(self):
+        _read_only(self.values, *self.header.values())
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    @overload
+    def __getitem__(self, i: int) -> S: ...
+
+    @overload
+    def __getitem__(self, i: Union[slice, np.ndarray]) -> "StatementSet[S]": ...
+
+    def __getitem__(self, i):
+        if not isinstance(i, (int, np.integer)):
+            # slice, index or boolean mask
+            return StatementSet(
+                self.statement,
+                self.codes,
+                self.values[i],
+                {_f: _v[i] for _f, _v in self.header.items()},
+            )
+        _row = self.values[i].tolist()
+        return statement_map[self.statement](
+            **{_f: _v[i] for _f, _v in self.header.items()},
+            **{
+                _c: _v
+                for _c, _v in zip(coa_codes[self.statement], _row)
+                if _v == _v  # pylint: disable=comparison-with-itself
+            },
+        )
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, Sequence) or isinstance(other, str):
+            return NotImplemented
+        return len(self) == len(other) and all(_a == _b for _a, _b in zip(self, other))
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self):
+        cls_name = self.__class__.__qualname__
+        return f"{cls_name}(statement={self.statement!r},periods={len(self)!r})"
+
+    def column(self, code: str) -> np.ndarray:
+        """line item values by period, NaN where missing
+
+        Args:
+            code (str): coaCode, lower case
+
+        Returns:
+            np.ndarray: float64 values, one per period
+        """
+        try:
+            return self.values[:, self.codes.index(code)]
+        except ValueError:
+            return np.full(len(self), np.nan)
+
+
+@dataclass(slots=True)
+class LineItems:
+    """ReportsFinStatements line items of one period type, one row per fiscal
+    period in document order
+
+    values is a float64 periods x codes matrix with NaN for missing line
+    items, end_date is datetime64[D] and fiscal_year int32. Arrays are read
+    only.
+    """
+
+    codes: tuple[str, ...]
+    end_date: np.ndarray
+    fiscal_year: np.ndarray
+    values: np.ndarray
+
+    def __post_init__(self):
+        _read_only(self.end_date, self.fiscal_year, self.values)
+
+    def column(self, code: str) -> np.ndarray:
+        """line item values by period
+
+        Args:
+            code (str): requested coaCode, lower case
+
+        Returns:
+            np.ndarray: float64 values, one per period
+        """
+        return self.values[:, self.codes.index(code)]
+
+
+BalanceSheetSet = StatementSet[BalanceSheetStatement]
+IncomeSet = StatementSet[IncomeStatement]
+CashFlowSet = StatementSet[CashFlowStatement]
 StatementData = Union[BalanceSheetSet, IncomeSet, CashFlowSet]
 
 
@@ -219,11 +349,52 @@ class StatementMap:
 
 StatementMapping = list[StatementMap]
 
-statement_map = {
-    "INC": IncomeStatement,
-    "BAL": BalanceSheetStatement,
-    "CAS": CashFlowStatement,
-}
+# (period type, end date, statement code)
+StatementKey = tuple[PeriodType, str, StatementCode]
+
+
+@dataclass(slots=True)
+class StatementIndex:
+    """ReportsFinStatements index, built in a single pass
+
+    periods holds fiscal period header data by period type, in document order,
+    items holds {coaCode: value} by (period type, end date, statement code).
+    """
+
+    periods: dict[PeriodType, list[dict[str, str]]]
+    items: dict[StatementKey, dict[str, float]]
+
+
+SummarySection = Literal["TotalRevenues", "DividendPerShares", "EPSs"]
+
+
+@dataclass(slots=True)
+class SummaryColumns:
+    """ReportsFinSummary section as typed columns, one row per value in
+    document order
+
+    as_of_date is datetime64[s] and value is float64, report_type and period
+    are int8 category codes into report_types and periods. Arrays are read
+    only.
+    """
+
+    currency: str
+    as_of_date: np.ndarray
+    report_type: np.ndarray
+    period: np.ndarray
+    value: np.ndarray
+    report_types: np.ndarray
+    periods: np.ndarray
+
+    def __post_init__(self):
+        _read_only(
+            self.as_of_date,
+            self.report_type,
+            self.period,
+            self.value,
+            self.report_types,
+            self.periods,
+        )
 
 
 @dataclass(slots=True)
@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+
+#   http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""Cross-symbol statement panels
+
+One tidy frame for a whole universe, built in a single allocation from the
+ReportsFinStatements index of every symbol.
+
+    >>> results = Universe(ib, symbols).fetch()
+    >>> long = statement_panel(results)
+    >>> wide = wide_panel(long)
+    >>> wide.xs("annual", level="period_type")[("INC", "RTLR")]
+"""
+
+__all__ = [
+    "panel_columns",
+    "statement_panel",
+    "wide_panel",
+]
+
+from typing import Any, Iterable, Mapping, Optional, Union, get_args
+from xml.etree.ElementTree import Element
+
+import numpy as np
+from defusedxml.ElementTree import fromstring
+from pandas import Categorical, DataFrame, MultiIndex
+
+from .objects import PeriodType, StatementCode, StatementIndex
+from .xml_parser import build_statement_index
+
+# FundamentalData, XMLParser, SymbolReports, StatementIndex, Element or raw XML
+PanelSource = Union[Any, StatementIndex, Element, str, bytes]
+
+panel_columns: tuple[str, ...] = (
+    "symbol",
+    "statement",
+    "period_type",
+    "end_date",
+    "coa_code",
+    "value",
+)
+statement_codes: tuple[StatementCode, ...] = get_args(StatementCode)
+period_types: tuple[PeriodType, ...] = get_args(PeriodType)
+
+
+def get_index(source: PanelSource) -> Optional[StatementIndex]:
+    """ReportsFinStatements index of a panel source, None if there is no report
+
+    Args:
+        source (PanelSource): FundamentalData or AsyncFundamentalData with
+            ReportsFinStatements loaded, XMLParser, universe SymbolReports,
+            StatementIndex, e.g. an incremental delta index, report Element
+            or raw XML
+
+    Returns:
+        Optional[StatementIndex]: statement index
+    """
+    if isinstance(source, StatementIndex):
+        return source
+    if hasattr(source, "parser"):
+        source = source.parser
+    if hasattr(source, "get_statement_index"):
+        return source.get_statement_index()
+    if hasattr(source, "reports"):
+        source = source.reports.get("ReportsFinStatements")
+    if isinstance(source, (str, bytes)):
+        source = fromstring(source) if source else None
+    if source is None:
+        return None
+    if not isinstance(source, Element):
+        raise ValueError(f"Unsupported panel source {type(source)!r}")
+    return build_statement_index(source)
+
+
+def statement_panel(
+    sources: Union[Mapping[str, PanelSource], Iterable[Any]],
+    statements: Iterable[StatementCode] = statement_codes,
+    periods: Iterable[PeriodType] = period_types,
+) -> DataFrame:
+    """long statement panel, one row per symbol, statement, period and coaCode
+
+    Args:
+        sources (Mapping[str, PanelSource] | Iterable): panel sources by
+            symbol, e.g. Universe.fetch() results, or FundamentalData objects
+        statements (Iterable[StatementCode], optional): statements to include.
+            Defaults to INC, BAL and CAS.
+        periods (Iterable[PeriodType], optional): periods to include.
+            Defaults to annual and quarter.
+
+    Returns:
+        DataFrame: symbol, statement, period_type, end_date, coa_code and
+            value columns. symbol, statement, period_type and coa_code are
+            categorical.
+    """
+    # pylint: disable=too-many-locals
+    if not isinstance(sources, Mapping):
+        sources = {_s.symbol: _s for _s in sources}
+    _statements, _periods = tuple(statements), tuple(periods)
+    # index every symbol first to size the panel
+    blocks: list[tuple[int, int, int, str, dict[str, float]]] = []
+    symbols: list[str] = []
+    for symbol, source in sources.items():
+        if (index := get_index(source)) is None:
+            continue
+        _symbol = len(symbols)
+        symbols.append(symbol)
+        for (period, end_date, code), items in index.items.items():
+            if code in _statements and period in _periods and items:
+                blocks.append(
+                    (
+                        _symbol,
+                        statement_codes.index(code),
+                        period_types.index(period),
+                        end_date,
+                        items,
+                    )
+                )
+    size = sum(len(_b[-1]) for _b in blocks)
+    symbol_codes = np.empty(size, dtype=np.int32)
+    statement = np.empty(size, dtype=np.int8)
+    period_type = np.empty(size, dtype=np.int8)
+    end_date = np.empty(size, dtype="datetime64[D]")
+    coa_codes = np.empty(size, dtype=np.int32)
+    value = np.empty(size, dtype=np.float64)
+    coa: dict[str, int] = {}
+    start = 0
+    for _symbol, _statement, _period, _end_date, items in blocks:
+        stop = start + len(items)
+        symbol_codes[start:stop] = _symbol
+        statement[start:stop] = _statement
+        period_type[start:stop] = _period
+        end_date[start:stop] = np.datetime64(_end_date, "D")
+        coa_codes[start:stop] = [coa.setdefault(_c, len(coa)) for _c in items]
+        value[start:stop] = list(items.values())
+        start = stop
+    # sorted coa_code categories
+    coa_sorted = sorted(coa, key=str.upper)
+    coa_order = np.empty(len(coa), dtype=np.int32)
+    coa_order[[coa[_c] for _c in coa_sorted]] = np.arange(len(coa))
+    return DataFrame(
+        {
+            "symbol": Categorical.from_codes(symbol_codes, categories=symbols),
+            "statement": Categorical.from_codes(statement, statement_codes),
+            "period_type": Categorical.from_codes(period_type, period_types),
+            "end_date": end_date.astype("datetime64[ns]"),
+            "coa_code": Categorical.from_codes(
+                coa_order[coa_codes], categories=[_c.upper() for _c in coa_sorted]
+            ),
+            "value": value,
+        },
+        columns=list(panel_columns),
+    )
+
+
+def factorize(frame: DataFrame) -> tuple[np.ndarray, MultiIndex]:
+    """factorize frame rows on the MultiIndex level codes, sorted by level
+
+    Args:
+        frame (DataFrame): key columns
+
+    Returns:
+        tuple[np.ndarray, MultiIndex]: row positions and unique keys
+    """
+    keys = MultiIndex.from_frame(frame)
+    shape = keys.levshape
+    flat = np.ravel_multi_index(tuple(keys.codes), shape)
+    unique, positions = np.unique(flat, return_inverse=True)
+    return positions, MultiIndex(
+        levels=keys.levels,
+        codes=np.unravel_index(unique, shape),
+        names=keys.names,
+    )
+
+
+def wide_panel(panel: DataFrame) -> DataFrame:
+    """wide statement panel
+
+    Args:
+        panel (DataFrame): long panel as returned by statement_panel
+
+    Returns:
+        DataFrame: values indexed by (symbol, period_type, end_date) with
+            (statement, coa_code) columns
+    """
+    rows, row_index = factorize(panel.loc[:, ["symbol", "period_type", "end_date"]])
+    cols, col_index = factorize(panel.loc[:, ["statement", "coa_code"]])
+    values = np.full((len(row_index), len(col_index)), np.nan)
+    values[rows, cols] = panel["value"].to_numpy()
+    return DataFrame(values, index=row_index, columns=col_index)
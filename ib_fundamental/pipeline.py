@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+
+#   http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""Process pool parsing pipeline
+
+Raw XML reports are parsed in worker processes while the main process keeps
+requesting reports, every symbol is handed to the pool as soon as its
+reports arrive. Workers return column-wise data frames, or Arrow tables
+with arrow=True, which are converted faster in the workers and unpickled
+faster in the main process.
+
+    >>> with ParsePipeline(workers=8) as pipeline:
+    ...     parsed = pipeline.run(Universe(ib=ib, symbols=symbols))
+    >>> parsed["AAPL"].datasets["eps"]
+"""
+
+__all__ = [
+    "ParsePipeline",
+    "ParsedSymbol",
+    "parse_reports",
+    "to_frame",
+]
+
+import asyncio
+import dataclasses
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Iterable, Mapping, Optional, Union
+
+from pandas import DataFrame
+
+from .objects import ReportType
+from .store import dataset_names, datasets, pa, to_table
+from .universe import SymbolReports, Universe
+from .xml_parser import XMLParser
+from .xml_report import XMLReport
+
+
+@dataclass(slots=True)
+class ParsedSymbol:
+    """Parsed datasets, fetch and parse errors for one symbol
+
+    errors are keyed by dataset name for parse errors and by report type
+    for reports that could not be fetched.
+    """
+
+    symbol: str
+    datasets: dict[str, Union[DataFrame, "pa.Table"]] = field(default_factory=dict)
+    errors: dict[str, str] = field(default_factory=dict)
+
+    @property
+    def ok(self) -> bool:
+        """all reports were fetched and all datasets were parsed"""
+        return not self.errors
+
+    def add_fetch_errors(self, reports: Any) -> "ParsedSymbol":
+        """add SymbolReports request errors, other reports are ignored"""
+        for _report, _exc in getattr(reports, "errors", {}).items():
+            self.errors[_report] = repr(_exc)
+        return self
+
+
+def to_frame(objs: Union[DataFrame, list, None]) -> DataFrame:
+    """data frame from a list of dataclasses, read field by field into columns
+
+    Args:
+        objs (DataFrame | list | None): data frame or list of same type
+            dataclasses
+
+    Returns:
+        DataFrame: data frame, empty for None or an empty list
+    """
+    if isinstance(objs, DataFrame):
+        return objs
+    if not objs:
+        return DataFrame()
+    _fields = [_f.name for _f in dataclasses.fields(objs[0])]
+    return DataFrame({_f: [getattr(_o, _f) for _o in objs] for _f in _fields})
+
+
+def parse_reports(
+    symbol: str,
+    reports: Mapping[ReportType, Union[str, bytes]],
+    names: Iterable[str] = dataset_names,
+    arrow: bool = False,
+) -> ParsedSymbol:
+    """parse raw XML reports, process pool worker
+
+    Args:
+        symbol (str): symbol
+        reports (Mapping[ReportType, str | bytes]): raw XML by report type
+        names (Iterable[str], optional): datasets, see store.dataset_names.
+            Defaults to all datasets.
+        arrow (bool, optional): return Arrow tables instead of data frames,
+            requires pyarrow. Defaults to False.
+
+    Returns:
+        ParsedSymbol: data frame or table by dataset name, errors by dataset
+            name
+    """
+    result = ParsedSymbol(symbol=symbol)
+    parser = XMLParser(xml_report=XMLReport.from_xml(reports))
+    convert = to_table if arrow else to_frame
+    for name in names:
+        try:
+            result.datasets[name] = convert(datasets[name](parser))
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            result.errors[name] = repr(exc)
+    return result
+
+
+class ParsePipeline:
+    """Fetch reports and parse them in a process pool"""
+
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        names: Iterable[str] = dataset_names,
+        executor: Optional[Executor] = None,
+        arrow: bool = False,
+    ):
+        """
+        Args:
+            workers (int, optional): worker processes. Defaults to the number
+                of CPUs.
+            names (Iterable[str], optional): datasets to parse, see
+                store.dataset_names. Defaults to all datasets.
+            executor (Executor, optional): executor to use instead of a new
+                ProcessPoolExecutor, it's not shut down by the pipeline.
+            arrow (bool, optional): workers return Arrow tables instead of
+                data frames, requires pyarrow. Defaults to False.
+
+        Raises:
+            ValueError: on unknown dataset name
+            ImportError: arrow is set and pyarrow is not installed
+        """
+        self.names: tuple[str, ...] = tuple(names)
+        if _unknown := set(self.names) - set(datasets):
+            raise ValueError(f"Unknown datasets {sorted(_unknown)}")
+        if arrow and pa is None:
+            raise ImportError(
+                "ParsePipeline(arrow=True) requires pyarrow, "
+                "pip install ib_fundamental[arrow]"
+            )
+        self.arrow = arrow
+        self._own_executor = executor is None
+        self.executor = executor or ProcessPoolExecutor(max_workers=workers)
+
+    def __repr__(self):
+        cls_name = self.__class__.__qualname__
+        return (
+            f"{cls_name}(names={self.names!r},executor={self.executor!r},"
+            f"arrow={self.arrow!r})"
+        )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_exc):
+        self.shutdown()
+
+    def shutdown(self) -> None:
+        """shut down the process pool"""
+        if self._own_executor:
+            self.executor.shutdown()
+
+    def parse(
+        self, reports: Mapping[str, Union[SymbolReports, Mapping[ReportType, Any]]]
+    ) -> dict[str, ParsedSymbol]:
+        """parse already fetched reports, ex. from a report cache
+
+        Args:
+            reports (Mapping[str, SymbolReports | Mapping]): SymbolReports or
+                raw XML by report type, by symbol
+
+        Returns:
+            dict[str, ParsedSymbol]: parsed datasets by symbol, with the
+                SymbolReports request errors
+        """
+        futures = {
+            _symbol: self.executor.submit(
+                parse_reports,
+                _symbol,
+                getattr(_r, "reports", _r),
+                self.names,
+                self.arrow,
+            )
+            for _symbol, _r in reports.items()
+        }
+        return {
+            _symbol: _f.result().add_fetch_errors(reports[_symbol])
+            for _symbol, _f in futures.items()
+        }
+
+    def run(self, universe: Universe) -> dict[str, ParsedSymbol]:
+        """fetch and parse all symbols, blocking"""
+        return universe.ib.run(self.run_async(universe))
+
+    async def run_async(self, universe: Universe) -> dict[str, ParsedSymbol]:
+        """fetch all symbols, each symbol is parsed as soon as it's fetched
+
+        Args:
+            universe (Universe): symbols to fetch
+
+        Returns:
+            dict[str, ParsedSymbol]: parsed datasets, parse and fetch errors
+                by symbol, symbols without contract have no datasets
+        """
+        loop = asyncio.get_running_loop()
+        futures: dict[str, asyncio.Future] = {}
+
+        def _submit(result: SymbolReports) -> None:
+            futures[result.symbol] = loop.run_in_executor(
+                self.executor,
+                parse_reports,
+                result.symbol,
+                result.reports,
+                self.names,
+                self.arrow,
+            )
+
+        fetched = await universe.fetch_async(on_symbol=_submit)
+        parsed = dict(zip(futures, await asyncio.gather(*futures.values())))
+        return {
+            _symbol: (
+                parsed.get(_symbol) or ParsedSymbol(symbol=_symbol)
+            ).add_fetch_errors(_result)
+            for _symbol, _result in fetched.items()
+        }
@@ -0,0 +1,349 @@
+#!/usr/bin/env python3
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+
+#   http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""Precompiled extraction plans
+
+A plan describes how report elements become dataclass rows: the element
+path as a list of steps, where every field is read from, its converter and
+the target type. Field readers are compiled once, when the plan is created,
+run_plan executes a plan against a parsed report and iter_plan against an
+iterparse event stream.
+
+    >>> rows = run_plan(plans["dividends"], xml_report.fin_summary)
+    >>> events = iterparse(xml_file(source), events=("start", "end"))
+    >>> for row in iter_plan(events, plans["fy_actuals"]): ...
+"""
+
+__all__ = [
+    "FieldSpec",
+    "Plan",
+    "Step",
+    "converters",
+    "iter_plan",
+    "plans",
+    "run_plan",
+]
+
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterable, Iterator, Optional
+from xml.etree.ElementTree import Element
+
+from .objects import Dividend, ForwardYear, OwnershipDetails, ReportType, StatementMap
+from .utils import parse_date, parse_timestamp
+
+Reader = Callable[[Element, dict[str, Any]], dict[str, Any]]
+
+# converter name: callable, None keeps the raw string, dates are memoized
+converters: dict[str, Optional[Callable[[str], Any]]] = {
+    "str": None,
+    "int": int,
+    "float": float,
+    "date": parse_date,
+    "timestamp": parse_timestamp,
+}
+
+_missing = object()
+
+
+@dataclass(slots=True, frozen=True)
+class FieldSpec:
+    """Target field read from a step element
+
+    source is "@attr" for an attribute, "" for the element text, "child" for
+    a child text and "child@attr" for a child attribute. Missing sources are
+    left to the dataclass default, empty values convert to None.
+    """
+
+    name: str
+    source: str = ""
+    converter: str = "str"
+
+
+@dataclass(slots=True, frozen=True)
+class Step:
+    """Path step, elements with tag below the previous step element
+
+    The first step matches at any depth. Fields of every step but the last
+    are shared by the rows below it and may read attributes only.
+    """
+
+    tag: str
+    fields: tuple[FieldSpec, ...] = ()
+
+
+def _getter(source: str) -> Callable[[Element], Any]:
+    """getter of a field source value, _missing if not found"""
+    _child, _, _attr = source.rpartition("@") if "@" in source else (source, "", "")
+    if not _child:
+        if _attr:
+            return lambda elem: elem.attrib.get(_attr, _missing)
+        return lambda elem: elem.text
+
+    def _get(elem: Element) -> Any:
+        if (_e := elem.find(_child)) is None:
+            return _missing
+        return _e.attrib.get(_attr, _missing) if _attr else _e.text
+
+    return _get
+
+
+def compile_step(step: Step) -> Reader:
+    """field reader of a step, context updated with {field name: converted
+    value}
+
+    Getters and converters are resolved once per step, so no field specs are
+    interpreted per element.
+    """
+    _fields = []
+    for _field in step.fields:
+        if _field.converter not in converters:
+            raise ValueError(f"Unknown converter {_field.converter!r}")
+        _fields.append(
+            (_field.name, _getter(_field.source), converters[_field.converter])
+        )
+    _fields_t = tuple(_fields)
+
+    def _read(elem: Element, context: dict[str, Any]) -> dict[str, Any]:
+        row = context.copy()
+        for _name, _get, _convert in _fields_t:
+            if (_v := _get(elem)) is _missing:
+                continue
+            if _convert is None:
+                row[_name] = _v
+            else:
+                row[_name] = _convert(_v) if _v else None
+        return row
+
+    return _read
+
+
+@dataclass(slots=True)
+class Plan:
+    """Extraction plan, one target instance per element of the last step"""
+
+    report_type: ReportType
+    target: type
+    steps: tuple[Step, ...]
+    constants: dict[str, Any] = field(default_factory=dict)
+    readers: tuple[Reader, ...] = field(init=False, repr=False)
+
+    def __post_init__(self):
+        if not self.steps:
+            raise ValueError("Plan without steps")
+        for _step in self.steps[:-1]:
+            if any(not _f.source.startswith("@") for _f in _step.fields):
+                raise ValueError(f"Step {_step.tag!r} fields must be attributes")
+        self.readers = tuple(compile_step(_step) for _step in self.steps)
+
+
+def _run_tree(
+    plan: Plan, elem: Element, level: int, context: dict[str, Any], out: list
+) -> None:
+    _tag, _read = plan.steps[level].tag, plan.readers[level]
+    _elems = elem.iter(_tag) if level == 0 else elem
+    if level == len(plan.steps) - 1:
+        _target = plan.target
+        for _elem in _elems:
+            if _elem.tag == _tag:
+                out.append(_target(**_read(_elem, context)))
+    else:
+        for _elem in _elems:
+            if _elem.tag == _tag:
+                _run_tree(plan, _elem, level + 1, _read(_elem, context), out)
+
+
+def run_plan(plan: Plan, root: Element) -> list:
+    """run a plan against a parsed report
+
+    Args:
+        plan (Plan): extraction plan
+        root (Element): report, or the element to search below
+
+    Returns:
+        list: plan.target instances, in document order
+    """
+    out: list = []
+    _run_tree(plan, root, 0, plan.constants, out)
+    return out
+
+
+class _PlanState:
+    """plan position in an event stream, open step depths and contexts, depth
+    of the open last step element"""
+
+    __slots__ = ("plan", "last", "depths", "contexts", "leaf")
+
+    def __init__(self, plan: Plan):
+        self.plan = plan
+        self.last = len(plan.steps) - 1
+        self.depths: list[int] = []
+        self.contexts: list[dict[str, Any]] = [plan.constants]
+        self.leaf = 0
+
+    def start(self, elem: Element, depth: int) -> None:
+        """open a step element, read its attribute fields"""
+        level = len(self.depths)
+        if (
+            self.leaf
+            or elem.tag != self.plan.steps[level].tag
+            or (level and depth != self.depths[-1] + 1)
+        ):
+            return
+        if level < self.last:
+            self.depths.append(depth)
+            self.contexts.append(self.plan.readers[level](elem, self.contexts[-1]))
+        else:
+            self.leaf = depth
+
+    def end(self, elem: Element, depth: int) -> Any:
+        """close an element, the target instance for last step elements"""
+        if self.leaf == depth:
+            self.leaf = 0
+            return self.plan.target(
+                **self.plan.readers[self.last](elem, self.contexts[-1])
+            )
+        if self.depths and self.depths[-1] == depth:
+            self.depths.pop()
+            self.contexts.pop()
+        return _missing
+
+
+def iter_plan(events: Iterable[tuple[str, Element]], *run: Plan) -> Iterator[Any]:
+    """run plans against an iterparse event stream
+
+    Elements are removed from their parent once closed, except inside an
+    open last step element, so peak memory is bounded by one last step
+    element.
+
+    Args:
+        events (Iterable[tuple[str, Element]]): iterparse start and end events
+        *run (Plan): extraction plans to run
+
+    Yields:
+        Any: target instances of every plan, in document order
+    """
+    states = [_PlanState(_plan) for _plan in run]
+    stack: list[Element] = []
+    for event, elem in events:
+        if event == "start":
+            stack.append(elem)
+            for _state in states:
+                _state.start(elem, len(stack))
+            continue
+        for _state in states:
+            if (_row := _state.end(elem, len(stack))) is not _missing:
+                yield _row
+        stack.pop()
+        if stack and not any(_state.leaf for _state in states):
+            stack[-1].remove(elem)
+
+
+_fy_period = (
+    FieldSpec("period_type", "@periodType"),
+    FieldSpec("fyear", "@fYear", "int"),
+    FieldSpec("end_month", "@endMonth", "int"),
+    FieldSpec("end_cal_year", "@endCalYear", "int"),
+)
+_fy_item = (FieldSpec("item", "@type"), FieldSpec("unit", "@unit"))
+
+# extraction plans by name
+plans: dict[str, Plan] = {
+    "map_items": Plan(
+        report_type="ReportsFinStatements",
+        target=StatementMap,
+        steps=(
+            Step("COAMap"),
+            Step(
+                "mapItem",
+                (
+                    FieldSpec("coa_item", "@coaItem"),
+                    FieldSpec("map_item"),
+                    FieldSpec("statement_type", "@statementType"),
+                    FieldSpec("line_id", "@lineID", "int"),
+                ),
+            ),
+        ),
+    ),
+    "dividends": Plan(
+        report_type="ReportsFinSummary",
+        target=Dividend,
+        steps=(
+            Step("Dividends", (FieldSpec("currency", "@currency"),)),
+            Step(
+                "Dividend",
+                (
+                    FieldSpec("type", "@type"),
+                    FieldSpec("ex_date", "@exDate", "date"),
+                    FieldSpec("record_date", "@recordDate", "date"),
+                    FieldSpec("pay_date", "@payDate", "date"),
+                    FieldSpec("declaration_date", "@declarationDate", "date"),
+                    FieldSpec("value", "", "float"),
+                ),
+            ),
+        ),
+    ),
+    "fy_actuals": Plan(
+        report_type="RESC",
+        target=ForwardYear,
+        steps=(
+            Step("FYActual", _fy_item),
+            Step(
+                "FYPeriod",
+                (
+                    *_fy_period,
+                    FieldSpec("value", "ActValue", "float"),
+                    FieldSpec("updated", "ActValue@updated", "timestamp"),
+                ),
+            ),
+        ),
+        constants={"type": "Actual"},
+    ),
+    "fy_estimates": Plan(
+        report_type="RESC",
+        target=ForwardYear,
+        steps=(
+            Step("FYEstimate", _fy_item),
+            Step("FYPeriod", _fy_period),
+            Step(
+                "ConsEstimate",
+                (
+                    FieldSpec("est_type", "@type"),
+                    FieldSpec("value", "ConsValue", "float"),
+                ),
+            ),
+        ),
+        constants={"type": "Estimate"},
+    ),
+    "ownership": Plan(
+        report_type="ReportsOwnership",
+        target=OwnershipDetails,
+        steps=(
+            Step(
+                "Owner",
+                (
+                    FieldSpec("owner_id", "@ownerId"),
+                    FieldSpec("type", "type"),
+                    FieldSpec("name", "name"),
+                    FieldSpec("quantity", "quantity", "float"),
+                    FieldSpec("as_of_date", "quantity@asofDate", "date"),
+                    FieldSpec("currency", "currency"),
+                ),
+            ),
+        ),
+    ),
+}
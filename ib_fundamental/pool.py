@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+
+#   http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""Pool of TWS/IB Gateway connections
+
+Report requests are routed to the connected session with the fewest
+requests in flight, every session paces its own requests. Dropped sessions
+are reconnected in the background.
+
+    >>> pool = ConnectionPool([Endpoint("gw1", 4001, 1), Endpoint("gw2", 4001, 1)])
+    >>> pool.connect()
+    >>> results = Universe(ib=pool, symbols=symbols).fetch()
+"""
+
+__all__ = [
+    "ConnectionPool",
+    "Endpoint",
+    "PooledConnection",
+]
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Iterable, Optional
+
+from ib_async import IB, Contract, util
+
+from .objects import ReportType
+from .scheduler import RequestScheduler
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True, frozen=True)
+class Endpoint:
+    """TWS/IB Gateway session"""
+
+    host: str = "127.0.0.1"
+    port: int = 7497
+    client_id: int = 1
+
+
+@dataclass(slots=True)
+class PooledConnection:
+    """Pool connection, its request scheduler and load"""
+
+    endpoint: Endpoint
+    ib: IB
+    scheduler: RequestScheduler
+    in_flight: int = 0
+    last_connect: float = 0.0
+    reconnecting: Optional[asyncio.Task] = field(default=None, repr=False)
+
+    def is_connected(self) -> bool:
+        """is connected to TWS api"""
+        return self.ib.isConnected()
+
+
+class ConnectionPool:
+    """Connections to several TWS/IB Gateway sessions"""
+
+    # pylint: disable=too-many-arguments
+    def __init__(
+        self,
+        endpoints: Iterable[Endpoint],
+        timeout: float = 4.0,
+        reconnect_interval: float = 10.0,
+        scheduler: Callable[[], RequestScheduler] = RequestScheduler,
+        ib_factory: Callable[[], IB] = IB,
+    ):
+        """
+        Args:
+            endpoints (Iterable[Endpoint]): sessions, distinct client ids
+                for the same host and port
+            timeout (float, optional): connect timeout in seconds.
+                Defaults to 4.
+            reconnect_interval (float, optional): minimum seconds between
+                reconnect attempts of a session. Defaults to 10.
+            scheduler (Callable[[], RequestScheduler], optional): request
+                scheduler factory, one scheduler per session.
+                Defaults to RequestScheduler.
+            ib_factory (Callable[[], IB], optional): connection factory, one
+                connection per session, ex. a ReplayIB factory to run
+                offline. Defaults to IB.
+
+        Raises:
+            ValueError: on empty or duplicated endpoints
+        """
+        _endpoints = list(endpoints)
+        if not _endpoints:
+            raise ValueError("No endpoints defined.")
+        if len(set(_endpoints)) != len(_endpoints):
+            raise ValueError("Duplicated endpoints.")
+        self.timeout = timeout
+        self.reconnect_interval = reconnect_interval
+        self.connections = [
+            PooledConnection(endpoint=_e, ib=ib_factory(), scheduler=scheduler())
+            for _e in _endpoints
+        ]
+
+    @classmethod
+    def from_client_ids(
+        cls,
+        client_ids: Iterable[int],
+        host: str = "127.0.0.1",
+        port: int = 7497,
+        **kwargs,
+    ) -> "ConnectionPool":
+        """pool of sessions on one host and port"""
+        return cls([Endpoint(host, port, _id) for _id in client_ids], **kwargs)
+
+    def __repr__(self):
+        cls_name = self.__class__.__qualname__
+        _connected = sum(_c.is_connected() for _c in self.connections)
+        return (
+            f"{cls_name}(connections={len(self.connections)!r},"
+            f"connected={_connected!r})"
+        )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_exc):
+        self.disconnect()
+
+    @property
+    def ib(self) -> IB:
+        """least loaded connected IB, for contract qualification and ticks"""
+        return self.least_loaded().ib
+
+    def is_connected(self) -> bool:
+        """at least one session is connected"""
+        return any(_c.is_connected() for _c in self.connections)
+
+    def run(self, *awaitables):
+        """run awaitables on the event loop, see ib_async.util.run"""
+        return util.run(*awaitables)
+
+    def connect(self) -> "ConnectionPool":
+        """connect all sessions, blocking"""
+        return self.run(self.connect_async())
+
+    async def connect_async(self) -> "ConnectionPool":
+        """connect all sessions
+
+        Raises:
+            ConnectionError: no session could connect
+        """
+        await asyncio.gather(*(self._connect(_c) for _c in self.connections))
+        if not self.is_connected():
+            raise ConnectionError(f"No session connected, {self!r}")
+        return self
+
+    def disconnect(self) -> None:
+        """disconnect all sessions"""
+        for _conn in self.connections:
+            if _conn.reconnecting is not None:
+                _conn.reconnecting.cancel()
+            _conn.ib.disconnect()
+
+    async def health_check_async(self) -> int:
+        """reconnect dropped sessions
+
+        Returns:
+            int: connected sessions
+        """
+        await asyncio.gather(
+            *(self._connect(_c) for _c in self.connections if not _c.is_connected())
+        )
+        return sum(_c.is_connected() for _c in self.connections)
+
+    def least_loaded(self) -> PooledConnection:
+        """connected session with the fewest requests in flight, dropped
+        sessions are scheduled for reconnection
+
+        Raises:
+            ConnectionError: no session is connected
+        """
+        _connected = []
+        for _conn in self.connections:
+            if _conn.is_connected():
+                _connected.append(_conn)
+            else:
+                self._schedule_reconnect(_conn)
+        if not _connected:
+            raise ConnectionError(f"No session connected, {self!r}")
+        return min(_connected, key=lambda _c: _c.in_flight)
+
+    async def request(self, contract: Contract, report_type: ReportType) -> str:
+        """request fundamental data report on the least loaded session
+
+        The request moves to another session if its session is dropped.
+
+        Args:
+            contract (Contract): qualified contract
+            report_type (ReportType): report type
+
+        Raises:
+            ConnectionError: no session is connected
+
+        Returns:
+            str: XML report
+        """
+        for _ in range(len(self.connections)):
+            _conn = self.least_loaded()
+            _conn.in_flight += 1
+            try:
+                return await _conn.scheduler.request(_conn.ib, contract, report_type)
+            except ConnectionError:
+                logger.warning("Session %s dropped, rerouting", _conn.endpoint)
+            finally:
+                _conn.in_flight -= 1
+        raise ConnectionError(f"No session connected, {self!r}")
+
+    async def _connect(self, conn: PooledConnection) -> None:
+        """connect one session, errors are logged"""
+        conn.last_connect = time.monotonic()
+        try:
+            if conn.ib.client.isConnected():
+                conn.ib.disconnect()
+            await conn.ib.connectAsync(
+                host=conn.endpoint.host,
+                port=conn.endpoint.port,
+                clientId=conn.endpoint.client_id,
+                timeout=self.timeout,
+                readonly=True,
+            )
+        except (ConnectionError, OSError, asyncio.TimeoutError) as exc:
+            logger.warning("Session %s connect failed: %r", conn.endpoint, exc)
+
+    def _schedule_reconnect(self, conn: PooledConnection) -> None:
+        """reconnect session in the background, at most once per interval"""
+        if conn.reconnecting is not None and not conn.reconnecting.done():
+            return
+        if time.monotonic() - conn.last_connect < self.reconnect_interval:
+            return
+        try:
+            conn.reconnecting = asyncio.get_running_loop().create_task(
+                self._connect(conn)
+            )
+        except RuntimeError:
+            # no running event loop, reconnect on next health check
+            pass
@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+
+#   http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""Pacing-aware fundamental data request scheduler
+
+Requests are started by priority class, no faster than a token bucket rate
+and with a maximum number of requests in flight. Empty responses and
+timeouts are retried with exponential backoff and random jitter.
+
+    >>> scheduler = RequestScheduler(rate=2.0, max_in_flight=10)
+    >>> aapl = CompanyFinancials(ib=ib, symbol="AAPL", scheduler=scheduler)
+"""
+
+__all__ = [
+    "RequestScheduler",
+    "default_priority",
+]
+
+import asyncio
+import heapq
+import itertools
+import random
+import time
+from typing import Optional
+
+from ib_async import IB, Contract
+
+from .metrics import count
+from .objects import ReportType
+
+# lower first
+default_priority: dict[ReportType, int] = {
+    "ReportSnapshot": 0,
+    "ReportsFinSummary": 1,
+    "ReportsFinStatements": 2,
+    "RESC": 3,
+    "CalendarReport": 4,
+    "ReportsOwnership": 5,
+}
+
+
+class RequestScheduler:
+    """Fundamental data request scheduler, share one instance per IB account"""
+
+    # pylint: disable=too-many-arguments,too-many-instance-attributes
+    def __init__(
+        self,
+        rate: Optional[float] = 1.0,
+        burst: int = 5,
+        max_in_flight: int = 5,
+        retries: int = 3,
+        backoff: float = 1.0,
+        timeout: float = 60.0,
+        priority: Optional[dict[ReportType, int]] = None,
+    ):
+        """
+        Args:
+            rate (float, optional): requests per second, None means no rate
+                limit. Defaults to 1.
+            burst (int, optional): token bucket size. Defaults to 5.
+            max_in_flight (int, optional): maximum concurrent requests.
+                Defaults to 5.
+            retries (int, optional): retries on empty response or timeout.
+                Defaults to 3.
+            backoff (float, optional): first retry delay in seconds, doubled
+                on every retry, plus up to 100% jitter. Defaults to 1.
+            timeout (float, optional): timeout in seconds for each attempt,
+                0 means no timeout. Defaults to 60.
+            priority (dict[ReportType, int], optional): priority class by
+                report type, lower first. Updates default_priority.
+
+        Raises:
+            ValueError: on invalid rate, burst or max_in_flight
+        """
+        if rate is not None and rate <= 0:
+            raise ValueError(f"Invalid rate {rate}.")
+        if burst < 1:
+            raise ValueError(f"Invalid burst {burst}.")
+        if max_in_flight < 1:
+            raise ValueError(f"Invalid max_in_flight {max_in_flight}.")
+        self.rate = rate
+        self.burst = burst
+        self.max_in_flight = max_in_flight
+        self.retries = retries
+        self.backoff = backoff
+        self.timeout = timeout
+        self.priority: dict[ReportType, int] = {**default_priority, **(priority or {})}
+        self.in_flight = 0
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._waiters: list[tuple[int, int, asyncio.Future]] = []
+        self._seq = itertools.count()
+        self._timer: Optional[asyncio.TimerHandle] = None
+
+    def __repr__(self):
+        cls_name = self.__class__.__qualname__
+        return (
+            f"{cls_name}(rate={self.rate!r},burst={self.burst!r},"
+            f"max_in_flight={self.max_in_flight!r},retries={self.retries!r})"
+        )
+
+    @property
+    def pending(self) -> int:
+        """requests waiting for a slot"""
+        return sum(not _f.done() for _, _, _f in self._waiters)
+
+    async def request(self, ib: IB, contract: Contract, report_type: ReportType) -> str:
+        """request fundamental data report
+
+        Args:
+            ib (IB): ib async connection
+            contract (Contract): qualified contract
+            report_type (ReportType): report type
+
+        Raises:
+            ValueError: empty response after all retries
+            asyncio.TimeoutError: timeout after all retries
+
+        Returns:
+            str: XML report
+        """
+        _priority = self.priority.get(report_type, len(self.priority))
+        for attempt in range(self.retries + 1):
+            if attempt:
+                count("request.retries")
+                _delay = self.backoff * 2 ** (attempt - 1)
+                await asyncio.sleep(_delay * (1 + random.random()))  # nosec B311
+            await self._acquire(_priority)
+            try:
+                xml = await asyncio.wait_for(
+                    ib.reqFundamentalDataAsync(contract, report_type),
+                    self.timeout or None,
+                )
+            except asyncio.TimeoutError:
+                count("request.timeouts")
+                if attempt == self.retries:
+                    raise
+                continue
+            finally:
+                self._release()
+            if xml:
+                return xml
+        raise ValueError(f"No response for report {report_type}, contract: {contract}")
+
+    async def _acquire(self, priority: int) -> None:
+        """wait for a request slot"""
+        _future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._seq), _future))
+        self._dispatch()
+        try:
+            await _future
+        except asyncio.CancelledError:
+            if _future.done() and not _future.cancelled():
+                # slot was granted, give it back
+                self._release()
+            raise
+
+    def _release(self) -> None:
+        """release a request slot"""
+        self.in_flight -= 1
+        self._dispatch()
+
+    def _refill(self) -> None:
+        """add tokens since last update"""
+        _now = time.monotonic()
+        if self.rate is not None:
+            self._tokens = min(
+                self.burst, self._tokens + (_now - self._updated) * self.rate
+            )
+        self._updated = _now
+
+    def _dispatch(self) -> None:
+        """start waiting requests by priority while slots and tokens last"""
+        self._refill()
+        while self._waiters and self.in_flight < self.max_in_flight:
+            if self.rate is not None and self._tokens < 1:
+                if self._timer is None:
+                    self._timer = asyncio.get_running_loop().call_later(
+                        (1 - self._tokens) / self.rate, self._on_timer
+                    )
+                return
+            _, _, _future = heapq.heappop(self._waiters)
+            if _future.done():
+                continue
+            if self.rate is not None:
+                self._tokens -= 1
+            self.in_flight += 1
+            _future.set_result(None)
+
+    def _on_timer(self) -> None:
+        self._timer = None
+        self._dispatch()
@@ -0,0 +1,395 @@
+#!/usr/bin/env python3
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+
+#   http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""Raw XML report sources and offline replay
+
+A ReportSource returns raw XML reports by symbol and report type, from a
+live IB connection, a directory or zip archive, or memory. ReplayIB serves
+a source through the ib_async.IB methods used by this package, so
+FundamentalData, CompanyFinancials and Universe run on stored reports
+without TWS.
+
+    >>> archive = DirectorySource("reports/")
+    >>> record(IBSource(ib), archive, ["AAPL", "MSFT"])
+    >>> aapl = CompanyFinancials(ib=ReplayIB(archive), symbol="AAPL")
+"""
+
+__all__ = [
+    "DirectorySource",
+    "IBSource",
+    "MemorySource",
+    "ReplayIB",
+    "ReportSource",
+    "record",
+]
+
+import abc
+import asyncio
+import gzip
+import os
+import zipfile
+import zlib
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Iterable, Mapping, Optional
+
+from ib_async import IB, Contract, Ticker, util
+
+from .cache import ContractCache
+from .ib_client import AsyncIBClient, IBClient
+from .objects import ReportType
+from .universe import default_reports
+
+
+class ReportSource(abc.ABC):
+    """Raw XML report source base class
+
+    Subclasses implement get, listed sources implement symbols and writable
+    sources implement put.
+    """
+
+    @abc.abstractmethod
+    def get(self, symbol: str, report_type: ReportType) -> Optional[str]:
+        """get report, None if not available"""
+
+    async def get_async(self, symbol: str, report_type: ReportType) -> Optional[str]:
+        """get report, None if not available"""
+        return self.get(symbol, report_type)
+
+    def put(self, symbol: str, report_type: ReportType, xml: str) -> None:
+        """store report"""
+        raise NotImplementedError
+
+    def symbols(self) -> list[str]:
+        """available symbols"""
+        raise NotImplementedError
+
+
+class MemorySource(ReportSource):
+    """Reports in memory"""
+
+    def __init__(
+        self, reports: Optional[Mapping[str, Mapping[ReportType, str]]] = None
+    ):
+        """
+        Args:
+            reports (Mapping[str, Mapping[ReportType, str]], optional): raw XML
+                by report type, by symbol. Defaults to None, no reports.
+        """
+        self.reports: dict[str, dict[ReportType, str]] = {
+            _s: dict(_r) for _s, _r in (reports or {}).items()
+        }
+
+    def __repr__(self):
+        cls_name = self.__class__.__qualname__
+        return f"{cls_name}(symbols={len(self.reports)!r})"
+
+    def get(self, symbol: str, report_type: ReportType) -> Optional[str]:
+        return self.reports.get(symbol, {}).get(report_type)
+
+    def put(self, symbol: str, report_type: ReportType, xml: str) -> None:
+        self.reports.setdefault(symbol, {})[report_type] = xml
+
+    def symbols(self) -> list[str]:
+        return list(self.reports)
+
+
+class DirectorySource(ReportSource):
+    """Reports in a directory or a zip archive
+
+    One file per report, <symbol>/<report type>.xml, or .xml.gz
+    """
+
+    def __init__(self, path: str | os.PathLike, compress: bool = False):
+        """
+        Args:
+            path (str | os.PathLike): reports directory, or zip file, read only
+            compress (bool, optional): gzip new reports. Defaults to False.
+        """
+        self.path = Path(path)
+        self.compress = compress
+        self._zip: Optional[zipfile.ZipFile] = None
+        if self.path.suffix == ".zip":
+            # pylint: disable-next=consider-using-with
+            self._zip = zipfile.ZipFile(self.path)
+
+    def __repr__(self):
+        cls_name = self.__class__.__qualname__
+        return f"{cls_name}(path={str(self.path)!r})"
+
+    def get(self, symbol: str, report_type: ReportType) -> Optional[str]:
+        for _suffix in (".xml", ".xml.gz"):
+            _name = f"{symbol}/{report_type}{_suffix}"
+            try:
+                if self._zip is not None:
+                    data = self._zip.read(_name)
+                else:
+                    data = (self.path / _name).read_bytes()
+            except (KeyError, FileNotFoundError):
+                continue
+            if _suffix == ".xml.gz":
+                data = gzip.decompress(data)
+            return data.decode()
+        return None
+
+    def put(self, symbol: str, report_type: ReportType, xml: str) -> None:
+        if self._zip is not None:
+            raise ValueError(f"Zip archive {self.path} is read only.")
+        _dir = self.path / symbol
+        _dir.mkdir(parents=True, exist_ok=True)
+        if self.compress:
+            (_dir / f"{report_type}.xml.gz").write_bytes(gzip.compress(xml.encode()))
+        else:
+            (_dir / f"{report_type}.xml").write_text(xml, encoding="utf-8")
+
+    def close(self) -> None:
+        """close zip archive"""
+        if self._zip is not None:
+            self._zip.close()
+
+    def symbols(self) -> list[str]:
+        if self._zip is not None:
+            return sorted(
+                {_n.split("/")[0] for _n in self._zip.namelist() if "/" in _n}
+            )
+        return sorted(_d.name for _d in self.path.iterdir() if _d.is_dir())
+
+
+class IBSource(ReportSource):  # pylint: disable=abstract-method
+    """Reports from a live IB connection, read only, symbols are not listed
+
+    Contracts are qualified once per symbol, unknown symbols are not
+    requested again.
+    """
+
+    def __init__(
+        self,
+        ib: IB,
+        exchange: str = "SMART",
+        currency: str = "USD",
+        contract_cache: Optional[ContractCache] = None,
+    ):
+        """
+        Args:
+            ib (IB): ib async connection
+            exchange (str, optional): exchange. Defaults to "SMART".
+            currency (str, optional): currency. Defaults to "USD".
+            contract_cache (ContractCache, optional): qualified contracts
+                cache. Defaults to None, an in memory cache.
+        """
+        self.ib = ib
+        self.exchange = exchange
+        self.currency = currency
+        self.contract_cache = (
+            contract_cache if contract_cache is not None else ContractCache()
+        )
+        self._unknown: set[str] = set()
+
+    def __repr__(self):
+        cls_name = self.__class__.__qualname__
+        return f"{cls_name}(IB={self.ib!r})"
+
+    def get(self, symbol: str, report_type: ReportType) -> Optional[str]:
+        if symbol in self._unknown:
+            return None
+        _client = IBClient(
+            self.ib,
+            symbol,
+            self.exchange,
+            self.currency,
+            contract_cache=self.contract_cache,
+        )
+        if not _client.contract.conId:
+            self._unknown.add(symbol)
+            return None
+        try:
+            return _client.ib_req_fund(report_type)
+        except ValueError:
+            return None
+
+    async def get_async(self, symbol: str, report_type: ReportType) -> Optional[str]:
+        if symbol in self._unknown:
+            return None
+        _client = AsyncIBClient(
+            self.ib,
+            symbol,
+            self.exchange,
+            self.currency,
+            contract_cache=self.contract_cache,
+        )
+        await _client.qualify_contract()
+        if not _client.contract.conId:
+            self._unknown.add(symbol)
+            return None
+        try:
+            return await _client.ib_req_fund(report_type)
+        except ValueError:
+            return None
+
+
+def record(
+    source: ReportSource,
+    target: ReportSource,
+    symbols: Iterable[str],
+    report_types: Iterable[ReportType] = default_reports,
+) -> int:
+    """copy reports from source to target, ex. from IBSource to an archive
+
+    Args:
+        source (ReportSource): reports source
+        target (ReportSource): writable reports source
+        symbols (Iterable[str]): symbols
+        report_types (Iterable[ReportType], optional): report types.
+            Defaults to all reports but CalendarReport.
+
+    Returns:
+        int: reports copied, missing reports are skipped
+    """
+    _copied = 0
+    _report_types = tuple(report_types)
+    for _symbol in symbols:
+        for _report_type in _report_types:
+            if xml := source.get(_symbol, _report_type):
+                target.put(_symbol, _report_type, xml)
+                _copied += 1
+    return _copied
+
+
+class ReplayIB:
+    """Offline stand-in for ib_async.IB serving reports from a ReportSource
+
+    Contracts of the source symbols are qualified with a stable conId, other
+    symbols are unknown. Missing reports are empty responses, like TWS.
+    Market data tickers are set from ticks by symbol, other tickers never
+    receive ticks.
+    """
+
+    # pylint: disable=invalid-name,unused-argument
+    # pylint: disable=too-many-instance-attributes
+    run = staticmethod(util.run)
+
+    def __init__(
+        self,
+        source: ReportSource,
+        latency: float = 0.0,
+        ticks: Optional[Mapping[str, Mapping[str, Any]]] = None,
+    ):
+        """
+        Args:
+            source (ReportSource): reports source
+            latency (float, optional): seconds to wait before each async
+                report response. Defaults to 0.
+            ticks (Mapping[str, Mapping[str, Any]], optional): ticker
+                attributes by symbol, ex. {"AAPL": {"fundamentalRatios":
+                FundamentalRatios(...), "dividends": Dividends(...)}}.
+                Defaults to None, no ticks.
+        """
+        self.source = source
+        self.latency = latency
+        self.ticks = {_s: dict(_t) for _s, _t in (ticks or {}).items()}
+        self.requests = 0
+        self._connected = True
+        self._symbols = set(source.symbols())
+        self._tickers: dict[int, Ticker] = {}
+        self.client = SimpleNamespace(
+            host="replay", port=0, clientId=0, isConnected=self.isConnected
+        )
+
+    def __repr__(self):
+        cls_name = self.__class__.__qualname__
+        return f"{cls_name}(source={self.source!r})"
+
+    def isConnected(self) -> bool:
+        """connected until disconnect"""
+        return self._connected
+
+    def connect(self, *args, **kwargs) -> "ReplayIB":
+        """reconnect"""
+        self._connected = True
+        return self
+
+    async def connectAsync(self, *args, **kwargs) -> "ReplayIB":
+        """reconnect"""
+        return self.connect()
+
+    def disconnect(self) -> None:
+        """disconnect"""
+        self._connected = False
+
+    def qualifyContracts(self, *contracts: Contract) -> list[Optional[Contract]]:
+        """qualify contracts of source symbols"""
+        _qualified: list[Optional[Contract]] = []
+        for _contract in contracts:
+            if _contract.symbol not in self._symbols:
+                _qualified.append(None)
+                continue
+            _contract.conId = zlib.crc32(_contract.symbol.encode())
+            _contract.primaryExchange = _contract.primaryExchange or "REPLAY"
+            _qualified.append(_contract)
+        return _qualified
+
+    async def qualifyContractsAsync(
+        self, *contracts: Contract
+    ) -> list[Optional[Contract]]:
+        """qualify contracts of source symbols"""
+        return self.qualifyContracts(*contracts)
+
+    def reqFundamentalData(
+        self, contract: Contract, reportType: str, fundamentalDataOptions=None
+    ) -> str:
+        """source report, empty if not available"""
+        self._check_connected()
+        self.requests += 1
+        return self.source.get(contract.symbol, reportType) or ""  # type: ignore
+
+    async def reqFundamentalDataAsync(
+        self, contract: Contract, reportType: str, fundamentalDataOptions=None
+    ) -> str:
+        """source report, empty if not available"""
+        self._check_connected()
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        self.requests += 1
+        return (
+            await self.source.get_async(contract.symbol, reportType)  # type: ignore
+            or ""
+        )
+
+    def reqMktData(self, contract: Contract, *args, **kwargs) -> Ticker:
+        """ticker with the contract symbol ticks"""
+        if (_ticker := self._tickers.get(id(contract))) is None:
+            _ticker = self._tickers[id(contract)] = Ticker(contract=contract)
+            for _name, _value in self.ticks.get(contract.symbol, {}).items():
+                setattr(_ticker, _name, _value)
+        return _ticker
+
+    def ticker(self, contract: Contract) -> Optional[Ticker]:
+        """ticker of a contract, None if not requested"""
+        return self._tickers.get(id(contract))
+
+    def cancelMktData(self, contract: Contract) -> None:
+        """cancel ticker"""
+        self._tickers.pop(id(contract), None)
+
+    def tickers(self) -> list[Ticker]:
+        """active tickers"""
+        return list(self._tickers.values())
+
+    def _check_connected(self) -> None:
+        if not self._connected:
+            raise ConnectionError("Not connected")
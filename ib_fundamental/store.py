@@ -0,0 +1,285 @@
+#!/usr/bin/env python3
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+
+#   http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""Arrow/Parquet store for parsed fundamental data
+
+Parsed datasets are written column-wise, one file per dataset, symbol and
+report date, in a hive partitioned layout
+
+    <root>/<dataset>/symbol=<symbol>/report_date=<YYYY-MM-DD>/part-0.<format>
+
+Arrow IPC files are written uncompressed so they can be memory-mapped back
+without copying, Parquet files are smaller but are decoded on read.
+
+Requires pyarrow, ``pip install ib_fundamental[arrow]``.
+
+    >>> store = FundamentalStore("fundamentals/")
+    >>> store.write(FundamentalData(ib=ib, symbol="AAPL"))
+    >>> store.read("eps", symbols=["AAPL"]).to_pandas()
+"""
+
+__all__ = [
+    "FundamentalStore",
+    "dataset_names",
+    "to_table",
+]
+
+import dataclasses
+from datetime import date
+from pathlib import Path
+from typing import Any, Callable, Iterable, Literal, Optional, Union
+
+from pandas import DataFrame
+
+from .objects import DividendPerShare, EarningsPerShare, RatioSnapshot, Revenue
+from .panel import statement_panel
+from .xml_parser import XMLParser
+
+try:
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+    import pyarrow.feather as pf
+    import pyarrow.parquet as pq
+    from pyarrow.fs import LocalFileSystem
+except ImportError:  # pragma: no cover
+    pa = None  # pylint: disable=invalid-name
+
+StoreFormat = Literal["arrow", "parquet"]
+
+file_format: dict[StoreFormat, str] = {"arrow": "ipc", "parquet": "parquet"}
+
+
+def _statements(parser: XMLParser) -> DataFrame:
+    return statement_panel({"": parser}).drop(columns="symbol")
+
+
+def _eps(parser: XMLParser) -> list[EarningsPerShare]:
+    return parser.get_eps(report_type="TTM") + parser.get_eps(
+        report_type="R", period="3M"
+    )
+
+
+def _revenue(parser: XMLParser) -> list[Revenue]:
+    return parser.get_revenue(report_type="TTM") + parser.get_revenue(
+        report_type="R", period="3M"
+    )
+
+
+def _dividends_ps(parser: XMLParser) -> list[DividendPerShare]:
+    return (parser.get_div_per_share(report_type="TTM") or []) + (
+        parser.get_div_per_share(report_type="R", period="3M") or []
+    )
+
+
+def _ratios(parser: XMLParser) -> list[RatioSnapshot]:
+    return [parser.get_ratios()]
+
+
+# dataset name: XMLParser accessor, same data as FundamentalData properties
+datasets: dict[str, Callable[[XMLParser], Union[DataFrame, list, None]]] = {
+    "statements": _statements,
+    "coa_map": lambda parser: parser.get_map_items(),
+    "eps": _eps,
+    "revenue": _revenue,
+    "dividends": lambda parser: parser.get_dividend(),
+    "dividends_ps": _dividends_ps,
+    "ownership": lambda parser: parser.get_ownership_report().ownership_details,
+    "fy_estimates": lambda parser: parser.get_fy_estimates(),
+    "fy_actuals": lambda parser: parser.get_fy_actuals(),
+    "ratios": _ratios,
+}
+dataset_names: tuple[str, ...] = tuple(datasets)
+
+
+def to_table(objs: Union["pa.Table", DataFrame, list, None]) -> "pa.Table":
+    """Arrow table from a data frame or a list of dataclasses
+
+    Dataclasses are read field by field into columns, without asdict.
+
+    Args:
+        objs (pa.Table | DataFrame | list | None): arrow table, data frame or
+            list of same type dataclasses
+
+    Returns:
+        pa.Table: arrow table, empty for None or an empty list
+    """
+    if isinstance(objs, pa.Table):
+        return objs
+    if isinstance(objs, DataFrame):
+        return pa.Table.from_pandas(objs, preserve_index=False)
+    if not objs:
+        return pa.table({})
+    _fields = [_f.name for _f in dataclasses.fields(objs[0])]
+    return pa.table({_f: [getattr(_o, _f) for _o in objs] for _f in _fields})
+
+
+class FundamentalStore:
+    """Parsed fundamental data on disk, partitioned by symbol and report date"""
+
+    def __init__(self, root: Union[str, Path], format: StoreFormat = "arrow"):
+        """
+        Args:
+            root (str | Path): store directory
+            format (StoreFormat, optional): arrow (IPC, memory-mapped on read)
+                or parquet. Defaults to "arrow".
+        """
+        # pylint: disable=redefined-builtin
+        if pa is None:
+            raise ImportError(
+                "FundamentalStore requires pyarrow, "
+                "pip install ib_fundamental[arrow]"
+            )
+        if format not in file_format:
+            raise ValueError(f"Unknown store format {format!r}")
+        self.root = Path(root)
+        self.format = format
+        self.filesystem = LocalFileSystem(use_mmap=True)
+
+    def __repr__(self):
+        cls_name = self.__class__.__qualname__
+        return f"{cls_name}(root={str(self.root)!r},format={self.format!r})"
+
+    def path(self, name: str, symbol: str, report_date: date) -> Path:
+        """dataset partition file path"""
+        return (
+            self.root
+            / name
+            / f"symbol={symbol}"
+            / f"report_date={report_date.isoformat()}"
+            / f"part-0.{self.format}"
+        )
+
+    def write_table(
+        self, name: str, symbol: str, table: "pa.Table", report_date: date
+    ) -> Path:
+        """write one dataset partition, replacing an existing one
+
+        Args:
+            name (str): dataset name
+            symbol (str): symbol partition
+            table (pa.Table): dataset table
+            report_date (date): report date partition
+
+        Returns:
+            Path: file path
+        """
+        _path = self.path(name, symbol, report_date)
+        _path.parent.mkdir(parents=True, exist_ok=True)
+        if self.format == "arrow":
+            pf.write_feather(table, _path, compression="uncompressed")
+        else:
+            pq.write_table(table, _path)
+        return _path
+
+    def write(
+        self,
+        data: Any,
+        report_date: Optional[date] = None,
+        names: Iterable[str] = dataset_names,
+    ) -> dict[str, Path]:
+        """write FundamentalData parsed datasets
+
+        Args:
+            data (FundamentalData): company fundamental data
+            report_date (date, optional): report date partition.
+                Defaults to today.
+            names (Iterable[str], optional): datasets to write.
+                Defaults to all datasets.
+
+        Returns:
+            dict[str, Path]: file path by dataset name, empty datasets are
+                not written
+        """
+        report_date = report_date or date.today()
+        paths = {}
+        for name in names:
+            if name not in datasets:
+                raise ValueError(f"Unknown dataset {name!r}")
+            objs = datasets[name](data.parser)
+            if objs is None or len(objs) == 0:
+                continue
+            paths[name] = self.write_table(
+                name, data.symbol, to_table(objs), report_date
+            )
+        return paths
+
+    def write_frames(
+        self,
+        symbol: str,
+        frames: dict[str, Union[DataFrame, "pa.Table"]],
+        report_date: Optional[date] = None,
+    ) -> dict[str, Path]:
+        """write parsed datasets, ex. ParsePipeline results
+
+        Args:
+            symbol (str): symbol partition
+            frames (dict[str, DataFrame | pa.Table]): data frame or arrow
+                table by dataset name
+            report_date (date, optional): report date partition.
+                Defaults to today.
+
+        Returns:
+            dict[str, Path]: file path by dataset name
+        """
+        report_date = report_date or date.today()
+        return {
+            _name: self.write_table(_name, symbol, to_table(_frame), report_date)
+            for _name, _frame in frames.items()
+            if len(_frame)
+        }
+
+    def dataset(self, name: str) -> "ds.Dataset":
+        """arrow dataset, symbol and report_date are partition columns"""
+        return ds.dataset(
+            str(self.root / name),
+            format=file_format[self.format],
+            filesystem=self.filesystem,
+            partitioning=ds.partitioning(
+                pa.schema([("symbol", pa.string()), ("report_date", pa.date32())]),
+                flavor="hive",
+            ),
+        )
+
+    def read(
+        self,
+        name: str,
+        symbols: Optional[Iterable[str]] = None,
+        report_dates: Optional[Iterable[date]] = None,
+        columns: Optional[list[str]] = None,
+    ) -> "pa.Table":
+        """read a dataset, files are memory-mapped
+
+        Args:
+            name (str): dataset name
+            symbols (Iterable[str], optional): symbols. Defaults to all.
+            report_dates (Iterable[date], optional): report dates.
+                Defaults to all.
+            columns (list[str], optional): columns. Defaults to all.
+
+        Returns:
+            pa.Table: dataset table
+        """
+        if not (self.root / name).is_dir():
+            raise ValueError(f"Dataset {name!r} not found in {self.root}")
+        _filter = None
+        if symbols is not None:
+            _filter = ds.field("symbol").isin(list(symbols))
+        if report_dates is not None:
+            _dates = ds.field("report_date").isin(list(report_dates))
+            _filter = _dates if _filter is None else _filter & _dates
+        return self.dataset(name).to_table(columns=columns, filter=_filter)
@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+
+#   http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""Batch fundamental data requests for a universe of symbols"""
+
+__all__ = [
+    "SymbolReports",
+    "Universe",
+]
+
+import asyncio
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterable, Optional, Union, get_args
+
+from ib_async import IB, Dividends, FundamentalRatios, Stock
+
+from .cache import ContractCache, ReportCache, ReportKey
+from .ib_client import qualify_contracts_async, req_ticks_async
+from .objects import ReportType
+from .pool import ConnectionPool
+from .scheduler import RequestScheduler
+
+# all but calendar, it requires a subscription
+default_reports: tuple[ReportType, ...] = tuple(
+    _r for _r in get_args(ReportType) if _r != "CalendarReport"
+)
+
+
+@dataclass(slots=True)
+class SymbolReports:
+    """Raw XML reports and request errors for one symbol"""
+
+    symbol: str
+    contract: Optional[Stock] = None
+    reports: dict[ReportType, str] = field(default_factory=dict)
+    errors: dict[ReportType, Exception] = field(default_factory=dict)
+
+    @property
+    def ok(self) -> bool:
+        """all reports were received"""
+        return not self.errors
+
+
+class Universe:
+    """Fundamental data for a list of symbols over one IB connection or a
+    connection pool"""
+
+    # pylint: disable=too-many-arguments,too-many-instance-attributes
+    def __init__(
+        self,
+        ib: Union[IB, ConnectionPool],
+        symbols: Iterable[str],
+        exchange: str = "SMART",
+        currency: str = "USD",
+        max_in_flight: int = 10,
+        reports: Iterable[ReportType] = default_reports,
+        timeout: float = 60.0,
+        cache: Optional[ReportCache] = None,
+        contract_cache: Optional[ContractCache] = None,
+        scheduler: Optional[RequestScheduler] = None,
+    ):
+        """
+        Args:
+            ib (IB | ConnectionPool): ib async connection, or a connection
+                pool to spread report requests over several sessions
+            symbols (Iterable[str]): list of symbols
+            exchange (str, optional): exchange. Defaults to "SMART".
+            currency (str, optional): currency. Defaults to "USD".
+            max_in_flight (int, optional): maximum number of concurrent
+                report requests. Defaults to 10.
+            reports (Iterable[ReportType], optional): report types to request.
+                Defaults to all reports but CalendarReport.
+            timeout (float, optional): timeout in seconds for each report
+                request, 0 means no timeout. Defaults to 60.
+            cache (ReportCache, optional): persistent raw XML report cache.
+                Defaults to None.
+            contract_cache (ContractCache, optional): qualified contracts
+                cache. Defaults to None.
+            scheduler (RequestScheduler, optional): report requests pacing
+                and retries, max_in_flight and timeout are not used. Defaults
+                to a scheduler with max_in_flight, timeout, no rate limit and
+                no retries. Not used with a connection pool, every session
+                has its own scheduler.
+
+        Raises:
+            ValueError: on empty symbol list, invalid max_in_flight,
+                IB not connected
+        """
+        self.pool = ib if isinstance(ib, ConnectionPool) else None
+        self._ib = ib
+        self.symbols: list[str] = list(dict.fromkeys(symbols))
+        if not self.symbols:
+            raise ValueError("No symbols defined.")
+        if max_in_flight < 1:
+            raise ValueError(f"Invalid max_in_flight {max_in_flight}.")
+        if not (self.pool.is_connected() if self.pool else ib.isConnected()):
+            raise ValueError("IB is not connected.")
+        self.exchange = exchange
+        self.currency = currency
+        self.max_in_flight = max_in_flight
+        self.reports: tuple[ReportType, ...] = tuple(reports)
+        self.timeout = timeout
+        self.cache = cache
+        self.contract_cache = contract_cache
+        self.scheduler = scheduler or RequestScheduler(
+            rate=None, max_in_flight=max_in_flight, retries=0, timeout=timeout
+        )
+
+    def __repr__(self):
+        cls_name = self.__class__.__qualname__
+        return (
+            f"{cls_name}(symbols={len(self.symbols)!r},"
+            f"max_in_flight={self.max_in_flight!r},IB={self.ib!r})"
+        )
+
+    @property
+    def ib(self) -> IB:
+        """ib async connection, least loaded session with a connection pool"""
+        return self.pool.ib if self.pool is not None else self._ib
+
+    def fetch(self) -> dict[str, SymbolReports]:
+        """request all reports for all symbols, blocking"""
+        return self.ib.run(self.fetch_async())
+
+    async def fetch_async(
+        self, on_symbol: Optional[Callable[[SymbolReports], Any]] = None
+    ) -> dict[str, SymbolReports]:
+        """request all reports for all symbols
+
+        Args:
+            on_symbol (Callable[[SymbolReports], Any], optional): called as
+                soon as all reports of a qualified symbol are done.
+                Defaults to None.
+
+        Returns:
+            dict[str, SymbolReports]: reports and errors by symbol
+        """
+        results = {_s: SymbolReports(symbol=_s) for _s in self.symbols}
+        contracts = await self.qualify_async()
+        requests = []
+        for _symbol, _contract in zip(self.symbols, contracts):
+            _result = results[_symbol]
+            if _contract is None:
+                _error = ValueError(f"Unknown contract for symbol {_symbol}")
+                _result.errors = dict.fromkeys(self.reports, _error)
+                continue
+            _result.contract = _contract
+            requests.append(self._fetch_symbol(_result, on_symbol))
+        await asyncio.gather(*requests)
+        return results
+
+    def fundamental_ratios(
+        self, timeout: float = 2.0
+    ) -> dict[str, FundamentalRatios | None]:
+        """fundamental ratios tick for all symbols, blocking"""
+        return self.ib.run(self.ticks_async("fundamentalRatios", timeout))
+
+    def dividends(self, timeout: float = 2.0) -> dict[str, Dividends | None]:
+        """dividends tick for all symbols, blocking"""
+        return self.ib.run(self.ticks_async("dividends", timeout))
+
+    async def ticks_async(self, name: str, timeout: float = 2.0) -> dict[str, Any]:
+        """subscribe fundamental ticks for all symbols, up to max_in_flight
+        market data lines at once
+
+        Args:
+            name (str): ticker attribute, fundamentalRatios or dividends
+            timeout (float, optional): timeout in seconds for each symbol.
+                Defaults to 2.
+
+        Returns:
+            dict[str, Any]: ticker attribute by symbol, None on unknown
+                contract or timeout
+        """
+        contracts = await self.qualify_async()
+        _qualified = {
+            _s: _c for _s, _c in zip(self.symbols, contracts) if _c is not None
+        }
+        _ticks = await req_ticks_async(
+            self.ib,
+            list(_qualified.values()),
+            name=name,
+            timeout=timeout,
+            max_lines=self.max_in_flight,
+        )
+        results: dict[str, Any] = dict.fromkeys(self.symbols)
+        results.update(zip(_qualified, _ticks))
+        return results
+
+    async def qualify_async(self) -> list[Optional[Stock]]:
+        """qualify all symbols, contract_cache misses in one request batch"""
+        return await qualify_contracts_async(
+            self.ib,
+            self.symbols,
+            exchange=self.exchange,
+            currency=self.currency,
+            cache=self.contract_cache,
+        )
+
+    async def _fetch_symbol(
+        self,
+        result: SymbolReports,
+        on_symbol: Optional[Callable[[SymbolReports], Any]] = None,
+    ) -> None:
+        """request all reports for one symbol"""
+        await asyncio.gather(*(self._req_fund(result, _r) for _r in self.reports))
+        if on_symbol is not None:
+            on_symbol(result)
+
+    async def _req_fund(self, result: SymbolReports, report: ReportType) -> None:
+        """request one report, results and errors are stored in result"""
+        _key = ReportKey.from_contract(result.contract, report)
+        if self.cache is not None and (xml := self.cache.get(_key)) is not None:
+            result.reports[report] = xml
+            return
+        try:
+            if self.pool is not None:
+                xml = await self.pool.request(result.contract, report)
+            else:
+                xml = await self.scheduler.request(self.ib, result.contract, report)
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            result.errors[report] = exc
+            return
+        result.reports[report] = xml
+        if self.cache is not None:
+            self.cache.set(_key, xml)
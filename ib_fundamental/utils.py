@@ -20,20 +20,38 @@
 ib_fundamental utility functions
 """
 
+import copy
 import dataclasses
 import datetime
+import functools
+import hashlib
 import json
 import re
-from typing import Any, Optional
+import types
+from typing import Any, Iterable, Optional, Union, get_args, get_origin
 
+import numpy as np
 from ib_async import FundamentalRatios
-from pandas import DataFrame, Index, concat
+from pandas import DataFrame, Index, Series, Timestamp, concat
 
-from .objects import StatementCode, StatementData, StatementMapping, statement_type
+from .metrics import timed
+from .objects import (
+    FinancialStatement,
+    PeriodType,
+    StatementCode,
+    StatementData,
+    StatementIndex,
+    StatementMapping,
+    StatementSet,
+    coa_codes,
+    header_fields,
+    statement_type,
+)
 
 re_pattern = re.compile(r"(?<=[a-z])(?=[A-Z])|(?<=[A-Z])(?=[A-Z][a-z])")
 
 
+@timed("to_dataframe")
 def to_dataframe(table: Any, key: Optional[str] = None) -> DataFrame:
     """converts a list of dicts to a data frame
     Args:
@@ -54,6 +72,77 @@ def camel_to_snake(camel: str) -> str:
     return re_pattern.sub("_", camel).lower()
 
 
+def content_hash(data: Union[str, bytes]) -> str:
+    """hash of a raw report or report fragment"""
+    if isinstance(data, str):
+        data = data.encode()
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+@functools.cache
+def _container_fields(cls: type) -> tuple[str, ...]:
+    """names of the list and dict fields of a dataclass"""
+
+    def _is_container(tp: Any) -> bool:
+        if isinstance(tp, types.UnionType) or get_origin(tp) is Union:
+            return any(_is_container(_t) for _t in get_args(tp))
+        return (get_origin(tp) or tp) in (list, dict)
+
+    return tuple(_f.name for _f in dataclasses.fields(cls) if _is_container(_f.type))
+
+
+def detach(result: Any) -> Any:
+    """caller copy of a shared result, e.g. a memoized parser result
+
+    Data frames, lists and dicts are copied, dataclasses with list or dict
+    fields are copied with those fields. Row objects and read only arrays
+    are shared.
+    """
+    if isinstance(result, DataFrame):
+        return result.copy()
+    if isinstance(result, (list, dict)):
+        return result.copy()
+    if dataclasses.is_dataclass(result) and (
+        _fields := _container_fields(type(result))
+    ):
+        _copy = copy.copy(result)
+        for _name in _fields:
+            if (_value := getattr(_copy, _name)) is not None:
+                setattr(_copy, _name, _value.copy())
+        return _copy
+    return result
+
+
+# date converters keep up to 8192 distinct strings, the same few hundred
+# dates repeat across reports and symbols
+@functools.lru_cache(maxsize=8192)
+def parse_date(value: str) -> datetime.datetime:
+    """ISO date or datetime string to datetime, memoized"""
+    return datetime.datetime.fromisoformat(value)
+
+
+@functools.lru_cache(maxsize=8192)
+def parse_timestamp(value: str) -> Timestamp:
+    """ISO date or datetime string to pandas Timestamp, memoized, same value
+    as pd.to_datetime without its per call overhead"""
+    return Timestamp(value)
+
+
+def to_datetime64(values: Iterable[str], unit: str = "s") -> np.ndarray:
+    """ISO date or datetime strings to datetime64 in one conversion
+
+    Args:
+        values (Iterable[str]): date strings, a column
+        unit (str, optional): datetime64 unit. Defaults to "s".
+
+    Returns:
+        np.ndarray: datetime64[unit] array
+    """
+    if not isinstance(values, (list, tuple, np.ndarray)):
+        values = list(values)
+    return np.array(values, dtype=f"datetime64[{unit}]")
+
+
 def to_json(obj: Any, **kwargs: Any) -> str:
     """Convert FundamentalData attributes to JSON"""
 
@@ -61,6 +150,8 @@ def to_json(obj: Any, **kwargs: Any) -> str:
         """JSON encoder for dataclasses and datetime"""
 
         def default(self, o):
+            if isinstance(o, StatementSet):
+                return list(o)
             if dataclasses.is_dataclass(o):
                 return dataclasses.asdict(o)
             if isinstance(o, (datetime.date, datetime.datetime)):
@@ -102,6 +193,7 @@ def join_df(data: DataFrame, header: DataFrame, mapping: DataFrame) -> DataFrame
     return _df
 
 
+@timed("build_statement")
 def build_statement(
     data: StatementData, statement_code: StatementCode, mapping: StatementMapping
 ) -> DataFrame:
@@ -113,3 +205,115 @@ def build_statement(
     _header = get_df_header(data=_data, statement_code=statement_code)
     # pp
     return join_df(data=_data, header=_header, mapping=_map)
+
+
+header_defaults = {_f: getattr(FinancialStatement(), _f) for _f in header_fields}
+
+
+def build_statement_set(
+    index: StatementIndex,
+    statement: StatementCode,
+    period: PeriodType,
+    fperiods: Optional[list[dict[str, str]]] = None,
+) -> StatementSet:
+    """array backed statements from the statement index
+
+    Args:
+        index (StatementIndex): ReportsFinStatements index
+        statement (StatementCode): INC, BAL or CAS
+        period (PeriodType): annual or quarter
+        fperiods (list[dict[str, str]], optional): period headers, a subset
+            of index.periods[period]. Defaults to None, every period.
+
+    Returns:
+        StatementSet: one row per fiscal period, in document order
+    """
+    if fperiods is None:
+        fperiods = index.periods[period]
+    _items = [
+        index.items.get((period, _p["end_date"], statement)) or {} for _p in fperiods
+    ]
+    codes = coa_codes[statement]
+    _extra = {_c for _i in _items for _c in _i}.difference(codes)
+    if _extra:
+        codes += tuple(sorted(_extra))
+    _column = {_c: _j for _j, _c in enumerate(codes)}
+    values = np.full((len(fperiods), len(codes)), np.nan)
+    for _i, _period_items in enumerate(_items):
+        if _period_items:
+            values[_i, [_column[_c] for _c in _period_items]] = list(
+                _period_items.values()
+            )
+    header = {
+        _f: np.array([_p[_f] for _p in fperiods], dtype=object)
+        for _f in (fperiods[0] if fperiods else ())
+    }
+    return StatementSet(statement, codes, values, header)
+
+
+@timed("build_statement_frame")
+def build_statement_frame(
+    data: Union[StatementIndex, StatementSet],
+    statement_code: StatementCode,
+    period: PeriodType,
+    mapping: StatementMapping,
+) -> DataFrame:
+    """build statement from array backed statements or the statement index
+
+    Same layout as build_statement, values are filled in a float64
+    coaCode x period array without building statement dataclasses.
+
+    Args:
+        data (StatementIndex | StatementSet): ReportsFinStatements index, or
+            the statement_code and period statements
+        statement_code (StatementCode): INC, BAL or CAS
+        period (PeriodType): annual or quarter
+        mapping (StatementMapping): statement map items
+
+    Returns:
+        DataFrame: statement by line_id, one column per period end date
+    """
+    # pylint: disable=too-many-locals
+    if isinstance(data, StatementIndex):
+        data = build_statement_set(data, statement_code, period)
+    # oldest period first, same as build_statement
+    data = data[::-1]
+    _column = {_c: _j for _j, _c in enumerate(data.codes)}
+    codes = [_m.coa_item.lower() for _m in mapping]
+    values = np.full((len(codes), len(data)), np.nan)
+    _rows = [_i for _i, _c in enumerate(codes) if _c in _column]
+    values[_rows] = data.values[:, [_column[codes[_i]] for _i in _rows]].T
+    # drop line items with missing values, header rows with None
+    keep = ~np.isnan(values).any(axis=1)
+    _header_rows = [
+        (
+            data.header[_f].tolist()
+            if _f in data.header
+            else [header_defaults[_f]] * len(data)
+        )
+        for _f in header_fields
+    ]
+    _header_keep = [None not in _row for _row in _header_rows]
+    _rows = [_r for _r, _k in zip(_header_rows, _header_keep) if _k]
+    frame = np.empty((len(_rows) + int(keep.sum()), len(data)), dtype=object)
+    frame[: len(_rows)] = _rows
+    frame[len(_rows) :] = values[keep]
+    map_item = [_f for _f, _k in zip(header_fields, _header_keep) if _k] + [
+        _m.map_item for _m, _k in zip(mapping, keep) if _k
+    ]
+    line_id = [_i for _i, _k in enumerate(_header_keep) if _k] + [
+        _m.line_id for _m, _k in zip(mapping, keep) if _k
+    ]
+    _index = Index(line_id, name="line_id")
+    # object columns, mixed header strings and floats as in build_statement
+    return DataFrame(
+        {
+            "map_item": map_item,
+            **{
+                _end: Series(frame[:, j], index=_index, dtype=object)
+                for j, _end in enumerate(data.header.get("end_date", ()))
+            },
+            "statement_type": [statement_type[statement_code]] * len(map_item),
+        },
+        index=_index,
+    )
@@ -0,0 +1,267 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+
+#   http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""Synthetic IB fundamental XML reports, same layout as TWS reports
+
+Values are random but reproducible for a given seed, for offline tests,
+benchmarks and ReplayIB sessions.
+
+    >>> ib = ReplayIB(MemorySource({"AAPL": xml_factory.reports("AAPL")}))
+"""
+
+__all__ = [
+    "fin_statements",
+    "fin_summary",
+    "ownership",
+    "reports",
+    "resc",
+    "snapshot",
+]
+
+import random
+import zlib
+from datetime import date, timedelta
+
+from .objects import ReportType
+
+# fmt: off
+coa_codes = {
+    "INC": [
+        "SREV", "RTLR", "SCOR", "SGRP", "SSGA", "ERAD", "ETOE", "SOPI", "EIBT",
+        "TTAX", "TIAT", "NIBX", "NINC", "SDNI", "SDWS", "SDBF", "DDPS1", "VDES",
+    ],
+    "BAL": [
+        "ACSH", "ACAE", "ASTI", "SCSI", "AACR", "ATRC", "AITL", "ATCA", "APTC",
+        "ATOT", "LAPB", "LTCL", "LTTD", "LTLL", "QTLE", "QTEL", "QTCO",
+    ],
+    "CAS": [
+        "ONET", "SDED", "SOCF", "OTLO", "SCEX", "SICF", "ITLI", "SFCF", "FCDP",
+        "FTLF", "SNCC",
+    ],
+}
+# fmt: on
+
+
+def _quarters(n: int, day: int = 28):
+    """(fiscal year, quarter, end date), latest first"""
+    for i in range(n):
+        _year, _quarter = 2024 - i // 4, 4 - i % 4
+        yield _year, _quarter, date(_year, _quarter * 3, day)
+
+
+def fin_statements(
+    symbol: str = "AAPL", n_annual: int = 6, n_interim: int = 8, seed: int = 0
+) -> str:
+    """ReportsFinStatements, about 10% of line items are missing"""
+    rnd = random.Random(seed)  # nosec B311
+    out = [
+        '<?xml version="1.0" encoding="UTF-8"?>',
+        '<ReportFinancialStatements Major="1" Minor="0" Revision="1">',
+        '<CoIDs><CoID Type="RepNo">05680</CoID>',
+        f'<CoID Type="CompanyName">{symbol} Inc</CoID></CoIDs>',
+        '<Issues><Issue ID="1" Type="C" Desc="Common Stock" Order="1">',
+        f'<IssueID Type="Ticker">{symbol}</IssueID>',
+        '<Exchange Code="NASD" Country="USA">NASDAQ</Exchange></Issue></Issues>',
+        "<FinancialStatements><COAMap>",
+    ]
+    _line = 100
+    for _statement, _codes in coa_codes.items():
+        for _code in _codes:
+            out.append(
+                f'<mapItem coaItem="{_code}" statementType="{_statement}" '
+                f'lineID="{_line}" precision="1">Item {_code.title()}</mapItem>'
+            )
+            _line += 10
+    out.append("</COAMap>")
+
+    def _period(kind: str, end: date, year: int, number=None) -> str:
+        _attrs = f'Type="{kind}" EndDate="{end.isoformat()}" FiscalYear="{year}"'
+        if number is not None:
+            _attrs += f' FiscalPeriodNumber="{number}"'
+        _source = (end + timedelta(days=35)).isoformat()
+        _form, _length = ("10-K", 12) if kind == "Annual" else ("10-Q", 3)
+        _out = [f"<FiscalPeriod {_attrs}>"]
+        for _statement, _codes in coa_codes.items():
+            _out.append(
+                f'<Statement Type="{_statement}"><FPHeader>'
+                f"<PeriodLength>{_length}</PeriodLength>"
+                '<periodType Code="M">Months</periodType>'
+                '<UpdateType Code="UPD">Updated Normal</UpdateType>'
+                f"<StatementDate>{end.isoformat()}</StatementDate>"
+                f'<Source Date="{_source}">{_form}</Source></FPHeader>'
+            )
+            _out.extend(
+                f'<lineItem coaCode="{_code}">{rnd.uniform(-1e3, 1e5):.2f}</lineItem>'
+                for _code in _codes
+                if rnd.random() < 0.9
+            )
+            _out.append("</Statement>")
+        _out.append("</FiscalPeriod>")
+        return "".join(_out)
+
+    out.append("<AnnualPeriods>")
+    out.extend(
+        _period("Annual", date(2023 - i, 9, 30), 2023 - i) for i in range(n_annual)
+    )
+    out.append("</AnnualPeriods><InterimPeriods>")
+    out.extend(
+        _period("Interim", _end, _year, _quarter)
+        for _year, _quarter, _end in _quarters(n_interim)
+    )
+    out.append("</InterimPeriods></FinancialStatements></ReportFinancialStatements>")
+    return "".join(out)
+
+
+def fin_summary(n: int = 12, seed: int = 0) -> str:
+    """ReportsFinSummary, n quarters"""
+    rnd = random.Random(seed)  # nosec B311
+    _dates = [_end.isoformat() for _, _, _end in _quarters(n, day=30)]
+    out = ["<FinancialSummary>"]
+    for _section, _tag in (
+        ("TotalRevenues", "TotalRevenue"),
+        ("DividendPerShares", "DividendPerShare"),
+        ("EPSs", "EPS"),
+    ):
+        out.append(f'<{_section} currency="USD">')
+        for _date in _dates:
+            for _type, _period in (("TTM", "12M"), ("R", "3M"), ("P", "3M")):
+                out.append(
+                    f'<{_tag} asofDate="{_date}" reportType="{_type}" '
+                    f'period="{_period}">{rnd.uniform(0, 100):.3f}</{_tag}>'
+                )
+        out.append(f"</{_section}>")
+    out.append('<Dividends currency="USD">')
+    out.extend(
+        f'<Dividend type="CD" exDate="{_date}" recordDate="{_date}" '
+        f'payDate="{_date}" declarationDate="">0.24</Dividend>'
+        for _date in _dates
+    )
+    out.append("</Dividends></FinancialSummary>")
+    return "".join(out)
+
+
+def snapshot() -> str:
+    """ReportSnapshot, ratios and forecast data"""
+    ratios = {
+        "NPRICE": "169.3",
+        "NHIG": "199.6",
+        "NLOW": "164.1",
+        "PDATE": "2024-04-26T00:00:00",
+        "VOL10DAVG": "55.1",
+        "EV": "2600000",
+        "MKTCAP": "2612000",
+        "TTMREV": "381623",
+        "TTMEPSXCLX": "6.43",
+    }
+    forecast = {
+        "ConsRecom": "2.1",
+        "TargetPrice": "200.5",
+        "ProjLTGrowthRate": "8.0",
+        "ProjPE": "25.1",
+        "ProjSales": "390000",
+        "ProjSalesQ": "90000",
+        "ProjEPS": "6.6",
+        "ProjEPSQ": "1.5",
+        "ProjProfit": "100000",
+        "ProjDPS": "0.98",
+    }
+    out = [
+        '<ReportSnapshot Major="1" Minor="0" Revision="1">',
+        '<Ratios PriceCurrency="USD"><Group ID="Price and Volume">',
+    ]
+    out.extend(
+        f'<Ratio FieldName="{_k}" Type="{"D" if _k == "PDATE" else "N"}">{_v}</Ratio>'
+        for _k, _v in ratios.items()
+    )
+    out.append('</Group></Ratios><ForecastData ConsensusType="Mean">')
+    out.extend(
+        f'<Ratio FieldName="{_k}" Type="N"><Value PeriodType="CURR">{_v}</Value>'
+        "</Ratio>"
+        for _k, _v in forecast.items()
+    )
+    out.append("</ForecastData></ReportSnapshot>")
+    return "".join(out)
+
+
+def resc(n: int = 4) -> str:
+    """RESC, n fiscal years of actuals and estimates"""
+    out = ['<REarnEstCons Version="1"><Actuals><FYActuals>']
+    for _item in ("EPS", "REVENUE"):
+        out.append(f'<FYActual type="{_item}" unit="U">')
+        for i in range(n):
+            out.append(
+                f'<FYPeriod periodType="A" fYear="{2023 - i}" endMonth="9" '
+                f'endCalYear="{2023 - i}">'
+                f'<ActValue updated="2023-11-02T20:30:00">{6.1 - i}</ActValue>'
+                "</FYPeriod>"
+            )
+        out.append("</FYActual>")
+    out.append("</FYActuals></Actuals><ConsEstimates><FYEstimates>")
+    for _item in ("EPS", "REVENUE"):
+        out.append(f'<FYEstimate type="{_item}" unit="U">')
+        for i in range(n):
+            out.append(
+                f'<FYPeriod periodType="A" fYear="{2024 + i}" endMonth="9" '
+                f'endCalYear="{2024 + i}">'
+            )
+            out.extend(
+                f'<ConsEstimate type="{_type}">'
+                f'<ConsValue dateType="CURR">{6.5 + i}</ConsValue></ConsEstimate>'
+                for _type in ("High", "Low", "Mean")
+            )
+            out.append("</FYPeriod>")
+        out.append("</FYEstimate>")
+    out.append("</FYEstimates></ConsEstimates></REarnEstCons>")
+    return "".join(out)
+
+
+def ownership(n: int = 20) -> str:
+    """ReportsOwnership, n owners"""
+    out = [
+        "<ownershipSummary><ISIN>US0378331005</ISIN>",
+        '<floatShares asofDate="2024-04-19">15308320455</floatShares>',
+    ]
+    out.extend(
+        f'<Owner ownerId="{1000 + i}"><type>{1 + i % 3}</type>'
+        f"<name>Owner {i}</name>"
+        f'<quantity asofDate="2024-03-31">{1e6 * (i + 1)}</quantity>'
+        "<currency>USD</currency></Owner>"
+        for i in range(n)
+    )
+    out.append("</ownershipSummary>")
+    return "".join(out)
+
+
+def reports(
+    symbol: str = "AAPL",
+    n_annual: int = 6,
+    n_interim: int = 8,
+    seed: int | None = None,
+    n_summary: int = 12,
+    n_fy: int = 4,
+    n_own: int = 20,
+) -> dict[ReportType, str]:
+    """all reports but CalendarReport, seed defaults to a symbol hash"""
+    # pylint: disable=too-many-arguments
+    seed = zlib.crc32(symbol.encode()) if seed is None else seed
+    return {
+        "ReportsFinStatements": fin_statements(symbol, n_annual, n_interim, seed),
+        "ReportsFinSummary": fin_summary(n_summary, seed),
+        "ReportSnapshot": snapshot(),
+        "RESC": resc(n_fy),
+        "ReportsOwnership": ownership(n_own),
+    }
@@ -25,13 +25,17 @@ __all__ = [
     "XMLParser",
 ]
 
-from datetime import date, datetime
-from functools import lru_cache
-from typing import Literal, Optional
+import functools
+import inspect
+from datetime import date
+from typing import Any, Callable, Iterable, Literal, Optional, TypeVar
+from xml.etree.ElementTree import Element
 
+import numpy as np
 import pandas as pd
 
 from .ib_client import IBClient
+from .metrics import timed
 from .objects import (
     AnalystForecast,
     CompanyInfo,
@@ -39,36 +43,315 @@ from .objects import (
     DividendPerShare,
     EarningsPerShare,
     ForwardYear,
+    LineItems,
     OwnershipCompany,
-    OwnershipDetails,
     OwnershipReport,
     PeriodType,
     RatioSnapshot,
+    ReportType,
     Revenue,
     StatementCode,
-    StatementMap,
+    StatementIndex,
     StatementMapping,
-    statement_map,
+    StatementSet,
+    SummaryColumns,
+    SummarySection,
+    statement_type,
+)
+from .plans import plans, run_plan
+from .utils import (
+    build_statement_set,
+    camel_to_snake,
+    detach,
+    parse_date,
+    to_datetime64,
 )
-from .utils import camel_to_snake
 from .xml_report import XMLReport
 
-fromisoformat = datetime.fromisoformat
+F = TypeVar("F", bound=Callable[..., Any])
 
 SummaryReportType = Literal["A", "TTM", "R", "P", None]
 SummaryPeriod = Literal["12M", "3M", None]
 
+fiscal_periods: dict[PeriodType, str] = {
+    "annual": ".//AnnualPeriods",
+    "quarter": ".//InterimPeriods",
+}
+
+
+def parse_fiscal_period(
+    fperiod: Element, period: PeriodType
+) -> tuple[dict[str, str], dict[StatementCode, dict[str, float]]]:
+    """parse one FiscalPeriod element
+
+    Args:
+        fperiod (Element): FiscalPeriod element
+        period (PeriodType): annual or quarter
+
+    Returns:
+        tuple: period header data and {coaCode: value} by statement code
+    """
+    source = ""
+    statements: dict[StatementCode, dict[str, float]] = {}
+    for _statement in fperiod.iterfind("Statement"):
+        if not source and (_source := _statement.find(".//Source")) is not None:
+            source = _source.attrib["Date"]
+        _items = statements.setdefault(_statement.attrib["Type"], {})
+        for i in _statement.iterfind("lineItem"):
+            _items[i.attrib["coaCode"].lower()] = float(i.text)
+    header = {
+        "period": fperiod.attrib["Type"],
+        "end_date": fperiod.attrib["EndDate"],
+        "fiscal_year": fperiod.attrib["FiscalYear"],
+    }
+    if period == "quarter":
+        header["period_number"] = fperiod.attrib["FiscalPeriodNumber"]
+        header["date_10Q"] = source
+    else:
+        header["date_10K"] = source
+    return header, statements
+
+
+def build_statement_index(fin_statements: Element) -> StatementIndex:
+    """index ReportsFinStatements walking every fiscal period once
+
+    Args:
+        fin_statements (Element): ReportsFinStatements report
+
+    Returns:
+        StatementIndex: period headers and line items by period and statement
+    """
+    index = StatementIndex(periods={}, items={})
+    for period, xpath in fiscal_periods.items():
+        index.periods[period] = []
+        _fp = fin_statements.find(xpath)
+        for fperiod in _fp.iterfind("FiscalPeriod") if _fp is not None else ():
+            index_fiscal_period(index, fperiod, period)
+    return index
+
+
+def index_fiscal_period(
+    index: StatementIndex, fperiod: Element, period: PeriodType
+) -> None:
+    """parse one FiscalPeriod element into a statement index
+
+    Args:
+        index (StatementIndex): statement index, updated in place
+        fperiod (Element): FiscalPeriod element
+        period (PeriodType): annual or quarter
+    """
+    _header, _statements = parse_fiscal_period(fperiod, period)
+    for _code, _items in _statements.items():
+        index.items.setdefault((period, _header["end_date"], _code), {}).update(_items)
+    index.periods.setdefault(period, []).append(_header)
+
+
+def extract_line_items(
+    fin_statements: Element, codes: Iterable[str], period: PeriodType
+) -> LineItems:
+    """extract some line items of every fiscal period in one pass, other
+    line items are skipped without conversion
+
+    Args:
+        fin_statements (Element): ReportsFinStatements report
+        codes (Iterable[str]): coaCodes, any case
+        period (PeriodType): annual or quarter
+
+    Returns:
+        LineItems: requested line items by fiscal period
+    """
+    _codes = tuple(dict.fromkeys(_c.lower() for _c in codes))
+    _column = {_c.upper(): _j for _j, _c in enumerate(_codes)}
+    _fp = fin_statements.find(fiscal_periods[period])
+    fperiods = _fp.findall("FiscalPeriod") if _fp is not None else []
+    values = np.full((len(fperiods), len(_codes)), np.nan)
+    for _row, fperiod in zip(values, fperiods):
+        for _item in fperiod.iter("lineItem"):
+            if (_j := _column.get(_item.attrib["coaCode"])) is not None:
+                _row[_j] = float(_item.text)
+    return LineItems(
+        codes=_codes,
+        end_date=to_datetime64([_f.attrib["EndDate"] for _f in fperiods], "D"),
+        fiscal_year=np.array(
+            [_f.attrib["FiscalYear"] for _f in fperiods], dtype=np.int32
+        ),
+        values=values,
+    )
+
+
+# ReportsFinSummary section: value field of its dataclass
+summary_sections: dict[SummarySection, str] = {
+    "TotalRevenues": "revenue",
+    "DividendPerShares": "value",
+    "EPSs": "eps",
+}
+
+
+def _factorize(values: tuple[str, ...]) -> tuple[np.ndarray, np.ndarray]:
+    """int8 category codes and categories, in order of appearance"""
+    categories = {_v: _i for _i, _v in enumerate(dict.fromkeys(values))}
+    codes = np.fromiter(
+        map(categories.__getitem__, values), dtype=np.int8, count=len(values)
+    )
+    return codes, np.array(list(categories), dtype=object)
+
+
+def build_summary_columns(section: Element) -> SummaryColumns:
+    """ReportsFinSummary section as typed columns, walking the section once
+    for every report type and period
+
+    Args:
+        section (Element): TotalRevenues, DividendPerShares or EPSs element
+
+    Returns:
+        SummaryColumns: section columns
+    """
+    _rows = [
+        (_e.attrib["asofDate"], _e.attrib["reportType"], _e.attrib["period"], _e.text)
+        for _e in section
+    ]
+    _dates, _types, _periods, _values = zip(*_rows) if _rows else ((),) * 4
+    _type_codes, _type_categories = _factorize(_types)
+    _period_codes, _period_categories = _factorize(_periods)
+    return SummaryColumns(
+        currency=section.attrib["currency"],
+        as_of_date=to_datetime64(_dates),
+        report_type=_type_codes,
+        period=_period_codes,
+        value=np.array(_values, dtype=np.float64),
+        report_types=_type_categories,
+        periods=_period_categories,
+    )
+
+
+def _category_mask(
+    codes: np.ndarray, categories: np.ndarray, value: Optional[str]
+) -> Optional[np.ndarray]:
+    if value is None:
+        return None
+    try:
+        return codes == categories.tolist().index(value)
+    except ValueError:
+        return np.zeros(len(codes), dtype=bool)
+
+
+def summary_mask(
+    columns: SummaryColumns,
+    report_type: Optional[str] = None,
+    period: Optional[str] = None,
+) -> np.ndarray:
+    """rows of report type and period, None matches every row"""
+    mask = np.ones(len(columns.value), dtype=bool)
+    for _mask in (
+        _category_mask(columns.report_type, columns.report_types, report_type),
+        _category_mask(columns.period, columns.periods, period),
+    ):
+        if _mask is not None:
+            mask &= _mask
+    return mask
+
+
+def summary_frame(
+    columns: SummaryColumns, value: str
+) -> tuple[pd.DataFrame, np.ndarray]:
+    """section data frame indexed and stably sorted by as_of_date
+
+    Returns:
+        tuple[DataFrame, ndarray]: data frame and its row order, frame row i
+            is columns row order[i]
+    """
+    order = np.argsort(columns.as_of_date, kind="stable")
+    frame = pd.DataFrame(
+        {
+            "report_type": pd.Categorical.from_codes(
+                columns.report_type[order], columns.report_types
+            ),
+            "period": pd.Categorical.from_codes(columns.period[order], columns.periods),
+            "currency": columns.currency,
+            value: columns.value[order],
+        },
+        index=pd.Index(columns.as_of_date[order], name="as_of_date"),
+    )
+    return frame, order
+
+
+def memoized(report_type: ReportType, shared: bool = False) -> Callable[[F], F]:
+    """cache XMLParser method results in the memo of the report they are
+    parsed from, results are dropped with the report when it changes
+
+    Arguments are bound to the method signature, so positional, keyword and
+    default arguments share one entry. Callers get a copy of the result,
+    see utils.detach, unless shared is set for private methods whose
+    results are only read by other parser methods.
+    """
+    _copy: Callable[[Any], Any] = (lambda result: result) if shared else detach
+
+    def _decorator(func: F) -> F:
+        signature = inspect.signature(func)
+        _names = tuple(signature.parameters)[1:]
+        _defaults = tuple(_p.default for _p in signature.parameters.values())[1:]
+
+        def _key(args: tuple, kwargs: dict[str, Any]) -> tuple:
+            """(method name, every argument in signature order)"""
+            if not kwargs.keys() <= set(_names[len(args) :]):
+                # unknown or repeated argument, raise signature TypeError
+                signature.bind(None, *args, **kwargs)
+            _n = len(args)
+            return (
+                func.__name__,
+                *args,
+                *(kwargs.get(_k, _d) for _k, _d in zip(_names[_n:], _defaults[_n:])),
+            )
+
+        @functools.wraps(func)
+        def _wrapper(self, *args, **kwargs):
+            memo = self.xml_report.memo(report_type)
+            key = _key(args, kwargs)
+            try:
+                return _copy(memo[key])
+            except KeyError:
+                memo[key] = result = func(self, *args, **kwargs)
+                return _copy(result)
+
+        return _wrapper  # type: ignore[return-value]
+
+    return _decorator
+
 
 class XMLParser:
-    """Parser for IBKR xml company fundamental data"""
+    """Parser for IBKR xml company fundamental data
 
-    def __init__(self, ib_client: IBClient):
-        self.xml_report = XMLReport(ib_client=ib_client)
+    get_* results are memoized per report while the report is unchanged,
+    callers get a copy, see utils.detach.
+    """
+
+    def __init__(
+        self,
+        ib_client: Optional[IBClient] = None,
+        xml_report: Optional[XMLReport] = None,
+    ):
+        """
+        Args:
+            ib_client (IBClient, optional): IB client, reports are requested
+                through a new XMLReport instance.
+            xml_report (XMLReport, optional): XML report cache, ex. AsyncXMLReport
+
+        Raises:
+            ValueError: neither ib_client nor xml_report is defined
+        """
+        if xml_report is not None:
+            self.xml_report = xml_report
+        elif ib_client is not None:
+            self.xml_report = XMLReport(ib_client=ib_client)
+        else:
+            raise ValueError("No ib_client or xml_report defined.")
 
     def __repr__(self):
         cls_name = self.__class__.__qualname__
         return f"{cls_name}(ib_client={self.xml_report.client!r}"
 
+    @memoized("ReportsFinStatements")
+    @timed("extract.get_fin_statement")
     def get_fin_statement(
         self,
         statement: StatementCode = "INC",
@@ -86,73 +369,68 @@ class XMLParser:
         end_date : 'YYYY-MM-DD' str format, optional
             statement date. The default is None.
 
-        Raises
-        ------
-        Exception
-            if period parameter is missing
-
         Returns
         -------
-        list
-            DESCRIPTION.
+        StatementSet
+            statement_map[statement] sequence, one per fiscal period
 
         """
-        xpath = {
-            "annual": ".//AnnualPeriods/FiscalPeriod",
-            "quarter": ".//InterimPeriods/FiscalPeriod",
-            "xp_fiscal_period": '[@EndDate="{0}"]/Statement[@Type="{1}"]/lineItem',
-        }
-
-        # statement type
-        xp_statement = statement
-        # period type
-        xp_line = xpath[period]
-        # filter by end_date
-        if end_date is not None:
-            xp_line_ed = xp_line + f'[@EndDate="{end_date.isoformat()}"]'
-        else:
-            xp_line_ed = xp_line
-
-        fp = self.xml_report.fin_statements.findall(xp_line_ed)
-
-        if period == "quarter":
-            fperiods = [
-                {
-                    "period": fperiod.attrib["Type"],
-                    "end_date": fperiod.attrib["EndDate"],
-                    "fiscal_year": fperiod.attrib["FiscalYear"],
-                    "period_number": fperiod.attrib["FiscalPeriodNumber"],
-                    "date_10Q": fperiod.find(".//Source").attrib["Date"],
-                }
-                for fperiod in fp
-            ]
-        else:
-            fperiods = [
-                {
-                    "period": fperiod.attrib["Type"],
-                    "end_date": fperiod.attrib["EndDate"],
-                    "fiscal_year": fperiod.attrib["FiscalYear"],
-                    "date_10K": fperiod.find(".//Source").attrib["Date"],
-                }
-                for fperiod in fp
-            ]
-
-        fs = []
+        statements = build_statement_set(self._get_statement_index(), statement, period)
+        if end_date is not None and len(statements):
+            return statements[statements.header["end_date"] == end_date.isoformat()]
+        return statements
+
+    def get_items(
+        self, codes: Iterable[str], period: PeriodType = "annual"
+    ) -> LineItems:
+        """some line items of every fiscal period, without building full
+        statements
+
+        Args:
+            codes (Iterable[str]): coaCodes, e.g. ["RTLR", "NINC", "ATOT"]
+            period (PeriodType, optional): annual or quarter.
+                Defaults to "annual".
+
+        Returns:
+            LineItems: one row per fiscal period, one column per code
+        """
+        return self._get_items(tuple(codes), period)
 
-        for p in fperiods:
-            if end_date is not None:
-                ed = end_date.isoformat()
-            else:
-                ed = p["end_date"]
+    @memoized("ReportsFinStatements")
+    @timed("extract.get_items")
+    def _get_items(self, codes: tuple[str, ...], period: PeriodType) -> LineItems:
+        return extract_line_items(self.xml_report.fin_statements, codes, period)
 
-            xp = xpath["xp_fiscal_period"].format(ed, xp_statement)
-            fs_line = self.xml_report.fin_statements.findall(xp_line + xp)
+    def get_statement_sets(
+        self,
+    ) -> dict[tuple[StatementCode, PeriodType], StatementSet]:
+        """array backed statements by statement and period type, see
+        get_fin_statement"""
+        return {
+            (_statement, _period): self.get_fin_statement(_statement, _period)
+            for _statement in statement_type
+            for _period in fiscal_periods
+        }
 
-            fs.append({i.attrib["coaCode"].lower(): float(i.text) for i in fs_line})
+    def get_statement_index(self) -> StatementIndex:
+        """ReportsFinStatements index, built once per report, the caller gets
+        a copy of its headers and line items"""
+        _index = self._get_statement_index()
+        return StatementIndex(
+            periods={
+                _period: [dict(_header) for _header in _headers]
+                for _period, _headers in _index.periods.items()
+            },
+            items={_key: dict(_items) for _key, _items in _index.items.items()},
+        )
 
-        return [statement_map[statement](**i, **j) for i, j in zip(fperiods, fs)]
+    @memoized("ReportsFinStatements", shared=True)
+    @timed("extract.get_statement_index")
+    def _get_statement_index(self) -> StatementIndex:
+        return build_statement_index(self.xml_report.fin_statements)
 
-    @lru_cache(maxsize=4)
+    @memoized("ReportsFinStatements")
+    @timed("extract.get_map_items")
     def get_map_items(
         self, statement: Optional[StatementCode] = None
     ) -> StatementMapping:
@@ -163,23 +441,13 @@ class XMLParser:
         -------
         list of dict with FinStatement name mapping
         """
+        if statement is not None:
+            return [_m for _m in self.get_map_items() if _m.statement_type == statement]
+        _map = self.xml_report.fin_statements.find(".//COAMap")
+        return run_plan(plans["map_items"], _map) if _map is not None else []
 
-        fa = ".//COAMap/"
-        fs = self.xml_report.fin_statements.findall(fa)
-
-        _map_items: StatementMapping = [
-            StatementMap(
-                coa_item=mi.attrib["coaItem"],
-                map_item=mi.text,
-                statement_type=mi.attrib["statementType"],
-                line_id=int(mi.attrib["lineID"]),
-            )
-            for mi in fs
-            if statement is None
-            or (statement is not None and mi.attrib["statementType"] == statement)
-        ]
-        return _map_items
-
+    @memoized("ReportsOwnership")
+    @timed("extract.get_ownership_report")
     def get_ownership_report(self) -> OwnershipReport:
         """Ownership Report"""
         fs = self.xml_report.ownership
@@ -189,60 +457,70 @@ class XMLParser:
             ISIN=isin.text,
             float_shares=int(fa.text),
             as_of_date=(
-                fromisoformat(fa.attrib["asofDate"])
+                parse_date(fa.attrib["asofDate"])
                 if fa.attrib["asofDate"] != "0"
                 else None
             ),
         )
-        _l = []
-        fa = fs.findall("./Owner")
-
-        for i in fa:
-            d = {}
-            d["owner_id"] = i.attrib["ownerId"]
-
-            for j in i.findall("./"):
-                if "as_of_date" not in d and j.attrib:
-                    d["as_of_date"] = datetime.fromisoformat(j.attrib["asofDate"])
-                d[j.tag] = float(j.text) if j.tag == "quantity" else j.text
-
-            _l.append(OwnershipDetails(**d))
-
-        return OwnershipReport(company=company, ownership_details=_l)
+        return OwnershipReport(
+            company=company, ownership_details=run_plan(plans["ownership"], fs)
+        )
 
+    @memoized("ReportsFinSummary")
+    @timed("extract.get_dividend")
     def get_dividend(self) -> list[Dividend] | None:
         """get dividends"""
-        fa = "./Dividends"
-        fs = self.xml_report.fin_summary.find(fa)
+        fs = self.xml_report.fin_summary.find("./Dividends")
         if fs is None:
             return None
-        curr = fs.attrib["currency"]
-        _dividend = [
-            Dividend(
-                type=i.attrib["type"],
-                ex_date=(
-                    fromisoformat(i.attrib["exDate"]) if i.attrib["exDate"] else None
-                ),
-                record_date=(
-                    fromisoformat(i.attrib["recordDate"])
-                    if i.attrib["recordDate"]
-                    else None
-                ),
-                pay_date=(
-                    fromisoformat(i.attrib["payDate"]) if i.attrib["payDate"] else None
-                ),
-                declaration_date=(
-                    fromisoformat(i.attrib["declarationDate"])
-                    if i.attrib["declarationDate"]
-                    else None
-                ),
-                currency=curr,
-                value=float(i.text) if i.text else None,
-            )
-            for i in fs
-        ]
-        return _dividend
+        return run_plan(plans["dividends"], fs)
+
+    @memoized("ReportsFinSummary")
+    @timed("extract.get_summary_columns")
+    def get_summary_columns(self, section: SummarySection) -> SummaryColumns | None:
+        """ReportsFinSummary section columns, built once per report, None if
+        the section is missing"""
+        _section = self.xml_report.fin_summary.find(section)
+        return build_summary_columns(_section) if _section is not None else None
+
+    @memoized("ReportsFinSummary")
+    def _summary_frame(
+        self, section: SummarySection
+    ) -> tuple[pd.DataFrame, np.ndarray] | None:
+        """whole section data frame and row order, see summary_frame"""
+        _columns = self.get_summary_columns(section)
+        if _columns is None:
+            return None
+        return summary_frame(_columns, summary_sections[section])
+
+    @memoized("ReportsFinSummary")
+    @timed("extract.get_summary_frame")
+    def get_summary_frame(
+        self,
+        section: SummarySection,
+        report_type: SummaryReportType = None,
+        period: SummaryPeriod = None,
+    ) -> pd.DataFrame | None:
+        """ReportsFinSummary section data frame indexed by as_of_date, same
+        columns as get_revenue, get_div_per_share and get_eps lists
+
+        Returns:
+            DataFrame | None: categorical report_type and period, None if
+                there are no rows
+        """
+        if (_section := self._summary_frame(section)) is None:
+            return None
+        _frame, _order = _section
+        mask = summary_mask(self.get_summary_columns(section), report_type, period)
+        if not mask.any():
+            return None
+        return _frame.iloc[np.flatnonzero(mask[_order])]
 
+    # get_div_per_share, get_revenue and get_eps walk their section on every
+    # call and convert only the rows that match, for the one or two calls per
+    # section of FundamentalData that is cheaper than building SummaryColumns
+    @memoized("ReportsFinSummary")
+    @timed("extract.get_div_per_share")
     def get_div_per_share(
         self,
         report_type: SummaryReportType = None,
@@ -257,23 +535,20 @@ class XMLParser:
 
         _div_ps = [
             DividendPerShare(
-                as_of_date=fromisoformat(i.attrib["asofDate"]),
+                as_of_date=parse_date(i.attrib["asofDate"]),
                 report_type=i.attrib["reportType"],
                 period=i.attrib["period"],
                 currency=curr,
                 value=float(i.text),
             )
             for i in fs
-            if (
-                report_type is None
-                or (report_type is not None and i.attrib["reportType"] == report_type)
-            )
-            and (
-                period is None or (period is not None and i.attrib["period"] == period)
-            )
+            if (report_type is None or i.attrib["reportType"] == report_type)
+            and (period is None or i.attrib["period"] == period)
         ]
         return _div_ps
 
+    @memoized("ReportsFinSummary")
+    @timed("extract.get_revenue")
     def get_revenue(
         self,
         report_type: SummaryReportType = None,
@@ -282,27 +557,26 @@ class XMLParser:
         """Revenue"""
         fa = "./TotalRevenues"
         fs = self.xml_report.fin_summary.find(fa)
+        if fs is None:
+            return []
         curr = fs.attrib["currency"]
 
         _revenue = [
             Revenue(
-                as_of_date=fromisoformat(tr.attrib["asofDate"]),
+                as_of_date=parse_date(tr.attrib["asofDate"]),
                 report_type=tr.attrib["reportType"],
                 period=tr.attrib["period"],
                 currency=curr,
                 revenue=float(tr.text),
             )
             for tr in fs
-            if (
-                report_type is None
-                or (report_type is not None and tr.attrib["reportType"] == report_type)
-            )
-            and (
-                period is None or (period is not None and tr.attrib["period"] == period)
-            )
+            if (report_type is None or tr.attrib["reportType"] == report_type)
+            and (period is None or tr.attrib["period"] == period)
         ]
         return _revenue
 
+    @memoized("ReportsFinSummary")
+    @timed("extract.get_eps")
     def get_eps(
         self,
         report_type: SummaryReportType = None,
@@ -311,27 +585,26 @@ class XMLParser:
         """Earnings per share"""
         fa = "./EPSs"
         fs = self.xml_report.fin_summary.find(fa)
+        if fs is None:
+            return []
         curr = fs.attrib["currency"]
 
         _eps = [
             EarningsPerShare(
-                as_of_date=fromisoformat(tr.attrib["asofDate"]),
+                as_of_date=parse_date(tr.attrib["asofDate"]),
                 report_type=tr.attrib["reportType"],
                 period=tr.attrib["period"],
                 currency=curr,
                 eps=float(tr.text),
             )
             for tr in fs
-            if (
-                report_type is None
-                or (report_type is not None and tr.attrib["reportType"] == report_type)
-            )
-            and (
-                period is None or (period is not None and tr.attrib["period"] == period)
-            )
+            if (report_type is None or tr.attrib["reportType"] == report_type)
+            and (period is None or tr.attrib["period"] == period)
         ]
         return _eps
 
+    @memoized("ReportSnapshot")
+    @timed("extract.get_analyst_forecast")
     def get_analyst_forecast(self) -> AnalystForecast:
         """Analyst forecast"""
         fa = ".//ForecastData/Ratio"
@@ -347,6 +620,8 @@ class XMLParser:
         )
         return _analyst_forecast
 
+    @memoized("ReportSnapshot")
+    @timed("extract.get_ratios")
     def get_ratios(self) -> RatioSnapshot:
         """Company ratios snapshot"""
         fa = ".//Ratios/Group/Ratio"
@@ -355,54 +630,27 @@ class XMLParser:
         _ratios = RatioSnapshot(
             **{
                 r.attrib["FieldName"].lower(): (
-                    fromisoformat(r.text) if r.attrib["Type"] == "D" else float(r.text)
+                    parse_date(r.text) if r.attrib["Type"] == "D" else float(r.text)
                 )
                 for r in fs
             }
         )
         return _ratios
 
+    @memoized("RESC")
+    @timed("extract.get_fy_estimates")
     def get_fy_estimates(self) -> list[ForwardYear]:
         """Forward Year estimates"""
-        fs = self.xml_report.resc
-        _fy_estimates = [
-            ForwardYear(
-                type="Estimate",
-                item=a.attrib["type"],
-                unit=a.attrib["unit"],
-                period_type=p.attrib["periodType"],
-                fyear=int(p.attrib["fYear"]),
-                end_month=int(p.attrib["endMonth"]),
-                end_cal_year=int(p.attrib["endCalYear"]),
-                value=float(e[0].text),
-                est_type=e.attrib["type"],
-            )
-            for a in fs.iter("FYEstimate")
-            for p in a.iter("FYPeriod")
-            for e in p.iter("ConsEstimate")
-        ]
-        return _fy_estimates
+        return run_plan(plans["fy_estimates"], self.xml_report.resc)
 
+    @memoized("RESC")
+    @timed("extract.get_fy_actuals")
     def get_fy_actuals(self) -> list[ForwardYear]:
         """Forward year actuals"""
-        fs = self.xml_report.resc
-        _fy_actuals = [
-            ForwardYear(
-                type="Actual",
-                item=a.attrib["type"],
-                unit=a.attrib["unit"],
-                period_type=p.attrib["periodType"],
-                fyear=int(p.attrib["fYear"]),
-                end_month=int(p.attrib["endMonth"]),
-                end_cal_year=int(p.attrib["endCalYear"]),
-                value=float(p[0].text),
-                updated=pd.to_datetime(p[0].attrib["updated"]),
-            )
-            for a in fs.iter("FYActual")
-            for p in a.iter("FYPeriod")
-        ]
-        return _fy_actuals
+        return run_plan(plans["fy_actuals"], self.xml_report.resc)
 
+    @memoized("ReportsFinStatements")
+    @timed("extract.get_company_info")
     def get_company_info(self) -> CompanyInfo:
         """Company Info"""
         fs = self.xml_report.fin_statements
@@ -415,7 +663,7 @@ class XMLParser:
             "code": r.attrib["Code"] for r in fs.findall("./Issues/Issue/Exchange")
         }
         last_split = {
-            "last_split": fromisoformat(r.attrib.get("Date"))
+            "last_split": parse_date(r.attrib.get("Date"))
             for r in fs.findall("./Issues/Issue/MostRecentSplit")
         }
         stock_split = {
@@ -21,88 +21,287 @@ Created on Fri Apr 30 16:21:58 2021
 
 @author: gonzo
 """
-# pylint: disable=attribute-defined-outside-init
+import asyncio
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Hashable, Mapping, Optional, Union
 from xml.etree.ElementTree import Element
 
 from defusedxml.ElementTree import fromstring
 
-from .ib_client import IBClient
+from .ib_client import AsyncIBClient, IBClient
+from .metrics import count, timer
+from .objects import ReportType
+from .utils import content_hash
 
 __all__ = [
+    "AsyncXMLReport",
+    "ParsedReport",
+    "ReportHistory",
     "XMLReport",
 ]
 
+# (symbol, report type)
+HistoryKey = tuple[str, ReportType]
+
+
+def _parse(xml: Union[str, bytes]) -> Element:
+    """parse raw XML report"""
+    with timer("xml_parse"):
+        _report = fromstring(xml)
+    count("xml_parse.bytes", len(xml))
+    return _report
+
+
+@dataclass(slots=True)
+class ParsedReport:
+    """Parsed report and the objects derived from it
+
+    memo holds parser results for this payload, a changed payload gets a new
+    ParsedReport and an empty memo.
+    """
+
+    element: Element
+    digest: str = ""
+    memo: dict[Hashable, Any] = field(default_factory=dict)
+
+
+class ReportHistory:
+    """Last parsed version of reports by symbol and report type
+
+    Share one history between XMLReport objects, e.g. across daily runs of a
+    long lived process, and byte identical reports are not parsed again.
+    """
+
+    def __init__(self, maxsize: int = 4096):
+        """
+        Args:
+            maxsize (int, optional): maximum reports, least recently used
+                reports are dropped. Defaults to 4096.
+        """
+        self.maxsize = maxsize
+        self._reports: OrderedDict[HistoryKey, ParsedReport] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        cls_name = self.__class__.__qualname__
+        return f"{cls_name}(maxsize={self.maxsize!r},size={len(self)!r})"
+
+    def __len__(self) -> int:
+        return len(self._reports)
+
+    def get(self, key: HistoryKey) -> Optional[ParsedReport]:
+        """last parsed version, None if missing"""
+        with self._lock:
+            _parsed = self._reports.get(key)
+            if _parsed is not None:
+                self._reports.move_to_end(key)
+            return _parsed
+
+    def set(self, key: HistoryKey, parsed: ParsedReport) -> None:
+        """store parsed version"""
+        with self._lock:
+            self._reports[key] = parsed
+            self._reports.move_to_end(key)
+            while len(self._reports) > self.maxsize:
+                self._reports.popitem(last=False)
+
+    def clear(self) -> None:
+        """drop all reports"""
+        with self._lock:
+            self._reports.clear()
+
 
 class XMLReport:
-    """XML Report Cache"""
+    """XML Report Cache
+
+    Raw reports are hashed, a report equal to the last version in history is
+    not parsed again, it reuses the parsed report and memo and its report
+    type is added to unchanged.
+    """
 
-    def __init__(self, ib_client: IBClient):
+    def __init__(
+        self,
+        ib_client: Optional[IBClient],
+        history: Optional[ReportHistory] = None,
+        symbol: str = "",
+    ):
+        """
+        Args:
+            ib_client (IBClient, optional): IB client, None for from_xml
+            history (ReportHistory, optional): last parsed reports, shared
+                between XMLReport objects. Defaults to a new history.
+            symbol (str, optional): history key without IB client.
+                Defaults to the IB client symbol.
+        """
         self.client = ib_client
+        self.symbol = ib_client.symbol if ib_client is not None else symbol
+        self.history = history if history is not None else ReportHistory()
+        self.unchanged: set[ReportType] = set()
+        self._reports: dict[ReportType, ParsedReport] = {}
+
+    @classmethod
+    def from_xml(
+        cls,
+        reports: Mapping[ReportType, Union[str, bytes, Element]],
+        history: Optional[ReportHistory] = None,
+        symbol: str = "",
+    ) -> "XMLReport":
+        """XMLReport of already fetched reports, without IB client
+
+        Args:
+            reports (Mapping[ReportType, str | bytes | Element]): raw XML or
+                parsed report by report type, empty reports are skipped
+            history (ReportHistory, optional): last parsed reports.
+                Defaults to a new history.
+            symbol (str, optional): symbol, history key. Defaults to "".
+        """
+        _xml_report = cls(ib_client=None, history=history, symbol=symbol)
+        for _type, _xml in reports.items():
+            if isinstance(_xml, Element):
+                _xml_report._reports[_type] = ParsedReport(element=_xml)
+            elif _xml:
+                _xml_report._load_xml(_type, _xml)
+        return _xml_report
 
     def __repr__(self):
         cls_name = self.__class__.__qualname__
         return f"{cls_name}(ib_client={self.client!r})"
 
+    def _load_xml(self, report_type: ReportType, xml: Union[str, bytes]) -> Element:
+        """parse raw XML report, unless it's the last version in history"""
+        _digest = content_hash(xml)
+        _key = (self.symbol, report_type)
+        _parsed = self.history.get(_key)
+        if _parsed is not None and _parsed.digest == _digest:
+            count("xml_parse.unchanged")
+            self.unchanged.add(report_type)
+        else:
+            self.unchanged.discard(report_type)
+            _parsed = ParsedReport(element=_parse(xml), digest=_digest)
+            self.history.set(_key, _parsed)
+        self._reports[report_type] = _parsed
+        return _parsed.element
+
+    def get_report(self, report_type: ReportType) -> Element:
+        """request report, parsed reports are cached"""
+        try:
+            return self._reports[report_type].element
+        except KeyError:
+            if self.client is None:
+                raise ValueError(f"Report {report_type} is not available.") from None
+            return self._load_xml(report_type, self.client.ib_req_fund(report_type))
+
+    def memo(self, report_type: ReportType) -> dict[Hashable, Any]:
+        """objects derived from a report, reused while the report is unchanged"""
+        self.get_report(report_type)
+        return self._reports[report_type].memo
+
+    def refresh(self, *report_types: ReportType) -> None:
+        """drop loaded reports, all by default, they are requested again on
+        next access"""
+        for _type in report_types or tuple(self._reports):
+            self._reports.pop(_type, None)
+            self.unchanged.discard(_type)
+
+    def prefetch(self, *report_types: ReportType) -> dict[ReportType, Exception]:
+        """request reports concurrently, loaded reports are skipped
+
+        Returns:
+            dict[ReportType, Exception]: request errors by report type, failed
+                reports are requested again on next access
+        """
+        _missing = [_r for _r in report_types if _r not in self._reports]
+        if not _missing or self.client is None:
+            return {}
+        errors: dict[ReportType, Exception] = {}
+        for _type, _xml in self.client.ib_req_fund_many(_missing).items():
+            if isinstance(_xml, Exception):
+                errors[_type] = _xml
+            else:
+                self._load_xml(_type, _xml)
+        return errors
+
     @property
     def fin_statements(self) -> Element:
         """Request financial statements"""
-        try:
-            return self.__fin_statements
-        except AttributeError:
-            self.__fin_statements: Element = fromstring(
-                self.client.ib_req_fund("ReportsFinStatements")
-            )
-            return self.__fin_statements
+        return self.get_report("ReportsFinStatements")
 
     @property
     def fin_summary(self) -> Element:
         """request financial summary"""
-        try:
-            return self.__fin_summary
-        except AttributeError:
-            self.__fin_summary: Element = fromstring(
-                self.client.ib_req_fund("ReportsFinSummary")
-            )
-            return self.__fin_summary
+        return self.get_report("ReportsFinSummary")
 
     @property
     def snapshot(self) -> Element:
         """request snapshot report"""
-        try:
-            return self.__snapshot
-        except AttributeError:
-            self.__snapshot: Element = fromstring(
-                self.client.ib_req_fund("ReportSnapshot")
-            )
-            return self.__snapshot
+        return self.get_report("ReportSnapshot")
 
     @property
     def resc(self) -> Element:
         """request RESC"""
-        try:
-            return self.__resc
-        except AttributeError:
-            self.__resc: Element = fromstring(self.client.ib_req_fund("RESC"))
-            return self.__resc
+        return self.get_report("RESC")
 
     @property
     def ownership(self) -> Element:
         """request ReportsOwnership"""
-        try:
-            return self.__ownership
-        except AttributeError:
-            self.__ownership: Element = fromstring(
-                self.client.ib_req_fund("ReportsOwnership")
-            )
-            return self.__ownership
+        return self.get_report("ReportsOwnership")
 
     @property
     def calendar(self) -> Element:
         """Calendar Report"""
+        return self.get_report("CalendarReport")
+
+
+class AsyncXMLReport(XMLReport):
+    """XML Report Cache, asyncio version
+
+    Reports are requested with `load`, once loaded XMLReport properties
+    return the cached report without blocking.
+    """
+
+    def __init__(
+        self, ib_client: AsyncIBClient, history: Optional[ReportHistory] = None
+    ):
+        super().__init__(ib_client, history)  # type: ignore[arg-type]
+        self._pending: dict[ReportType, asyncio.Future] = {}
+
+    def get_report(self, report_type: ReportType) -> Element:
+        """get a loaded report
+
+        Raises:
+            ValueError: report is not loaded
+        """
+        try:
+            return self._reports[report_type].element
+        except KeyError as exc:
+            raise ValueError(
+                f"Report {report_type} is not loaded, await load() first."
+            ) from exc
+
+    async def load(self, *report_types: ReportType) -> None:
+        """request reports concurrently, loaded reports are skipped"""
+        await asyncio.gather(
+            *(self._load(_r) for _r in report_types if _r not in self._reports)
+        )
+
+    async def report(self, report_type: ReportType) -> Element:
+        """request report"""
+        await self.load(report_type)
+        return self._reports[report_type].element
+
+    async def _load(self, report_type: ReportType) -> None:
+        """request one report, concurrent requests for the same report share
+        one IB request"""
+        try:
+            _request = self._pending[report_type]
+        except KeyError:
+            _request = asyncio.ensure_future(self.client.ib_req_fund(report_type))
+            self._pending[report_type] = _request
         try:
-            return self.__calendar
-        except AttributeError:
-            self.__calendar: Element = fromstring(
-                self.client.ib_req_fund("CalendarReport")
-            )
-            return self.__calendar
+            xml = await asyncio.shield(_request)
+        finally:
+            self._pending.pop(report_type, None)
+        if report_type not in self._reports:
+            self._load_xml(report_type, xml)
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+
+#   http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""Streaming parser for large XML reports
+
+Records are parsed with a safe iterparse and elements are dropped as soon
+as they are parsed, so peak memory is bounded by one FiscalPeriod/FYPeriod
+instead of the whole report.
+
+    >>> xml = client.ib_req_fund("ReportsFinStatements")
+    >>> for statement in iter_fin_statements(xml, statement="INC"):
+    ...     print(statement.end_date, statement.rtlr)
+"""
+
+__all__ = [
+    "iter_fin_statements",
+    "iter_forward_year",
+]
+
+import io
+import os
+from typing import IO, Iterator, Literal, Optional, Union
+from xml.etree.ElementTree import Element
+
+from defusedxml.ElementTree import iterparse
+
+from .objects import (
+    FinancialStatement,
+    ForwardYear,
+    PeriodType,
+    StatementCode,
+    statement_map,
+)
+from .plans import iter_plan, plans
+from .xml_parser import parse_fiscal_period
+
+XMLSource = Union[str, bytes, os.PathLike, IO[bytes]]
+
+fiscal_period_tags: dict[str, PeriodType] = {
+    "AnnualPeriods": "annual",
+    "InterimPeriods": "quarter",
+}
+
+
+def xml_file(source: XMLSource) -> Union[os.PathLike, IO[bytes]]:
+    """XML source as a file for iterparse
+
+    Args:
+        source (XMLSource): XML text as returned by IBClient.ib_req_fund,
+            bytes, a file path or a binary file object
+    """
+    if isinstance(source, str):
+        return io.BytesIO(source.encode())
+    if isinstance(source, bytes):
+        return io.BytesIO(source)
+    return source
+
+
+def iter_fin_statements(
+    source: XMLSource,
+    statement: Optional[StatementCode] = None,
+    period: Optional[PeriodType] = None,
+) -> Iterator[FinancialStatement]:
+    """stream ReportsFinStatements statements
+
+    Args:
+        source (XMLSource): ReportsFinStatements report
+        statement (StatementCode, optional): INC, BAL or CAS. Defaults to all.
+        period (PeriodType, optional): annual or quarter. Defaults to all.
+
+    Yields:
+        FinancialStatement: IncomeStatement, BalanceSheetStatement or
+            CashFlowStatement, in document order
+    """
+    _periods: Optional[Element] = None
+    for event, elem in iterparse(xml_file(source), events=("start", "end")):
+        if event == "start":
+            if elem.tag in fiscal_period_tags:
+                _periods = elem
+            continue
+        if elem.tag == "FiscalPeriod" and _periods is not None:
+            _period = fiscal_period_tags[_periods.tag]
+            if period is None or period == _period:
+                _header, _statements = parse_fiscal_period(elem, _period)
+                for _code, _items in _statements.items():
+                    if statement is None or statement == _code:
+                        yield statement_map[_code](**_header, **_items)
+            _periods.remove(elem)
+        elif elem.tag in fiscal_period_tags:
+            _periods = None
+            elem.clear()
+        elif elem.tag == "COAMap":
+            elem.clear()
+
+
+def iter_forward_year(
+    source: XMLSource,
+    fy_type: Optional[Literal["Estimate", "Actual"]] = None,
+) -> Iterator[ForwardYear]:
+    """stream RESC forward year estimates and actuals
+
+    Args:
+        source (XMLSource): RESC report
+        fy_type (Literal["Estimate", "Actual"], optional): Defaults to all.
+
+    Yields:
+        ForwardYear: estimates and actuals, in document order
+    """
+    _plans = [
+        plans[_name]
+        for _type, _name in (("Actual", "fy_actuals"), ("Estimate", "fy_estimates"))
+        if fy_type in (None, _type)
+    ]
+    yield from iter_plan(iterparse(xml_file(source), events=("start", "end")), *_plans)
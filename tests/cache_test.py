@@ -0,0 +1,159 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+
+#   http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""Tests for cache module"""
+
+import secrets
+import time
+
+import pytest
+
+from ib_fundamental.cache import (
+    ContractCache,
+    ContractKey,
+    DirectoryReportCache,
+    ReportCache,
+    ReportKey,
+    SQLiteReportCache,
+)
+from ib_fundamental.ib_client import Stock
+
+XML = "<ReportSnapshot>" + "<Ratio>1.0</Ratio>" * 100 + "</ReportSnapshot>"
+
+
+def make_key(symbol: str = "AAPL", report_type="ReportSnapshot") -> ReportKey:
+    """make cache key"""
+    return ReportKey(symbol, "SMART", "USD", report_type)
+
+
+@pytest.fixture(params=[SQLiteReportCache, DirectoryReportCache])
+def report_cache(tmp_path, request):
+    """ReportCache implementations fixture"""
+    _cls = request.param
+    _path = tmp_path / "cache.db" if _cls is SQLiteReportCache else tmp_path
+    yield _cls(_path)
+
+
+class TestReportCache:
+    """Tests for ReportCache implementations"""
+
+    def test_key_from_contract(self):
+        """Test ReportKey uses conId when the contract is qualified"""
+        _stock = Stock(symbol="AAPL", exchange="SMART", currency="USD")
+        assert str(ReportKey.from_contract(_stock, "RESC")) == "AAPL:SMART:USD:RESC"
+        _stock.conId = 265598
+        assert str(ReportKey.from_contract(_stock, "RESC")) == "265598:SMART:USD:RESC"
+
+    def test_abstract(self):
+        """Test ReportCache can't be created without get, set, delete, clear"""
+        with pytest.raises(TypeError, match="abstract"):
+            ReportCache()  # pylint: disable=abstract-class-instantiated
+
+    def test_get_set(self, report_cache: ReportCache):
+        """Test cache round trip"""
+        _key = make_key()
+        # assert
+        assert report_cache.get(_key) is None
+        report_cache.set(_key, XML)
+        assert report_cache.get(_key) == XML
+        assert report_cache.get(make_key(report_type="RESC")) is None
+        report_cache.delete(_key)
+        assert report_cache.get(_key) is None
+
+    def test_ttl(self, report_cache: ReportCache):
+        """Test entries expire by report type"""
+        report_cache.ttl["ReportSnapshot"] = 0.05
+        _snapshot, _ownership = make_key(), make_key(report_type="ReportsOwnership")
+        report_cache.set(_snapshot, XML)
+        report_cache.set(_ownership, XML)
+        # act
+        time.sleep(0.1)
+        # assert
+        assert report_cache.get(_snapshot) is None
+        assert report_cache.get(_ownership) == XML
+
+    def test_lru_eviction(self, report_cache: ReportCache):
+        """Test least recently used entries are evicted over max_bytes"""
+        _xml = [f"<r>{secrets.token_hex(2000)}</r>" for _ in range(3)]
+        report_cache.set(make_key("A"), _xml[0])
+        report_cache.set(make_key("B"), _xml[1])
+        time.sleep(0.05)
+        assert report_cache.get(make_key("A")) == _xml[0]
+        # room for two entries, hex compresses to about half
+        report_cache.max_bytes = 5000
+        # act
+        report_cache.set(make_key("C"), _xml[2])
+        # assert
+        assert report_cache.get(make_key("B")) is None
+        assert report_cache.get(make_key("A")) == _xml[0]
+        assert report_cache.get(make_key("C")) == _xml[2]
+
+    def test_size(self, report_cache: ReportCache, monkeypatch):
+        """Test the stored size is a running total, no eviction under max_bytes"""
+        _evictions = []
+        monkeypatch.setattr(report_cache, "_evict", lambda: _evictions.append(1))
+        # act
+        report_cache.set(make_key("A"), XML)
+        _size = report_cache.size
+        report_cache.set(make_key("A"), XML)
+        report_cache.set(make_key("B"), XML)
+        # assert
+        assert 0 < _size < len(XML)
+        assert report_cache.size == 2 * _size
+        assert type(report_cache)(report_cache.path).size == 2 * _size
+        report_cache.delete(make_key("A"))
+        assert report_cache.size == _size
+        assert not _evictions
+
+    def test_clear(self, report_cache: ReportCache):
+        """Test clear cache"""
+        report_cache.set(make_key(), XML)
+        report_cache.clear()
+        assert report_cache.get(make_key()) is None
+        assert report_cache.size == 0
+
+
+class TestContractCache:
+    """Tests for ContractCache"""
+
+    def test_get_set(self, tmp_path):
+        """Test qualified contracts round trip, persisted to disk"""
+        _key = ContractKey("AAPL", "SMART", "USD")
+        _stock = Stock(symbol="AAPL", exchange="SMART", currency="USD")
+        _cache = ContractCache(tmp_path / "contracts.db")
+        # unqualified contracts are not stored
+        _cache.set(_stock)
+        assert _cache.get(_key) is None
+        # act
+        _stock.conId, _stock.primaryExchange = 265598, "NASDAQ"
+        _cache.set(_stock)
+        _cache.close()
+        _contract = ContractCache(tmp_path / "contracts.db").get(_key)
+        # assert
+        assert _contract == _stock
+        assert _contract.primaryExchange == "NASDAQ"
+
+    def test_ttl(self):
+        """Test contracts expire"""
+        _cache = ContractCache(ttl=0.05)
+        _cache.set_many([Stock(conId=265598, symbol="AAPL", exchange="SMART")])
+        _key = ContractKey("AAPL", "SMART", "")
+        assert _cache.get(_key) is not None
+        # act
+        time.sleep(0.1)
+        # assert
+        assert _cache.get(_key) is None
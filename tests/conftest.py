@@ -22,10 +22,12 @@ import typing
 from itertools import chain, product, repeat
 
 import pytest
-from ib_async import IB
+from ib_async import IB, FundamentalRatios
 
-from ib_fundamental.fundamental import FundamentalData
+from ib_fundamental import xml_factory
+from ib_fundamental.fundamental import AsyncFundamentalData, FundamentalData
 from ib_fundamental.ib_client import IBClient
+from ib_fundamental.metrics import Metrics, add_hook, remove_hook
 from ib_fundamental.objects import (
     BalanceSheetStatement,
     CashFlowStatement,
@@ -35,6 +37,8 @@ from ib_fundamental.objects import (
     ReportType,
     Revenue,
 )
+from ib_fundamental.sources import MemorySource, ReplayIB
+from ib_fundamental.universe import Universe, default_reports
 from ib_fundamental.xml_parser import XMLParser
 from ib_fundamental.xml_report import XMLReport
 
@@ -244,6 +248,15 @@ def fundamental_data(tws_client, request):
     del _fund
 
 
+@pytest.fixture(scope="class", params=DJIA[:3])
+def async_fundamental_data(tws_client, request):
+    """AsyncFundamentalData fixture"""
+    _symbol = request.param
+    _fund = AsyncFundamentalData(symbol=_symbol, ib=tws_client)
+    yield _fund
+    del _fund
+
+
 gen_fund_statement = (
     (a, *b)
     for a, b in zip(statement_attrs_fun_data, product(statement, stament_period))
@@ -281,3 +294,72 @@ def fundamental_fy(fundamental_data, request):
     _attr = request.param
     _fy = getattr(fundamental_data, _attr)
     yield _fy
+
+
+@pytest.fixture(scope="session")
+def replay_source():
+    """MemorySource fixture, synthetic reports"""
+    yield MemorySource({_s: xml_factory.reports(_s) for _s in DJIA[:5]})
+
+
+@pytest.fixture(scope="function")
+def replay_ib(replay_source):
+    """ReplayIB fixture, offline IB"""
+    _ib = ReplayIB(replay_source)
+    yield _ib
+    _ib.disconnect()
+
+
+@pytest.fixture(scope="function")
+def qualify_calls(replay_ib, monkeypatch):
+    """symbols of every ReplayIB qualifyContracts call"""
+    _calls = []
+    _qualify = replay_ib.qualifyContracts
+
+    def _spy(*contracts):
+        _calls.append([_c.symbol for _c in contracts])
+        return _qualify(*contracts)
+
+    monkeypatch.setattr(replay_ib, "qualifyContracts", _spy)
+    yield _calls
+
+
+@pytest.fixture(scope="module")
+def replay_universe(replay_source):
+    """Universe fixture, offline, with fundamental ratios ticks"""
+    _ib = ReplayIB(
+        replay_source,
+        ticks={
+            _s: {"fundamentalRatios": FundamentalRatios(PEEXCLXOR=20.0 + _i)}
+            for _i, _s in enumerate(replay_source.symbols())
+        },
+    )
+    _universe = Universe(ib=_ib, symbols=DJIA[:5], max_in_flight=4)
+    yield _universe
+    _ib.disconnect()
+
+
+@pytest.fixture(scope="function", params=DJIA[:3])
+def replay_reports(replay_source, request):
+    """raw XML reports by report type, synthetic reports"""
+    yield {_r: replay_source.get(request.param, _r) for _r in default_reports}
+
+
+@pytest.fixture(scope="function")
+def replay_parser(replay_reports):
+    """XMLParser fixture, synthetic reports without IB client"""
+    yield XMLParser(xml_report=XMLReport.from_xml(replay_reports))
+
+
+@pytest.fixture(scope="function", params=DJIA[:3])
+def replay_fundamental_data(replay_ib, request):
+    """FundamentalData fixture, offline"""
+    yield FundamentalData(ib=replay_ib, symbol=request.param)
+
+
+@pytest.fixture(scope="function")
+def collector():
+    """Metrics hook fixture"""
+    _metrics = add_hook(Metrics())
+    yield _metrics
+    remove_hook(_metrics)
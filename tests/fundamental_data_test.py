@@ -16,20 +16,31 @@
 # under the License.
 
 """Test fundamental FundamentalData module"""
+import asyncio
+import time
+
 import pytest
-from ib_async import Dividends, FundamentalRatios, Ticker
+from ib_async import Dividends, FundamentalRatios, Ticker, util
 
-from ib_fundamental.fundamental import FundamentalData
+from ib_fundamental.fundamental import (
+    AsyncFundamentalData,
+    FundamentalData,
+    resolve_reports,
+)
 from ib_fundamental.objects import (
     AnalystForecast,
     CompanyInfo,
     Dividend,
     ForwardYear,
+    IncomeStatement,
     OwnershipCompany,
     OwnershipDetails,
     OwnershipReport,
     RatioSnapshot,
+    StatementSet,
 )
+from ib_fundamental.sources import MemorySource, ReplayIB
+from tests.conftest import DJIA
 
 
 class TestFundamentalData:
@@ -43,7 +54,7 @@ class TestFundamentalData:
         """
         _statement, _class, _period = fundamental_statement
         # assert
-        assert isinstance(_statement, list)
+        assert isinstance(_statement, StatementSet)
         assert len(_statement) > 1
         assert isinstance(_statement[0], _class)
         assert _statement[0].period == _period
@@ -139,3 +150,134 @@ class TestFundamentalData:
         # assert
         assert isinstance(_info, CompanyInfo)
         assert _info.ticker == _fund_data.parser.xml_report.client.symbol
+
+
+class TestAsyncFundamentalData:
+    """Test AsyncFundamentalData class"""
+
+    def test_income_annual(self, async_fundamental_data: AsyncFundamentalData):
+        """Test AsyncFundamentalData statements"""
+        # act
+        _statement = util.run(async_fundamental_data.income_annual())
+        # assert
+        assert isinstance(_statement, StatementSet)
+        assert len(_statement) > 1
+        assert isinstance(_statement[0], IncomeStatement)
+        assert _statement[0].period == "Annual"
+
+    def test_same_as_sync(
+        self, async_fundamental_data: AsyncFundamentalData, tws_client
+    ):
+        """Test AsyncFundamentalData output is the same as FundamentalData"""
+        _fund_data = FundamentalData(
+            symbol=async_fundamental_data.symbol, ib=tws_client
+        )
+        # act
+        _company_info = util.run(async_fundamental_data.company_info())
+        _eps_ttm = util.run(async_fundamental_data.eps_ttm())
+        # assert
+        assert _company_info == _fund_data.company_info
+        assert _eps_ttm == _fund_data.eps_ttm
+
+    def test_fundamental_ratios(self, async_fundamental_data: AsyncFundamentalData):
+        """Test AsyncFundamentalData fundamental ratios"""
+        # act
+        _f_ratios = util.run(async_fundamental_data.fundamental_ratios())
+        # assert
+        assert isinstance(_f_ratios, FundamentalRatios)
+        assert isinstance(async_fundamental_data.ticker, Ticker)
+
+
+class TestAsyncReplay:
+    """Test AsyncFundamentalData on ReplayIB, offline"""
+
+    def test_concurrent_loads(self, replay_source):
+        """Test concurrent loads share one request per report type"""
+        _ib = ReplayIB(replay_source, latency=0.05)
+        _fd = AsyncFundamentalData(ib=_ib, symbol=DJIA[0])
+
+        async def _load():
+            return await asyncio.gather(
+                _fd.income_annual(),
+                _fd.balance_quarter(),
+                _fd.eps_ttm(),
+                _fd.dividend(),
+                _fd.xml_report.load("ReportsFinStatements", "ReportsFinSummary"),
+                _fd.prefetch(["income_annual", "eps_ttm"]),
+            )
+
+        # act
+        _income, _balance, _eps, _dividend, *_ = util.run(_load())
+        _requests = _ib.requests
+        _ = util.run(_fd.cashflow_annual()), util.run(_fd.eps_q())
+        # assert
+        assert _requests == 2
+        assert _ib.requests == 2
+        assert isinstance(_income, StatementSet) and len(_income) > 1
+        assert isinstance(_balance, StatementSet) and len(_balance) > 1
+        assert _eps and _dividend
+
+    def test_load_once(self, replay_ib):
+        """Test reports are requested on first load only"""
+        _fd = AsyncFundamentalData(ib=replay_ib, symbol=DJIA[0])
+        with pytest.raises(ValueError, match="not loaded"):
+            _fd.xml_report.get_report("ReportSnapshot")
+        # act
+        util.run(_fd.xml_report.load("ReportSnapshot"))
+        util.run(_fd.xml_report.load("ReportSnapshot", "RESC"))
+        _ratios = util.run(_fd.ratios())
+        # assert
+        assert replay_ib.requests == 2
+        assert isinstance(_ratios, RatioSnapshot)
+
+
+class TestPrefetch:
+    """Test FundamentalData prefetch, offline"""
+
+    def test_resolve_reports(self):
+        """Test minimal report types for fields"""
+        # act
+        _reports = resolve_reports(["eps_ttm", "dividend", "fundamental_ratios"])
+        # assert
+        assert _reports == ("ReportsFinSummary",)
+        with pytest.raises(ValueError, match="Unknown fields"):
+            resolve_reports(["income"])
+
+    def test_prefetch(self, replay_ib):
+        """Test only prefetched reports are requested"""
+        # act
+        _fd = FundamentalData(
+            ib=replay_ib,
+            symbol=DJIA[0],
+            prefetch={"income_annual", "eps_ttm", "company_info"},
+        )
+        _requests = replay_ib.requests
+        _ = _fd.income_annual, _fd.eps_ttm, _fd.company_info
+        # assert
+        assert _requests == 2
+        assert replay_ib.requests == 2
+
+    def test_prefetch_concurrent(self, replay_source):
+        """Test prefetched reports are requested concurrently"""
+        _ib = ReplayIB(replay_source, latency=0.2)
+        _start = time.perf_counter()
+        # act
+        _ = FundamentalData(
+            ib=_ib, symbol=DJIA[0], prefetch={"income_annual", "eps_ttm", "ratios"}
+        )
+        # assert
+        assert _ib.requests == 3
+        assert time.perf_counter() - _start < 0.5
+
+    def test_prefetch_errors(self, replay_source):
+        """Test missing reports are returned as errors"""
+        _ib = ReplayIB(
+            MemorySource({DJIA[0]: {"RESC": replay_source.get(DJIA[0], "RESC") or ""}})
+        )
+        _fd = FundamentalData(ib=_ib, symbol=DJIA[0])
+        # act
+        _errors = _fd.prefetch(["fy_actuals", "eps_q"])
+        # assert
+        assert list(_errors) == ["ReportsFinSummary"]
+        assert isinstance(_errors["ReportsFinSummary"], ValueError)
+        assert _fd.fy_actuals and _ib.requests == 2
@@ -17,12 +17,22 @@
 
 """Tests for IBClient"""
 
+import asyncio
 import os
+import time
 
 import pytest
-from ib_async import IB, FundamentalRatios
-
-from ib_fundamental.ib_client import IBClient, Stock, Ticker
+from ib_async import IB, FundamentalRatios, util
+
+from ib_fundamental.cache import ContractCache, ContractKey
+from ib_fundamental.ib_client import (
+    IBClient,
+    Stock,
+    Ticker,
+    qualify_contracts,
+    wait_for_tick,
+)
+from ib_fundamental.sources import MemorySource, ReplayIB
 from tests.conftest import DJIA
 
 
@@ -52,6 +62,31 @@ class TestIBClient:
         assert ib_cli.contract.exchange == "SMART"
         assert ib_cli.contract.currency == "USD"
 
+    def test_make_contract_cache(self, tws_client):
+        """test IBClient.make_contract uses contract_cache"""
+        _cache = ContractCache()
+        _first = IBClient(ib=tws_client, symbol=DJIA[0], contract_cache=_cache)
+        # act
+        _cached = _cache.get(ContractKey(DJIA[0], "SMART", "USD"))
+        _second = IBClient(ib=tws_client, symbol=DJIA[0], contract_cache=_cache)
+        # assert
+        assert _cached is not None
+        assert _cached.conId == _first.contract.conId
+        assert _second.contract.conId == _first.contract.conId
+        assert _second.contract.primaryExchange == _first.contract.primaryExchange
+
+    def test_qualify_contracts(self, tws_client):
+        """test bulk qualify_contracts"""
+        _cache = ContractCache()
+        _symbols = [*DJIA[:5], "NOTASYMBOL123"]
+        # act
+        _contracts = qualify_contracts(tws_client, _symbols, cache=_cache)
+        # assert
+        assert [_c.symbol for _c in _contracts[:-1]] == DJIA[:5]
+        assert all(_c.conId for _c in _contracts[:-1])
+        assert _contracts[-1] is None
+        assert _cache.get(ContractKey(DJIA[4], "SMART", "USD")) == _contracts[4]
+
     def test_ratios(self, ib_client):
         """Test FundamentalRatios"""
         # act
@@ -59,6 +94,44 @@ class TestIBClient:
         # assert
         assert isinstance(_ratio, FundamentalRatios)
 
+    def test_ratios_timeout(self, ib_client):
+        """Test IBClient.get_ratios returns before timeout"""
+        # act
+        _start = time.monotonic()
+        _ratio = ib_client.get_ratios(timeout=10)
+        # assert
+        assert isinstance(_ratio, FundamentalRatios)
+        assert time.monotonic() - _start < 10
+
+    def test_wait_for_tick(self):
+        """Test wait_for_tick returns as soon as the tick arrives"""
+        _ticker = Ticker()
+        _ratios = FundamentalRatios()
+
+        async def _tick():
+            await asyncio.sleep(0.05)
+            _ticker.fundamentalRatios = _ratios
+            _ticker.updateEvent.emit(_ticker)
+
+        async def _wait():
+            _task = asyncio.ensure_future(_tick())
+            _value = await wait_for_tick(_ticker, "fundamentalRatios", timeout=5)
+            await _task
+            return _value
+
+        # act
+        _start = time.monotonic()
+        _value = util.run(_wait())
+        # assert
+        assert _value is _ratios
+        assert time.monotonic() - _start < 1
+
+    def test_wait_for_tick_timeout(self):
+        """Test wait_for_tick returns None on timeout"""
+        _value = util.run(wait_for_tick(Ticker(), "dividends", timeout=0.05))
+        # assert
+        assert _value is None
+
     def test_ticker(self, ib_client):
         """Test IBClient.ticker"""
         # arrange
@@ -105,3 +178,76 @@ class TestIBClient:
         )
         # assert
         assert ib_client.is_connected()
+
+
+class TestReplayIBClient:
+    """Tests for IBClient on ReplayIB, offline"""
+
+    def test_make_contract_cache(self, replay_ib, qualify_calls, collector):
+        """test IBClient.make_contract qualifies once with contract_cache"""
+        _cache = ContractCache()
+        _first = IBClient(ib=replay_ib, symbol=DJIA[0], contract_cache=_cache)
+        # act
+        _cached = _cache.get(ContractKey(DJIA[0], "SMART", "USD"))
+        _second = IBClient(ib=replay_ib, symbol=DJIA[0], contract_cache=_cache)
+        # assert
+        assert qualify_calls == [[DJIA[0]]]
+        assert collector.counters["contract_cache.miss"] == 1
+        assert collector.counters["contract_cache.hit"] == 1
+        assert _cached is not None and _cached.conId == _first.contract.conId
+        assert _second.contract.conId == _first.contract.conId
+        assert _second.contract.primaryExchange == _first.contract.primaryExchange
+
+    def test_qualify_contracts(self, replay_ib, qualify_calls, collector):
+        """test bulk qualify_contracts, repeats qualify cache misses only"""
+        _cache = ContractCache()
+        _symbols = [*DJIA[:5], "NOTASYMBOL123"]
+        # act
+        _contracts = qualify_contracts(replay_ib, _symbols, cache=_cache)
+        _again = qualify_contracts(replay_ib, _symbols, cache=_cache)
+        # assert
+        assert [_c.symbol for _c in _contracts[:-1]] == DJIA[:5]
+        assert all(_c.conId for _c in _contracts[:-1])
+        assert _contracts[-1] is None and _again[-1] is None
+        assert _cache.get(ContractKey(DJIA[4], "SMART", "USD")) == _contracts[4]
+        assert [_c.conId for _c in _again[:-1]] == [_c.conId for _c in _contracts[:-1]]
+        assert qualify_calls == [_symbols, ["NOTASYMBOL123"]]
+        assert collector.counters["contract_cache.hit"] == 5
+        assert collector.counters["contract_cache.miss"] == 7
+
+    def test_req_fund_many(self, replay_source):
+        """Test IBClient.ib_req_fund_many returns reports and errors"""
+        _ib = ReplayIB(
+            MemorySource({DJIA[0]: {"RESC": replay_source.get(DJIA[0], "RESC") or ""}})
+        )
+        _client = IBClient(ib=_ib, symbol=DJIA[0])
+        # act
+        _reports = _client.ib_req_fund_many(["RESC", "ReportSnapshot", "RESC"])
+        # assert
+        assert list(_reports) == ["RESC", "ReportSnapshot"]
+        assert _reports["RESC"] == replay_source.get(DJIA[0], "RESC")
+        assert isinstance(_reports["ReportSnapshot"], ValueError)
+        assert _ib.requests == 2
+
+    def test_ratios_timeout(self, replay_ib):
+        """Test IBClient.get_ratios returns None when no tick arrives"""
+        _client = IBClient(ib=replay_ib, symbol=DJIA[0])
+        # act
+        _start = time.monotonic()
+        _ratio = _client.get_ratios(timeout=0.05)
+        # assert
+        assert _ratio is None
+        assert _client.ticker.fundamentalRatios is None
+        assert time.monotonic() - _start < 1
+
+    def test_ratios_tick(self, replay_source):
+        """Test IBClient.get_ratios returns the tick before timeout"""
+        _ratios = FundamentalRatios(PEEXCLXOR=20.0)
+        _ib = ReplayIB(replay_source, ticks={DJIA[0]: {"fundamentalRatios": _ratios}})
+        _client = IBClient(ib=_ib, symbol=DJIA[0])
+        # act
+        _start = time.monotonic()
+        _ratio = _client.get_ratios(timeout=10)
+        # assert
+        assert _ratio is _ratios
+        assert time.monotonic() - _start < 1
@@ -0,0 +1,87 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+
+#   http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""Tests for incremental module, offline"""
+
+from defusedxml.ElementTree import fromstring
+
+from ib_fundamental.incremental import diff_fin_statements, period_digests
+from ib_fundamental.panel import statement_panel
+from ib_fundamental.xml_factory import fin_statements
+from ib_fundamental.xml_parser import build_statement_index
+
+PREVIOUS_REPORT = fin_statements("AAPL", n_annual=6, n_interim=8, seed=1)
+
+
+class TestIncremental:
+    """Tests for ReportsFinStatements deltas"""
+
+    def test_first_refresh(self):
+        """Test every period is added without a previous version"""
+        # act
+        _delta = diff_fin_statements(PREVIOUS_REPORT)
+        # assert
+        assert len(_delta.added) == 14
+        assert not _delta.restated and not _delta.unchanged
+        assert _delta.index == build_statement_index(fromstring(PREVIOUS_REPORT))
+        assert _delta.digests == period_digests(PREVIOUS_REPORT)
+
+    def test_unchanged(self):
+        """Test nothing is parsed for the same report"""
+        # act
+        _delta = diff_fin_statements(PREVIOUS_REPORT, PREVIOUS_REPORT)
+        # assert
+        assert not _delta.changed
+        assert len(_delta.unchanged) == 14
+        assert not _delta.index.items
+
+    def test_added_and_removed(self):
+        """Test new and dropped interim periods"""
+        _new = fin_statements("AAPL", n_annual=6, n_interim=9, seed=1)
+        # act
+        _added = diff_fin_statements(_new, PREVIOUS_REPORT)
+        _removed = diff_fin_statements(PREVIOUS_REPORT, period_digests(_new))
+        # assert
+        assert _added.added == [("quarter", "2022-12-28")]
+        assert len(_added.unchanged) == 14
+        assert [_h["end_date"] for _h in _added.index.periods["quarter"]] == [
+            "2022-12-28"
+        ]
+        assert _removed.removed == [("quarter", "2022-12-28")]
+
+    def test_restated(self):
+        """Test a changed line item restates its period only"""
+        _new = PREVIOUS_REPORT.replace(
+            '<Source Date="2023-11-04">', '<Source Date="2023-11-20">', 1
+        )
+        # act
+        _delta = diff_fin_statements(_new, PREVIOUS_REPORT)
+        # assert
+        assert _delta.restated == [("annual", "2023-09-30")]
+        assert not _delta.added and len(_delta.unchanged) == 13
+        assert _delta.index.periods["annual"][0]["date_10K"] == "2023-11-20"
+
+    def test_statement_panel(self):
+        """Test upsert rows from a delta index"""
+        _new = fin_statements("AAPL", n_annual=6, n_interim=9, seed=1)
+        # act
+        _panel = statement_panel(
+            {"AAPL": diff_fin_statements(_new, PREVIOUS_REPORT).index}
+        )
+        # assert
+        assert set(_panel.end_date.astype(str)) == {"2022-12-28"}
+        assert set(_panel.period_type) == {"quarter"}
@@ -0,0 +1,104 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+
+#   http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""Tests for metrics module, offline"""
+
+import pytest
+
+from ib_fundamental import metrics
+from ib_fundamental.cache import SQLiteReportCache
+from ib_fundamental.fundamental import CompanyFinancials
+from ib_fundamental.metrics import Metrics, add_hook, count, remove_hook, timer
+from tests.conftest import DJIA
+
+
+class TestMetrics:
+    """Tests for instrumentation hooks"""
+
+    def test_disabled(self):
+        """Test nothing is recorded without hooks"""
+        _metrics = Metrics()
+        # act
+        with timer("request"):
+            count("request.bytes", 10)
+        # assert
+        assert not metrics.hooks
+        assert _metrics.summary().empty
+
+    def test_timer_and_counter(self, collector):
+        """Test timers and counters are aggregated"""
+        for _ in range(3):
+            with timer("stage"):
+                count("items", 2)
+        # act
+        _summary = collector.summary()
+        # assert
+        assert collector.timers["stage"].count == 3
+        assert _summary.loc["stage", "kind"] == "timer"
+        assert _summary.loc["items", "total"] == 6
+
+    def test_company_financials(self, collector, replay_ib):
+        """Test request, parse, extract and cache stages"""
+        _cache = SQLiteReportCache(":memory:")
+        for _ in range(2):
+            _ = CompanyFinancials(
+                ib=replay_ib, symbol=DJIA[0], cache=_cache
+            ).income_annual
+        # assert
+        assert collector.timers["request"].count == 1
+        assert collector.timers["xml_parse"].count == 2
+        assert collector.timers["build_statement_frame"].count == 2
+        assert collector.counters["report_cache.miss"] == 1
+        assert collector.counters["report_cache.hit"] == 1
+        assert collector.counters["request.bytes"] == len(
+            replay_ib.source.get(DJIA[0], "ReportsFinStatements")
+        )
+
+    def test_prometheus(self):
+        """Test prometheus export"""
+        prometheus_client = pytest.importorskip("prometheus_client")
+        _registry = prometheus_client.CollectorRegistry()
+        _hook = add_hook(metrics.PrometheusHook(registry=_registry))
+        try:
+            with timer("xml_parse"):
+                count("request.bytes", 10)
+        finally:
+            remove_hook(_hook)
+        # assert
+        assert _registry.get_sample_value("ib_fundamental_request_bytes_total") == 10
+        assert _registry.get_sample_value("ib_fundamental_xml_parse_seconds_count") == 1
+
+    def test_opentelemetry(self):
+        """Test OpenTelemetry export"""
+        sdk_metrics = pytest.importorskip("opentelemetry.sdk.metrics")
+        export = pytest.importorskip("opentelemetry.sdk.metrics.export")
+        _reader = export.InMemoryMetricReader()
+        _provider = sdk_metrics.MeterProvider(metric_readers=[_reader])
+        _hook = add_hook(metrics.OpenTelemetryHook(meter=_provider.get_meter("test")))
+        try:
+            with timer("xml_parse"):
+                count("request.bytes", 10)
+        finally:
+            remove_hook(_hook)
+        # assert
+        _names = {
+            _m.name
+            for _rm in _reader.get_metrics_data().resource_metrics
+            for _sm in _rm.scope_metrics
+            for _m in _sm.metrics
+        }
+        assert _names == {"ib_fundamental.request.bytes", "ib_fundamental.xml_parse"}
@@ -0,0 +1,63 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+
+#   http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""Tests for panel module, offline"""
+
+import pandas as pd
+
+from ib_fundamental.panel import panel_columns, statement_panel, wide_panel
+from ib_fundamental.universe import Universe
+
+
+class TestPanel:
+    """Tests for statement panels"""
+
+    def test_statement_panel(self, replay_universe: Universe):
+        """Test long panel from universe results"""
+        # act
+        _panel = statement_panel(replay_universe.fetch())
+        # assert
+        assert tuple(_panel.columns) == panel_columns
+        assert list(_panel.symbol.cat.categories) == replay_universe.symbols
+        for _col in ("symbol", "statement", "period_type", "coa_code"):
+            assert isinstance(_panel[_col].dtype, pd.CategoricalDtype)
+        assert _panel.value.dtype == "float64"
+
+    def test_statement_panel_fundamental_data(self, replay_fundamental_data):
+        """Test long panel matches FundamentalData statements"""
+        # act
+        _panel = statement_panel(
+            [replay_fundamental_data], statements=["INC"], periods=["annual"]
+        )
+        _income = replay_fundamental_data.income_annual[0]
+        _row = _panel[
+            (_panel.end_date == pd.Timestamp(_income.end_date))
+            & (_panel.coa_code == "RTLR")
+        ]
+        # assert
+        assert set(_panel.statement) == {"INC"}
+        assert _row.value.item() == _income.rtlr
+
+    def test_wide_panel(self, replay_universe: Universe):
+        """Test wide panel pivot"""
+        _panel = statement_panel(replay_universe.fetch())
+        # act
+        _wide = wide_panel(_panel)
+        # assert
+        assert _wide.index.names == ["symbol", "period_type", "end_date"]
+        assert _wide.columns.names == ["statement", "coa_code"]
+        assert _wide.notna().sum().sum() == len(_panel)
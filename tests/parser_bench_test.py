@@ -0,0 +1,121 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+
+#   http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""Tests for parser benchmarks, offline"""
+
+import json
+from dataclasses import asdict
+
+import pytest
+
+from benchmarks import parser_bench
+from benchmarks.parser_bench import (
+    Result,
+    compare,
+    load_corpus,
+    main,
+    run_suite,
+    speed_ratio,
+    synthetic_corpus,
+)
+from ib_fundamental.sources import DirectorySource, record
+
+
+def _result(name: str, seconds: float, peak_kib: float = 100.0) -> Result:
+    return Result(name, "small", seconds, 1 / seconds, 1.0, peak_kib)
+
+
+class TestParserBench:
+    """Tests for the benchmark suite and the regression gate"""
+
+    def test_run_suite(self):
+        """Test one benchmark over the synthetic corpus"""
+        _results = run_suite(synthetic_corpus(), "get_map_items", repeat=1, min_time=0)
+        # assert
+        assert [_r.key for _r in _results] == [
+            "get_map_items[small]",
+            "get_map_items[large]",
+        ]
+        assert all(_r.seconds > 0 and _r.peak_kib > 0 for _r in _results)
+
+    def test_load_corpus(self, replay_source, tmp_path):
+        """Test recorded corpus, one case per symbol"""
+        record(replay_source, DirectorySource(tmp_path), ["MMM", "AAPL"])
+        # act
+        _cases = load_corpus(tmp_path)
+        # assert
+        assert [_c.label for _c in _cases] == ["AAPL", "MMM"]
+        assert len(_cases[0].xml) == 5
+
+    @pytest.mark.parametrize(
+        ("seconds", "peak_kib", "regressions"),
+        [(1.0, 100.0, 0), (2.0, 100.0, 1), (1.0, 400.0, 1), (2.0, 400.0, 2)],
+    )
+    def test_compare(self, seconds, peak_kib, regressions):
+        """Test slower and bigger results are regressions"""
+        _baseline = {_r.key: asdict(_r) for _r in [_result("get_eps", 1.0)]}
+        # act
+        _found = compare([_result("get_eps", seconds, peak_kib)], _baseline)
+        # assert
+        assert len(_found) == regressions
+
+    @pytest.mark.parametrize(("min_delta", "regressions"), [(2e-5, 0), (0.0, 1)])
+    def test_compare_min_delta(self, min_delta, regressions):
+        """Test slowdowns under min_delta seconds are no regressions"""
+        _baseline = {_r.key: asdict(_r) for _r in [_result("get_ratios", 1e-5)]}
+        # act
+        _found = compare(
+            [_result("get_ratios", 2.5e-5)], _baseline, min_delta=min_delta
+        )
+        # assert
+        assert len(_found) == regressions
+
+    def test_speed_ratio(self):
+        """Test a uniformly slower machine is no regression"""
+        _baseline = {_r.key: asdict(_r) for _r in (_result(_n, 1.0) for _n in "abc")}
+        _results = [_result("a", 2.0), _result("b", 2.0), _result("c", 5.0)]
+        # act
+        _scale = speed_ratio(_results, _baseline)
+        # assert
+        assert _scale == 2.0
+        assert compare(_results, _baseline, scale=_scale) == [
+            "c[small]: 5000.000 ms, baseline 2000.000 ms"
+        ]
+
+    @pytest.mark.parametrize(("seconds", "status"), [(1.0, 0), (5.0, 1)])
+    def test_main_measures_again(self, monkeypatch, tmp_path, seconds, status):
+        """Test a flagged benchmark only regresses if it is still slow"""
+        _baseline = tmp_path / "baseline.json"
+        _baseline.write_text(
+            json.dumps({"results": {"get_map_items[small]": asdict(_result("", 1.0))}})
+        )
+        _measured = []
+
+        def _measure(jobs, *_):
+            _measured.append([_bench.name for _bench, _ in jobs])
+            _seconds = 5.0 if len(_measured) == 1 else seconds
+            return [_result("get_map_items", _seconds)]
+
+        monkeypatch.setattr(parser_bench, "measure", _measure)
+        # act
+        _status = main(
+            ["--filter", "get_map_items", "--sizes", "small", "--absolute"]
+            + ["--baseline", str(_baseline)]
+        )
+        # assert
+        assert _status == status
+        assert _measured == [["get_map_items"], ["get_map_items"]]
@@ -0,0 +1,111 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+
+#   http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""Tests for pipeline module"""
+
+import pyarrow as pa
+import pytest
+from pandas import DataFrame
+
+from ib_fundamental import xml_factory
+from ib_fundamental.pipeline import ParsedSymbol, ParsePipeline, parse_reports
+from ib_fundamental.sources import MemorySource, ReplayIB
+from ib_fundamental.store import dataset_names
+from ib_fundamental.universe import Universe
+
+
+@pytest.fixture(scope="module")
+def pipeline():
+    """ParsePipeline fixture"""
+    with ParsePipeline(workers=2) as _pipeline:
+        yield _pipeline
+
+
+class TestParsePipeline:
+    """Tests for ParsePipeline, offline"""
+
+    def test_parse_reports(self, replay_fundamental_data):
+        """Test worker results match FundamentalData"""
+        _reports = {
+            _r: replay_fundamental_data.client.ib_req_fund(_r)
+            for _r in ("ReportsFinSummary", "RESC")
+        }
+        # act
+        _parsed = parse_reports(
+            replay_fundamental_data.symbol, _reports, ["eps", "fy_actuals"]
+        )
+        # assert
+        assert _parsed.ok
+        assert _parsed.datasets["eps"].eps.to_list() == [
+            _e.eps
+            for _e in replay_fundamental_data.eps_ttm + replay_fundamental_data.eps_q
+        ]
+        assert len(_parsed.datasets["fy_actuals"]) == len(
+            replay_fundamental_data.fy_actuals
+        )
+
+    def test_parse_missing_report(self):
+        """Test datasets without report are errors"""
+        # act
+        _parsed = parse_reports("AAPL", {}, ["eps"])
+        # assert
+        assert not _parsed.ok
+        assert "not available" in _parsed.errors["eps"]
+
+    def test_run(self, pipeline: ParsePipeline, replay_universe: Universe):
+        """Test fetch and parse in the process pool"""
+        # act
+        _parsed = pipeline.run(replay_universe)
+        # assert
+        assert list(_parsed) == replay_universe.symbols
+        for _result in _parsed.values():
+            assert isinstance(_result, ParsedSymbol)
+            assert set(_result.datasets) | set(_result.errors) == set(dataset_names)
+            assert all(isinstance(_d, DataFrame) for _d in _result.datasets.values())
+
+    def test_run_arrow(self, pipeline: ParsePipeline, replay_universe: Universe):
+        """Test workers return arrow tables"""
+        _arrow = ParsePipeline(
+            names=["eps", "ratios"], executor=pipeline.executor, arrow=True
+        )
+        # act
+        _parsed = _arrow.run(replay_universe)
+        # assert
+        for _result in _parsed.values():
+            assert _result.ok
+            assert all(isinstance(_t, pa.Table) for _t in _result.datasets.values())
+            assert "eps" in _result.datasets["eps"].column_names
+
+    def test_fetch_errors(self, pipeline: ParsePipeline):
+        """Test reports that were not fetched are ParsedSymbol errors"""
+        _reports = xml_factory.reports("AAPL")
+        del _reports["RESC"]
+        _universe = Universe(
+            ib=ReplayIB(MemorySource({"AAPL": _reports})), symbols=["AAPL"]
+        )
+        # act
+        _parsed = pipeline.run(_universe)["AAPL"]
+        # assert
+        assert not _parsed.ok
+        assert "No response for report RESC" in _parsed.errors["RESC"]
+        assert "fy_actuals" in _parsed.errors
+        assert isinstance(_parsed.datasets["eps"], DataFrame)
+
+    def test_invalid_args(self):
+        """Test ParsePipeline raises ValueError"""
+        with pytest.raises(ValueError, match="Unknown datasets"):
+            ParsePipeline(names=["eps", "balance"])
@@ -0,0 +1,77 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+
+#   http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""Tests for plans module, offline"""
+
+from io import BytesIO
+
+import pytest
+from defusedxml.ElementTree import fromstring, iterparse
+
+from ib_fundamental import xml_factory
+from ib_fundamental.objects import OwnershipDetails
+from ib_fundamental.plans import FieldSpec, Plan, Step, iter_plan, plans, run_plan
+
+RESC_REPORT = xml_factory.resc(n=3)
+
+
+class TestPlans:
+    """Tests for extraction plans"""
+
+    def test_run_plan(self):
+        """Test nested steps share their fields with the rows below"""
+        # act
+        _estimates = run_plan(plans["fy_estimates"], fromstring(RESC_REPORT))
+        # assert
+        assert len(_estimates) == 2 * 3 * 3
+        assert {_e.type for _e in _estimates} == {"Estimate"}
+        assert (_estimates[0].item, _estimates[0].fyear) == ("EPS", 2024)
+        assert [_e.est_type for _e in _estimates[:3]] == ["High", "Low", "Mean"]
+        assert _estimates[-1].value == 8.5
+
+    def test_iter_plan(self):
+        """Test event stream rows match the tree, in document order"""
+        _tree = fromstring(RESC_REPORT)
+        _events = iterparse(BytesIO(RESC_REPORT.encode()), events=("start", "end"))
+        # act
+        _rows = list(iter_plan(_events, plans["fy_estimates"], plans["fy_actuals"]))
+        # assert
+        assert _rows == run_plan(plans["fy_actuals"], _tree) + run_plan(
+            plans["fy_estimates"], _tree
+        )
+
+    def test_missing_source(self):
+        """Test missing sources use the dataclass default, empty ones None"""
+        _xml = (
+            '<ownershipSummary><Owner ownerId="1"><type>1</type><name/>'
+            '<quantity asofDate="2024-03-31">10</quantity></Owner></ownershipSummary>'
+        )
+        # act
+        _owners = run_plan(plans["ownership"], fromstring(_xml))
+        # assert
+        assert len(_owners) == 1
+        assert isinstance(_owner := _owners[0], OwnershipDetails)
+        assert _owner.name is None
+        assert _owner.currency == ""
+        assert _owner.quantity == 10.0
+
+    def test_invalid_plan(self):
+        """Test plans are validated when compiled"""
+        with pytest.raises(ValueError, match="attributes"):
+            Plan("RESC", dict, (Step("a", (FieldSpec("x", "child"),)), Step("b")))
+        with pytest.raises(ValueError, match="converter"):
+            Plan("RESC", dict, (Step("a", (FieldSpec("x", "@x", "decimal"),)),))
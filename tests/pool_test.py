@@ -0,0 +1,82 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+
+#   http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""Tests for pool module, offline"""
+
+import pytest
+
+from ib_fundamental.pool import ConnectionPool, Endpoint
+from ib_fundamental.sources import ReplayIB
+from ib_fundamental.universe import Universe
+from tests.conftest import DJIA
+
+
+@pytest.fixture(scope="function")
+def pool(replay_source):
+    """ConnectionPool fixture, two replayed sessions"""
+    _pool = ConnectionPool.from_client_ids(
+        [1, 2], ib_factory=lambda: ReplayIB(replay_source)
+    )
+    _pool.connect()
+    yield _pool
+    _pool.disconnect()
+
+
+class TestConnectionPool:
+    """Tests for ConnectionPool"""
+
+    def test_connect(self, pool: ConnectionPool):
+        """Test all sessions are connected"""
+        assert pool.is_connected()
+        assert all(_c.is_connected() for _c in pool.connections)
+        assert pool.least_loaded() in pool.connections
+
+    def test_universe(self, pool: ConnectionPool):
+        """Test Universe requests are spread over the pool"""
+        _universe = Universe(ib=pool, symbols=DJIA[:4], reports=["ReportSnapshot"])
+        # act
+        _results = _universe.fetch()
+        # assert
+        assert all(_r.ok for _r in _results.values())
+        assert all(_c.in_flight == 0 for _c in pool.connections)
+        assert all(_c.ib.requests for _c in pool.connections)
+
+    def test_dropped_session(self, pool: ConnectionPool):
+        """Test requests go to the sessions still connected"""
+        pool.connections[0].ib.disconnect()
+        _universe = Universe(ib=pool, symbols=DJIA[:4], reports=["ReportSnapshot"])
+        # act
+        _results = _universe.fetch()
+        # assert
+        assert all(_r.ok for _r in _results.values())
+        assert pool.connections[0].ib.requests == 0
+        assert pool.connections[1].ib.requests == 4
+
+    def test_health_check(self, pool: ConnectionPool):
+        """Test dropped sessions are reconnected"""
+        pool.connections[0].ib.disconnect()
+        # act
+        _connected = pool.run(pool.health_check_async())
+        # assert
+        assert _connected == len(pool.connections)
+
+    def test_invalid_args(self):
+        """Test ConnectionPool raises ValueError"""
+        with pytest.raises(ValueError, match="No endpoints"):
+            ConnectionPool([])
+        with pytest.raises(ValueError, match="Duplicated"):
+            ConnectionPool([Endpoint(client_id=1), Endpoint(client_id=1)])
@@ -0,0 +1,147 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+
+#   http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""Tests for scheduler module"""
+
+import asyncio
+import time
+
+import pytest
+from ib_async import util
+
+from ib_fundamental.ib_client import IBClient, Stock
+from ib_fundamental.scheduler import RequestScheduler
+from ib_fundamental.sources import ReplayIB
+from tests.conftest import DJIA
+
+
+class ReportRequests:
+    """reqFundamentalDataAsync recorder, empty response while fails > 0"""
+
+    # pylint: disable=too-few-public-methods
+    def __init__(self, fails: int = 0, delay: float = 0.01):
+        self.fails = fails
+        self.delay = delay
+        self.requests: list[str] = []
+        self.in_flight = 0
+        self.peak = 0
+
+    async def reqFundamentalDataAsync(self, _contract, report_type):
+        # pylint: disable=invalid-name
+        """record request"""
+        self.requests.append(report_type)
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(self.delay)
+        self.in_flight -= 1
+        if self.fails > 0:
+            self.fails -= 1
+            return ""
+        return "<ReportSnapshot/>"
+
+
+def run_requests(scheduler, ib, reports):
+    """request all reports concurrently"""
+
+    async def _run():
+        return await asyncio.gather(
+            *(scheduler.request(ib, Stock(symbol="AAPL"), _r) for _r in reports),
+            return_exceptions=True,
+        )
+
+    return util.run(_run())
+
+
+class TestRequestScheduler:
+    """Tests for RequestScheduler"""
+
+    def test_max_in_flight(self):
+        """Test concurrent requests are limited"""
+        _ib = ReportRequests()
+        _scheduler = RequestScheduler(rate=None, max_in_flight=3)
+        # act
+        _xml = run_requests(_scheduler, _ib, ["RESC"] * 10)
+        # assert
+        assert _xml == ["<ReportSnapshot/>"] * 10
+        assert _ib.peak == 3
+        assert _scheduler.in_flight == 0
+
+    def test_rate(self):
+        """Test token bucket rate limit"""
+        _ib = ReportRequests(delay=0)
+        _scheduler = RequestScheduler(rate=20, burst=2, max_in_flight=10)
+        # act
+        _start = time.monotonic()
+        run_requests(_scheduler, _ib, ["RESC"] * 6)
+        # assert, two at once and one every 50 ms
+        assert time.monotonic() - _start >= 0.19
+
+    def test_priority(self):
+        """Test waiting requests start by priority class"""
+        _ib = ReportRequests()
+        _scheduler = RequestScheduler(rate=None, max_in_flight=1)
+        # act
+        run_requests(
+            _scheduler, _ib, ["RESC", "ReportsOwnership", "RESC", "ReportSnapshot"]
+        )
+        # assert
+        assert _ib.requests == [
+            "RESC",
+            "ReportSnapshot",
+            "RESC",
+            "ReportsOwnership",
+        ]
+
+    def test_retries(self):
+        """Test empty responses are retried"""
+        _ib = ReportRequests(fails=2)
+        _scheduler = RequestScheduler(rate=None, retries=2, backoff=0.01)
+        # act
+        _xml = run_requests(_scheduler, _ib, ["RESC"])
+        # assert
+        assert _xml == ["<ReportSnapshot/>"]
+        assert len(_ib.requests) == 3
+
+    def test_retries_exhausted(self):
+        """Test ValueError and timeout after all retries"""
+        _scheduler = RequestScheduler(rate=None, retries=1, backoff=0.01)
+        # act
+        (_empty,) = run_requests(_scheduler, ReportRequests(fails=2), ["RESC"])
+        _scheduler.timeout = 0.01
+        (_timeout,) = run_requests(_scheduler, ReportRequests(delay=1), ["RESC"])
+        # assert
+        assert isinstance(_empty, ValueError)
+        assert isinstance(_timeout, asyncio.TimeoutError)
+        assert _scheduler.in_flight == 0
+
+    def test_invalid_args(self):
+        """Test RequestScheduler raises ValueError"""
+        with pytest.raises(ValueError, match="rate"):
+            RequestScheduler(rate=0)
+        with pytest.raises(ValueError, match="max_in_flight"):
+            RequestScheduler(max_in_flight=0)
+
+    def test_ib_client(self, replay_ib: ReplayIB):
+        """Test IBClient requests through the scheduler"""
+        _scheduler = RequestScheduler(rate=1.0)
+        _client = IBClient(ib=replay_ib, symbol=DJIA[0], scheduler=_scheduler)
+        # act
+        _xml = _client.ib_req_fund("ReportSnapshot")
+        # assert
+        assert isinstance(_xml, str)
+        assert _xml
+        assert replay_ib.requests == 1
@@ -0,0 +1,197 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+
+#   http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""Tests for sources module, offline"""
+
+import zipfile
+
+import pytest
+from ib_async import Dividends, FundamentalRatios, Stock
+
+from ib_fundamental.fundamental import (
+    AsyncFundamentalData,
+    CompanyFinancials,
+    FundamentalData,
+)
+from ib_fundamental.objects import IncomeStatement
+from ib_fundamental.sources import (
+    DirectorySource,
+    IBSource,
+    MemorySource,
+    ReplayIB,
+    ReportSource,
+    record,
+)
+from ib_fundamental.universe import Universe
+from tests.conftest import DJIA
+
+
+class TestReportSources:
+    """Tests for MemorySource and DirectorySource"""
+
+    @pytest.mark.parametrize("compress", [False, True])
+    def test_directory_source(self, replay_source, tmp_path, compress):
+        """Test record and read back a directory archive"""
+        _archive = DirectorySource(tmp_path, compress=compress)
+        # act
+        _copied = record(replay_source, _archive, DJIA[:2])
+        # assert
+        assert _copied == 10
+        assert _archive.symbols() == sorted(DJIA[:2])
+        assert _archive.get(DJIA[0], "RESC") == replay_source.get(DJIA[0], "RESC")
+        assert _archive.get(DJIA[0], "CalendarReport") is None
+        assert _archive.get("XXX", "RESC") is None
+
+    def test_zip_source(self, replay_source, tmp_path):
+        """Test read only zip archive"""
+        _path = tmp_path / "reports.zip"
+        with zipfile.ZipFile(_path, "w") as _zip:
+            _zip.writestr(
+                f"{DJIA[0]}/ReportSnapshot.xml",
+                replay_source.get(DJIA[0], "ReportSnapshot"),
+            )
+        _archive = DirectorySource(_path)
+        # assert
+        assert _archive.symbols() == [DJIA[0]]
+        assert _archive.get(DJIA[0], "ReportSnapshot") == replay_source.get(
+            DJIA[0], "ReportSnapshot"
+        )
+        with pytest.raises(ValueError, match="read only"):
+            _archive.put(DJIA[0], "RESC", "<xml/>")
+
+    def test_abstract(self):
+        """Test ReportSource can't be created without get"""
+        with pytest.raises(TypeError, match="abstract"):
+            ReportSource()  # pylint: disable=abstract-class-instantiated
+
+    def test_memory_source(self):
+        """Test memory source put and get"""
+        _source = MemorySource()
+        _source.put("AAPL", "RESC", "<xml/>")
+        # assert
+        assert _source.symbols() == ["AAPL"]
+        assert _source.get("AAPL", "RESC") == "<xml/>"
+        assert _source.get("AAPL", "ReportSnapshot") is None
+
+    def test_ib_source(self, replay_ib, replay_source, monkeypatch):
+        """Test contracts are qualified once per symbol"""
+        _qualified = []
+        _qualify = replay_ib.qualifyContracts
+        monkeypatch.setattr(
+            replay_ib,
+            "qualifyContracts",
+            lambda *_c: _qualified.extend(_c) or _qualify(*_c),
+        )
+        _source = IBSource(replay_ib)
+        # act
+        _copied = record(_source, MemorySource(), [DJIA[0], "XXX"])
+        # assert
+        assert _copied == 5
+        assert [_c.symbol for _c in _qualified] == [DJIA[0], "XXX"]
+        assert _source.get(DJIA[0], "RESC") == replay_source.get(DJIA[0], "RESC")
+
+
+class TestReplayIB:
+    """Tests for ReplayIB"""
+
+    def test_qualify_contracts(self, replay_ib):
+        """Test known symbols are qualified, unknown are None"""
+        _known, _unknown = Stock(DJIA[0], "SMART", "USD"), Stock("XXX", "SMART", "USD")
+        # act
+        _qualified = replay_ib.qualifyContracts(_known, _unknown)
+        # assert
+        assert _qualified == [_known, None]
+        assert _known.conId > 0
+        assert not _unknown.conId
+
+    def test_req_fundamental_data(self, replay_ib, replay_source):
+        """Test reports are served from source, missing reports are empty"""
+        _contract = Stock(DJIA[0], "SMART", "USD")
+        # assert
+        assert replay_ib.reqFundamentalData(
+            _contract, "ReportsFinSummary"
+        ) == replay_source.get(DJIA[0], "ReportsFinSummary")
+        assert replay_ib.reqFundamentalData(_contract, "CalendarReport") == ""
+        assert replay_ib.requests == 2
+
+    def test_disconnect(self, replay_ib):
+        """Test requests fail when disconnected"""
+        replay_ib.disconnect()
+        # assert
+        assert not replay_ib.client.isConnected()
+        with pytest.raises(ConnectionError):
+            replay_ib.reqFundamentalData(Stock(DJIA[0], "SMART", "USD"), "RESC")
+
+    def test_fundamental_data(self, replay_ib):
+        """Test FundamentalData on replayed reports"""
+        _fund = FundamentalData(ib=replay_ib, symbol=DJIA[0])
+        # assert
+        assert _fund.client.contract.conId > 0
+        assert isinstance(_fund.income_annual[0], IncomeStatement)
+        assert len(_fund.eps_ttm) == 12
+        assert _fund.fy_actuals
+
+    def test_company_financials(self, replay_ib):
+        """Test CompanyFinancials on replayed reports"""
+        _fin = CompanyFinancials(ib=replay_ib, symbol=DJIA[1])
+        # assert
+        assert _fin.income_quarter.shape[1] == 8 + 2
+        assert not _fin.eps_ttm.empty
+
+    def test_fundamental_ratios(self, replay_source):
+        """Test ratios and dividend ticks on replayed tickers"""
+        _ratios = FundamentalRatios(PEEXCLXOR=25.0, TTMEPSXCLX=6.4)
+        _dividends = Dividends(0.96, 1.0, None, 0.25)
+        _ib = ReplayIB(
+            replay_source,
+            ticks={DJIA[0]: {"fundamentalRatios": _ratios, "dividends": _dividends}},
+        )
+        _fund = FundamentalData(ib=_ib, symbol=DJIA[0])
+        _fin = CompanyFinancials(ib=_ib, symbol=DJIA[0])
+        # act
+        _frame = _fin.fundamental_ratios
+        # assert
+        assert _fund.fundamental_ratios is _ratios
+        assert _fund.ticker is _ib.ticker(_fund.contract)
+        assert _fund.dividend_summary == _dividends
+        assert _frame.loc["PEEXCLXOR", 0] == 25.0
+
+    def test_no_ticks(self, replay_ib):
+        """Test tickers without ticks time out to None"""
+        _fund = FundamentalData(ib=replay_ib, symbol=DJIA[0])
+        _fund.client.tick_timeout = 0.01
+        # assert
+        assert _fund.fundamental_ratios is None
+        assert _fund.ticker is not None
+        assert replay_ib.ticker(Stock("XXX", "SMART", "USD")) is None
+
+    def test_async_fundamental_data(self, replay_ib):
+        """Test AsyncFundamentalData on replayed reports"""
+        _fund = AsyncFundamentalData(ib=replay_ib, symbol=DJIA[2])
+        # act
+        _actuals = replay_ib.run(_fund.fy_actuals())
+        # assert
+        assert _actuals
+
+    def test_universe(self, replay_ib):
+        """Test Universe fetch on replayed reports"""
+        _universe = Universe(ib=replay_ib, symbols=[*DJIA[:2], "XXX"])
+        # act
+        _results = _universe.fetch()
+        # assert
+        assert all(_results[_s].ok for _s in DJIA[:2])
+        assert not _results["XXX"].reports
@@ -0,0 +1,70 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+
+#   http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""Tests for store module, offline"""
+
+from datetime import date
+
+import pytest
+
+from ib_fundamental.store import FundamentalStore, dataset_names
+
+pytest.importorskip("pyarrow")
+
+
+@pytest.fixture(params=["arrow", "parquet"])
+def store(tmp_path, request):
+    """FundamentalStore fixture"""
+    yield FundamentalStore(tmp_path, format=request.param)
+
+
+class TestFundamentalStore:
+    """Tests for FundamentalStore"""
+
+    def test_write_read(self, store: FundamentalStore, replay_fundamental_data):
+        """Test datasets round trip"""
+        _date = date(2024, 6, 28)
+        # act
+        _paths = store.write(replay_fundamental_data, report_date=_date)
+        # assert
+        assert set(_paths) == set(dataset_names)
+        for _name, _path in _paths.items():
+            assert _path.exists()
+            _table = store.read(_name, symbols=[replay_fundamental_data.symbol])
+            assert _table.num_rows > 0
+            assert set(_table.column("symbol").to_pylist()) == {
+                replay_fundamental_data.symbol
+            }
+            assert set(_table.column("report_date").to_pylist()) == {_date}
+
+    def test_read_eps(self, store: FundamentalStore, replay_fundamental_data):
+        """Test eps dataset values"""
+        store.write(replay_fundamental_data, names=["eps"])
+        # act
+        _eps = store.read("eps", columns=["eps"]).column("eps").to_pylist()
+        # assert
+        assert _eps == [
+            _e.eps
+            for _e in replay_fundamental_data.eps_ttm + replay_fundamental_data.eps_q
+        ]
+
+    def test_invalid_args(self, tmp_path):
+        """Test FundamentalStore raises ValueError"""
+        with pytest.raises(ValueError, match="format"):
+            FundamentalStore(tmp_path, format="csv")
+        with pytest.raises(ValueError, match="not found"):
+            FundamentalStore(tmp_path).read("eps")
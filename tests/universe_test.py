@@ -0,0 +1,74 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+
+#   http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""Tests for universe module, offline"""
+
+import pytest
+from ib_async import FundamentalRatios
+
+from ib_fundamental.ib_client import Stock
+from ib_fundamental.sources import ReplayIB
+from ib_fundamental.universe import SymbolReports, Universe, default_reports
+from tests.conftest import DJIA
+
+
+class TestUniverse:
+    """Tests for Universe class"""
+
+    def test_fetch(self, replay_universe: Universe):
+        """Test Universe.fetch returns all reports for all symbols"""
+        # act
+        _results = replay_universe.fetch()
+        # assert
+        assert list(_results) == replay_universe.symbols
+        for _symbol, _result in _results.items():
+            assert isinstance(_result, SymbolReports)
+            assert isinstance(_result.contract, Stock)
+            assert _result.contract.symbol == _symbol
+            assert set(_result.reports) == set(default_reports)
+            assert _result.ok
+            assert all(isinstance(_xml, str) for _xml in _result.reports.values())
+
+    def test_fundamental_ratios(self, replay_universe: Universe):
+        """Test Universe.fundamental_ratios batch ticks"""
+        # act
+        _ratios = replay_universe.fundamental_ratios(timeout=10)
+        # assert
+        assert list(_ratios) == replay_universe.symbols
+        assert all(isinstance(_r, FundamentalRatios) for _r in _ratios.values())
+        assert _ratios[DJIA[1]].PEEXCLXOR == 21.0
+
+    def test_unknown_symbol(self, replay_ib: ReplayIB):
+        """Test Universe.fetch reports per symbol errors"""
+        _universe = Universe(ib=replay_ib, symbols=[DJIA[0], "NOTASYMBOL123"])
+        # act
+        _results = _universe.fetch()
+        # assert
+        assert _results[DJIA[0]].ok
+        assert _results["NOTASYMBOL123"].contract is None
+        assert not _results["NOTASYMBOL123"].ok
+        assert not _results["NOTASYMBOL123"].reports
+
+    def test_invalid_args(self, replay_ib: ReplayIB):
+        """Test Universe raises ValueError"""
+        with pytest.raises(ValueError, match="No symbols"):
+            Universe(ib=replay_ib, symbols=[])
+        with pytest.raises(ValueError, match="max_in_flight"):
+            Universe(ib=replay_ib, symbols=["AAPL"], max_in_flight=0)
+        replay_ib.disconnect()
+        with pytest.raises(ValueError, match="not connected"):
+            Universe(ib=replay_ib, symbols=["AAPL"])
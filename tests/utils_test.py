@@ -17,10 +17,21 @@
 
 """Tests for ib_fundamental utils"""
 
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
 import pytest
 
 from ib_fundamental import FundamentalData
-from ib_fundamental.utils import to_json
+from ib_fundamental.utils import (
+    build_statement,
+    build_statement_frame,
+    parse_date,
+    parse_timestamp,
+    to_datetime64,
+    to_json,
+)
 
 fund_data_methods = (
     _m
@@ -36,7 +47,6 @@ def fund_method(fundamental_data, request):
     yield fundamental_data, _m
 
 
-#  pylint: disable=too-few-public-methods
 class TestUtils:
     """Tests for utils module"""
 
@@ -46,3 +56,47 @@ class TestUtils:
         _json = to_json(getattr(_fund_data, _method))
         # assert
         assert isinstance(_json, str)
+
+
+class TestStatementFrame:
+    """Tests for the columnar statement builder, offline"""
+
+    @pytest.mark.parametrize("period", ["annual", "quarter"])
+    @pytest.mark.parametrize("statement", ["INC", "BAL", "CAS"])
+    def test_build_statement_frame(self, replay_parser, statement, period):
+        """Test columnar statement builder matches build_statement"""
+        _parser = replay_parser
+        _mapping = _parser.get_map_items(statement)
+        _data = _parser.get_fin_statement(statement, period)
+        # act
+        _frame = build_statement_frame(
+            _parser.get_statement_index(), statement, period, _mapping
+        )
+        # assert
+        assert _frame.equals(build_statement(_data, statement, _mapping))
+
+
+class TestDates:
+    """Tests for date converters, offline"""
+
+    def test_parse_date(self):
+        """Test memoized converters match the uncached ones"""
+        _value = "2023-11-02T20:30:00"
+        # act
+        _date, _timestamp = parse_date(_value), parse_timestamp(_value)
+        # assert
+        assert _date == datetime.fromisoformat(_value)
+        assert _timestamp == pd.to_datetime(_value)
+        assert parse_date(_value) is _date
+        assert parse_timestamp(_value) is _timestamp
+
+    def test_to_datetime64(self):
+        """Test batch conversion of a column"""
+        # act
+        _dates = to_datetime64(iter(["2023-09-30", "2024-03-31T00:00:00"]), "D")
+        # assert
+        assert _dates.dtype == np.dtype("datetime64[D]")
+        assert _dates.tolist() == [
+            datetime(2023, 9, 30).date(),
+            datetime(2024, 3, 31).date(),
+        ]
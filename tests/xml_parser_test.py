@@ -17,20 +17,32 @@
 
 """Test xml_parser module"""
 
+import gc
+import weakref
+
+import numpy as np
 import pytest
 
+from ib_fundamental import xml_factory
+from ib_fundamental.fundamental import CompanyFinancials, FundamentalData
+from ib_fundamental.metrics import Metrics
 from ib_fundamental.objects import (
     AnalystForecast,
     CompanyInfo,
     Dividend,
     ForwardYear,
+    IncomeStatement,
     OwnershipCompany,
     OwnershipDetails,
     OwnershipReport,
     RatioSnapshot,
+    StatementIndex,
     StatementMap,
+    StatementSet,
 )
+from ib_fundamental.sources import MemorySource, ReplayIB
 from ib_fundamental.xml_parser import XMLParser
+from ib_fundamental.xml_report import XMLReport
 
 
 class TestXMLParser:
@@ -43,11 +55,24 @@ class TestXMLParser:
         _parser_statement, _statement, _period = xml_parser_statement
         print(_parser_statement, _statement, _period)
         # assert
-        assert isinstance(_parser_statement, list)
+        assert isinstance(_parser_statement, StatementSet)
         assert len(_parser_statement) > 1
         assert isinstance(_parser_statement[0], _statement)
         assert _parser_statement[0].period == _period
 
+    def test_statement_index(self, xml_parser: XMLParser):
+        """Test XML Parser statement index matches statements"""
+        # act
+        _index = xml_parser.get_statement_index()
+        _income = xml_parser.get_fin_statement("INC", "quarter")
+        # assert
+        assert isinstance(_index, StatementIndex)
+        assert set(_index.periods) == {"annual", "quarter"}
+        assert [_i.end_date for _i in _income] == [
+            _p["end_date"] for _p in _index.periods["quarter"]
+        ]
+        assert xml_parser.get_statement_index() == _index
+
     def test_map_items(self, xml_parser_map_items):
         """Test XML Parser map_items"""
         _map_items, _statement = xml_parser_map_items
@@ -131,3 +156,140 @@ class TestXMLParser:
         # assert
         assert isinstance(_info, CompanyInfo)
         assert _info.ticker == _xml_parser.xml_report.client.symbol
+
+
+class TestMemo:
+    """Test XMLParser per report memo, offline"""
+
+    def test_memoized(self, collector: Metrics):
+        """Test results are memoized per report, whatever the argument style"""
+        _reports = xml_factory.reports("AAPL")
+        _parser = XMLParser(xml_report=XMLReport.from_xml(_reports))
+        # act
+        _eps = _parser.get_eps(report_type="TTM")
+        _other = XMLParser(xml_report=XMLReport.from_xml(_reports))
+        # assert
+        assert _parser.get_eps("TTM") == _parser.get_eps("TTM", None) == _eps
+        assert collector.timers["extract.get_eps"].count == 1
+        assert _other.get_eps(report_type="TTM") == _eps
+        assert collector.timers["extract.get_eps"].count == 2
+
+    def test_detached(self):
+        """Test callers can't modify memoized results"""
+        _source = MemorySource({"AAPL": xml_factory.reports("AAPL")})
+        _fin = CompanyFinancials(ib=ReplayIB(_source), symbol="AAPL")
+        _parser = _fin.data.parser
+        # act
+        _parser.get_eps(report_type="TTM").clear()
+        _parser.get_ownership_report().ownership_details.clear()
+        _parser.get_summary_frame("EPSs").drop(columns="eps", inplace=True)
+        _fin.income_annual.drop(index=0, inplace=True)
+        _index = _parser.get_statement_index()
+        _index.periods["annual"][0].clear()
+        next(iter(_index.items.values())).clear()
+        # assert
+        assert len(_parser.get_eps(report_type="TTM")) == 12
+        assert _parser.get_ownership_report().ownership_details
+        assert "eps" in _parser.get_summary_frame("EPSs")
+        assert 0 in _fin.income_annual.index
+        assert _parser.get_statement_index().periods["annual"][0]
+        assert all(_parser.get_statement_index().items.values())
+        with pytest.raises(ValueError, match="read-only"):
+            _parser.get_fin_statement("INC").values[0, 0] = 0.0
+
+    def test_released(self):
+        """Test parsers and reports are not kept alive after use"""
+        _report = XMLReport.from_xml(xml_factory.reports("AAPL"))
+        _ = XMLParser(xml_report=_report).get_map_items("INC")
+        _ref = weakref.ref(_report)
+        # act
+        del _report
+        gc.collect()
+        # assert
+        assert _ref() is None
+
+    def test_refresh(self):
+        """Test refreshed changed reports are parsed again"""
+        _source = MemorySource({"AAPL": xml_factory.reports("AAPL")})
+        _fd = FundamentalData(ib=ReplayIB(_source), symbol="AAPL")
+        _eps = _fd.eps_ttm
+        _source.put("AAPL", "ReportsFinSummary", xml_factory.fin_summary(seed=99))
+        # act
+        _cached = _fd.eps_ttm
+        _fd.xml_report.refresh("ReportsFinSummary")
+        # assert
+        assert _cached == _eps
+        assert _fd.eps_ttm != _eps
+
+
+class TestSummary:
+    """Test ReportsFinSummary columns, offline"""
+
+    def test_summary_frame(self):
+        """Test section frames are sliced from the section columns"""
+        _parser = XMLParser(xml_report=XMLReport.from_xml(xml_factory.reports("AAPL")))
+        # act
+        _frame = _parser.get_summary_frame("EPSs", report_type="TTM", period="12M")
+        _eps = _parser.get_eps(report_type="TTM", period="12M")
+        # assert
+        assert len(_frame) == len(_eps) == 12
+        assert str(_frame.report_type.dtype) == "category"
+        assert _frame.index.is_monotonic_increasing
+        assert list(_frame.eps) == [
+            _e.eps for _e in sorted(_eps, key=lambda _e: _e.as_of_date)
+        ]
+        assert _parser.get_summary_frame("EPSs", period="9M") is None
+
+
+class TestStatementSet:
+    """Test array backed statements, offline"""
+
+    def test_statements(self):
+        """Test statements match the statement index"""
+        _parser = XMLParser(xml_report=XMLReport.from_xml(xml_factory.reports("AAPL")))
+        _index = _parser.get_statement_index()
+        # act
+        _income = _parser.get_fin_statement("INC", "quarter")
+        # assert
+        assert isinstance(_income, StatementSet)
+        assert not _income.values.flags.writeable
+        assert len(_income) == len(_index.periods["quarter"])
+        assert isinstance(_income[-1], IncomeStatement)
+        assert _income[0].srev == _income.column("srev")[0]
+        assert [_i.end_date for _i in _income[1:3]] == [
+            _p["end_date"] for _p in _index.periods["quarter"][1:3]
+        ]
+        assert _income == list(_income)
+
+    def test_missing_items(self):
+        """Test missing line items are NaN and None on access"""
+        _reports = xml_factory.reports("AAPL")
+        _reports["ReportsFinStatements"] = _reports["ReportsFinStatements"].replace(
+            'coaCode="SREV"', 'coaCode="XXXX"'
+        )
+        _parser = XMLParser(xml_report=XMLReport.from_xml(_reports))
+        # act
+        _income = _parser.get_fin_statement("INC", "annual")
+        # assert
+        assert _income[0].srev is None
+        assert np.isnan(_income.column("srev")).all()
+        assert "xxxx" in _income.codes
+        assert not hasattr(_income[0], "xxxx")
+
+    def test_get_items(self):
+        """Test targeted line items match full statements"""
+        _parser = XMLParser(xml_report=XMLReport.from_xml(xml_factory.reports("AAPL")))
+        # act
+        _items = _parser.get_items(["RTLR", "NINC", "atot", "RTLR"], period="quarter")
+        # assert
+        assert _items.codes == ("rtlr", "ninc", "atot")
+        assert _items.values.shape == (8, 3)
+        assert list(_items.end_date.astype(str)) == list(
+            _parser.get_fin_statement("INC", "quarter").header["end_date"]
+        )
+        assert np.array_equal(
+            _items.column("atot"),
+            _parser.get_fin_statement("BAL", "quarter").column("atot"),
+        )
+        with pytest.raises(ValueError, match="read-only"):
+            _items.values[0, 0] = 0.0
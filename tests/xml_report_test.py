@@ -19,8 +19,11 @@
 
 import pytest
 
+from ib_fundamental.fundamental import CompanyFinancials
 from ib_fundamental.ib_client import IBClient
-from ib_fundamental.xml_report import Element, XMLReport
+from ib_fundamental.xml_factory import resc, snapshot
+from ib_fundamental.xml_report import Element, ReportHistory, XMLReport
+from tests.conftest import DJIA
 
 
 class TestXMLReport:
@@ -48,3 +51,62 @@ class TestXMLReport:
             _ = xml_report.calendar()
         # assert
         assert exc_info.type == ValueError
+
+    def test_from_xml(self):
+        """Test XMLReport.from_xml without IB client"""
+        _xml = snapshot()
+        # act
+        _report = XMLReport.from_xml({"ReportSnapshot": _xml})
+        # assert
+        assert _report.client is None
+        assert isinstance(_report.snapshot, Element)
+        assert _report.snapshot.tag == "ReportSnapshot"
+        with pytest.raises(ValueError, match="not available"):
+            _ = _report.resc
+
+    def test_from_xml_element(self):
+        """Test XMLReport.from_xml reuses parsed reports"""
+        _snapshot = XMLReport.from_xml({"ReportSnapshot": snapshot()}).snapshot
+        # act
+        _report = XMLReport.from_xml({"ReportSnapshot": _snapshot, "RESC": ""})
+        # assert
+        assert _report.snapshot is _snapshot
+        with pytest.raises(ValueError, match="not available"):
+            _ = _report.resc
+
+    def test_history_unchanged(self):
+        """Test an unchanged report is not parsed again"""
+        _history = ReportHistory()
+        _first = XMLReport.from_xml({"RESC": resc()}, _history, "AAPL")
+        _first.memo("RESC")["parsed"] = object()
+        # act
+        _same = XMLReport.from_xml({"RESC": resc()}, _history, "AAPL")
+        _changed = XMLReport.from_xml({"RESC": resc(n=2)}, _history, "AAPL")
+        _other = XMLReport.from_xml({"RESC": resc()}, _history, "MSFT")
+        # assert
+        assert _same.unchanged == {"RESC"}
+        assert _same.resc is _first.resc
+        assert _same.memo("RESC") is _first.memo("RESC")
+        assert not _changed.unchanged and _changed.memo("RESC") == {}
+        assert not _other.unchanged
+        assert len(_history) == 2
+
+    def test_refresh(self, replay_ib):
+        """Test refreshed unchanged reports reuse parsed objects"""
+        _history = ReportHistory()
+        _fd = CompanyFinancials(ib=replay_ib, symbol=DJIA[0], history=_history)
+        _income = _fd.income_annual
+        # act
+        _fd.data.xml_report.refresh()
+        _refreshed = _fd.income_annual
+        _new = CompanyFinancials(ib=replay_ib, symbol=DJIA[0], history=_history)
+        _reused = _new.income_annual
+        # assert
+        assert replay_ib.requests == 3
+        assert _refreshed.equals(_income) and _reused.equals(_income)
+        assert _fd.data.xml_report.unchanged == {"ReportsFinStatements"}
+        _key = ("statement_frame", "INC", "annual")
+        assert (
+            _new.data.xml_report.memo("ReportsFinStatements")[_key]
+            is _fd.data.xml_report.memo("ReportsFinStatements")[_key]
+        )
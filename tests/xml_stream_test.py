@@ -0,0 +1,47 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+
+#   http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""Test xml_stream module, offline"""
+
+from ib_fundamental.xml_parser import XMLParser
+from ib_fundamental.xml_stream import iter_fin_statements, iter_forward_year
+
+
+class TestXMLStream:
+    """Test streaming parser"""
+
+    def test_fin_statements(self, replay_reports, replay_parser: XMLParser):
+        """Test streamed statements are the same as XMLParser statements"""
+        # arrange
+        _xml = replay_reports["ReportsFinStatements"]
+        # act
+        _income = list(iter_fin_statements(_xml, statement="INC", period="annual"))
+        _all = list(iter_fin_statements(_xml))
+        # assert
+        assert _income == replay_parser.get_fin_statement("INC", "annual")
+        assert len(_all) > len(_income)
+
+    def test_forward_year(self, replay_reports, replay_parser: XMLParser):
+        """Test streamed forward year is the same as XMLParser forward year"""
+        # arrange
+        _xml = replay_reports["RESC"]
+        # act
+        _estimates = list(iter_forward_year(_xml, fy_type="Estimate"))
+        _actuals = list(iter_forward_year(_xml.encode(), fy_type="Actual"))
+        # assert
+        assert _estimates == replay_parser.get_fy_estimates()
+        assert _actuals == replay_parser.get_fy_actuals()